@@ -5,11 +5,24 @@
 
 """Command-line tools for demo module."""
 
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
 import click
 from flask import current_app
 from flask.cli import with_appcontext
 from invenio_access.permissions import system_identity
+from invenio_accounts.proxies import current_datastore
 from invenio_communities import current_communities
+from invenio_db import db
+from invenio_oaiserver.proxies import current_oaiserver
+from invenio_oaiserver.utils import serializer
 from invenio_records_resources.proxies import current_service_registry
 from invenio_records_resources.services.custom_fields.errors import (
     CustomFieldsException,
@@ -18,7 +31,8 @@ from invenio_records_resources.services.custom_fields.mappings import Mapping
 from invenio_records_resources.services.custom_fields.validate import (
     validate_custom_fields,
 )
-from invenio_search import current_search_client
+from invenio_records_resources.services.uow import UnitOfWork
+from invenio_search import current_search, current_search_client
 from invenio_search.engine import dsl, search
 from invenio_search.utils import build_alias_name
 
@@ -36,7 +50,22 @@ from .fixtures.tasks import (
     create_demo_record,
     get_authenticated_identity,
 )
+from .oai import anonymous_identity
 from .proxies import current_rdm_records, current_rdm_records_service
+from .secret_links.models import (
+    SUPPORTED_DIGEST_ALGORITHMS,
+    SecretLink,
+    _load_token,
+)
+from .secret_links.serializers import SecretLinkSerializer, TimedSecretLinkSerializer
+from .services.reindex import (
+    REBUILD_INDEX_TARGETS,
+    create_rebuild_index,
+    get_partitions,
+    index_partition,
+    swap_index,
+)
+from .services.tasks import reindex_partition
 from .utils import get_or_create_user
 
 COMMUNITY_OWNER_EMAIL = "community@demo.org"
@@ -272,20 +301,40 @@ def invitation_requests(user_email, n_requests):
 
 
 @rdm_records.command("fixtures")
+@click.option(
+    "--bulk",
+    is_flag=True,
+    default=False,
+    help="Create or update the vocabulary entries in chunks.",
+)
 @with_appcontext
-def create_fixtures():
-    """Create the fixtures required for record creation."""
+def create_fixtures(bulk):
+    """Create the fixtures required for record creation.
+
+    With ``--bulk``, the vocabulary entries are written in chunks of
+    ``RDM_FIXTURES_VOCABULARIES_CHUNK_SIZE`` entries, each in a single
+    transaction, and bulk indexed. This is meant for large vocabularies
+    (e.g. affiliations, names or awards). Vocabularies which already exist
+    are skipped: an interrupted bulk load can be resumed with
+    ``add-to-fixture <vocabulary id> --bulk``.
+    """
     click.secho("Creating required fixtures...", fg="green")
 
-    FixturesEngine(system_identity).run()
+    FixturesEngine(system_identity, bulk=bulk).run()
 
     click.secho("Created required fixtures!", fg="green")
 
 
 @rdm_records.command("add-to-fixture")
 @click.argument("fixture")
+@click.option(
+    "--bulk",
+    is_flag=True,
+    default=False,
+    help="Create or update the vocabulary entries in chunks.",
+)
 @with_appcontext
-def add_to_fixture(fixture):
+def add_to_fixture(fixture, bulk):
     """Add or update new entries to existing fixture.
 
     Takes a argument of a vocabulary
@@ -293,18 +342,230 @@ def add_to_fixture(fixture):
 
     Example:
     pipenv run invenio rdm-records add-to-fixture contributorsroles
+
+    With ``--bulk``, existing entries are updated in place, so the command
+    can be used to resume an interrupted bulk load of a vocabulary.
     """
     click.secho("Adding or updating entries to fixtures...", fg="green")
 
-    FixturesEngine(system_identity).add_to(fixture)
+    FixturesEngine(system_identity, bulk=bulk).add_to(fixture)
 
     click.secho("Sent all entry additions and updates to celery!", fg="green")
 
 
+def _index_partitions(target, progress, pending, workers):
+    """Index the pending partitions of a target, yielding the finished ones.
+
+    Each finished partition is yielded with its numbers of indexed and failed
+    records. Without workers, the partitions are indexed in the current process.
+    Otherwise, they are sent to Celery, with at most ``workers`` of them being
+    indexed at the same time.
+    """
+    partitions, index = progress["partitions"], progress["index"]
+    if not workers:
+        for i in pending:
+            start, end = partitions[i]
+            yield (i, *index_partition(target, start, end, index=index))
+        return
+
+    pending = iter(pending)
+    running = {}
+    while True:
+        for i in islice(pending, workers - len(running)):
+            start, end = partitions[i]
+            running[i] = reindex_partition.delay(target, start, end, index=index)
+        if not running:
+            return
+
+        finished = [i for i, result in running.items() if result.ready()]
+        if not finished:
+            time.sleep(1)
+        for i in finished:
+            yield (i, *running.pop(i).get())
+
+
+def _rebuild_index_partitioned(targets, partition_size, workers, swap, state_file):
+    """Rebuild the indexes by partitions, saving the progress to a state file.
+
+    The state file holds the options of the rebuild, which are required to be
+    the same when resuming it, and the progress of each target. Partitions with
+    records which failed to be indexed are not marked as done, so that they are
+    indexed again when resuming the rebuild, and the index of their target is
+    not replaced until they are.
+    """
+    options = {
+        "targets": list(targets),
+        "partition_size": partition_size,
+        "swap": swap,
+    }
+    state = {"options": options, "progress": {}}
+    if os.path.exists(state_file):
+        with open(state_file) as fp:
+            saved_state = json.load(fp)
+        if saved_state.get("options") != options:
+            raise click.ClickException(
+                f"The rebuild saved in {state_file} was started with other options "
+                f"({saved_state.get('options')}). Run it again with the same "
+                "options, or remove the state file to start a new rebuild."
+            )
+        state = saved_state
+        click.secho(f"Resuming the rebuild saved in {state_file}...", fg="yellow")
+
+    def save_state():
+        with open(f"{state_file}.tmp", "w") as fp:
+            json.dump(state, fp)
+        os.replace(f"{state_file}.tmp", state_file)
+
+    for target in targets:
+        progress = state["progress"].get(target)
+        if progress is None:
+            progress = state["progress"][target] = {
+                "partitions": get_partitions(target, partition_size),
+                "index": create_rebuild_index(target) if swap else None,
+                "done": [],
+                "failed": {},
+                "finished": False,
+            }
+            save_state()
+        elif progress["finished"]:
+            continue
+
+        partitions, done = progress["partitions"], progress["done"]
+        pending = [i for i in range(len(partitions)) if i not in set(done)]
+        click.secho(
+            f"Reindexing {target} ({len(pending)} of {len(partitions)} partitions "
+            "left)...",
+            fg="green",
+        )
+
+        start_time = time.monotonic()
+        indexed = 0
+        failed = progress.setdefault("failed", {})
+        for i, count, errors in _index_partitions(target, progress, pending, workers):
+            if errors:
+                failed[str(i)] = errors
+                click.secho(
+                    f"{target}: {errors} documents of partition {i} failed to be "
+                    "indexed.",
+                    fg="red",
+                )
+            else:
+                done.append(i)
+                failed.pop(str(i), None)
+            indexed += count
+            save_state()
+            elapsed = time.monotonic() - start_time
+            click.echo(
+                f"{target}: {len(done)}/{len(partitions)} partitions, "
+                f"{indexed} documents in {elapsed:.1f}s "
+                f"({indexed / elapsed:.1f} docs/s)"
+            )
+
+        if failed:
+            raise click.ClickException(
+                f"{sum(failed.values())} documents of {len(failed)} partitions of "
+                f"{target} failed to be indexed. Run the rebuild again to retry "
+                "these partitions."
+            )
+
+        if progress["index"]:
+            click.secho(f"Replacing the index of {target}...", fg="green")
+            swap_index(target, progress["index"])
+        progress["finished"] = True
+        save_state()
+
+    os.remove(state_file)
+
+
 @rdm_records.command("rebuild-index")
+@click.option(
+    "--partitioned",
+    is_flag=True,
+    default=False,
+    help="Index the records by partitions, directly into the search engine.",
+)
+@click.option(
+    "-t",
+    "--target",
+    "targets",
+    multiple=True,
+    type=click.Choice(list(REBUILD_INDEX_TARGETS)),
+    help="Index to rebuild by partitions (default: all).",
+)
+@click.option(
+    "-s",
+    "--partition-size",
+    type=int,
+    default=None,
+    help="Number of records per partition.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    type=int,
+    default=0,
+    help="Number of partitions indexed at the same time by Celery workers "
+    "(default: index the partitions in this process).",
+)
+@click.option(
+    "--swap/--no-swap",
+    default=True,
+    help="Rebuild into new indexes replacing the current ones once complete.",
+)
+@click.option(
+    "--state-file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="File to save the progress of a partitioned rebuild to.",
+)
 @with_appcontext
-def rebuild_index():
-    """Reindex all drafts, records and vocabularies."""
+def rebuild_index(partitioned, targets, partition_size, workers, swap, state_file):
+    """Reindex all drafts, records and vocabularies.
+
+    By default, the records are sent to the bulk indexing queue. With
+    ``--partitioned``, the records of each index are split into partitions of
+    ``RDM_REBUILD_INDEX_PARTITION_SIZE`` records, which are indexed directly,
+    optionally in parallel by Celery workers (``--workers``). Unless
+    ``--no-swap`` is given, each index is rebuilt into a new index which
+    replaces the current one once complete; changes made in the meantime are
+    not reflected in the new index, so this is best done while no records
+    are being modified.
+
+    The progress of a partitioned rebuild is saved after each partition. If
+    it gets interrupted, running the command again with the same options
+    resumes it from the last finished partition.
+    """
+    if partitioned:
+        if workers and reindex_partition.app.conf.result_backend in (
+            None,
+            "",
+            "disabled",
+        ):
+            raise click.ClickException(
+                "Indexing the partitions with --workers requires a Celery result "
+                "backend (CELERY_RESULT_BACKEND), to know when they are indexed."
+            )
+        state_file = state_file or os.path.join(
+            current_app.instance_path, "rebuild-index.json"
+        )
+        partition_size = (
+            partition_size or current_app.config["RDM_REBUILD_INDEX_PARTITION_SIZE"]
+        )
+        _rebuild_index_partitioned(
+            targets or list(REBUILD_INDEX_TARGETS),
+            partition_size,
+            workers,
+            swap,
+            state_file,
+        )
+        if not targets:
+            click.secho("Reindexing OAI sets...", fg="green")
+            oaipmh_service = current_rdm_records.oaipmh_server_service
+            oaipmh_service.rebuild_index(identity=system_identity)
+
+        click.secho("Rebuilt the indexes!", fg="green")
+        return
+
     click.secho("Reindexing vocabularies...", fg="green")
     vocab_service = current_service_registry.get("vocabularies")
     vocab_service.rebuild_index(identity=system_identity)
@@ -340,6 +601,32 @@ def rebuild_index():
     click.secho("Reindexed records and vocabularies!", fg="green")
 
 
+@rdm_records.command("update-oai-mapping")
+@with_appcontext
+def update_oai_mapping():
+    """Add the pre-rendered OAI-PMH metadata field to the records' index.
+
+    Indices created before the ``oai_metadata`` field was added to the records'
+    mapping reject the documents holding pre-rendered metadata, as the mapping is
+    strict. The field is added to the existing index in place, without a reindex.
+    """
+    index_name = current_rdm_records_service.config.record_cls.index._name
+    with open(current_search.mappings[index_name]) as fp:
+        properties = json.load(fp)["mappings"]["properties"]
+
+    record_index = dsl.Index(build_alias_name(index_name), using=current_search_client)
+    try:
+        record_index.put_mapping(
+            body={"properties": {"oai_metadata": properties["oai_metadata"]}}
+        )
+    except search.RequestError as e:
+        click.secho("An error occured while updating the mapping.", fg="red")
+        click.secho(e.info["error"]["reason"], fg="red")
+        exit(1)
+
+    click.secho("Updated the mapping of the records' index!", fg="green")
+
+
 # CUSTOM FIELDS
 
 
@@ -443,3 +730,281 @@ def custom_field_exists_in_records(field_name):
         click.secho(f"Field {field_name} exists", fg="green")
     else:
         click.secho(f"Field {field_name} does not exist", fg="red")
+
+
+# BENCHMARKS
+
+
+@rdm_records.group()
+def benchmark():
+    """InvenioRDM benchmark commands."""
+
+
+@benchmark.command("oai")
+@click.option(
+    "-p",
+    "--prefix",
+    "prefixes",
+    type=str,
+    multiple=True,
+    help="An OAI-PMH metadata prefix. If not provided, all prefixes are measured.",
+)
+@click.option(
+    "-n",
+    "--size",
+    default=1000,
+    show_default=True,
+    type=int,
+    help="Number of indexed records to serialize.",
+)
+@with_appcontext
+def benchmark_oai(prefixes, size):
+    """Measure the OAI-PMH serialization throughput per metadata prefix.
+
+    $ invenio rdm-records benchmark oai -p oai_dc -n 1000
+    """
+    prefixes = prefixes or list(current_app.config["OAISERVER_METADATA_FORMATS"])
+    hits = [
+        hit.to_dict()
+        for hit in current_oaiserver.search_cls(
+            index=current_app.config["OAISERVER_RECORD_INDEX"]
+        )[:size]
+        .execute()
+        .hits
+    ]
+    if not hits:
+        click.secho("No indexed records to serialize.", fg="red")
+        return
+
+    with current_app.test_request_context(), anonymous_identity():
+        for prefix in prefixes:
+            record_dumper = serializer(prefix)
+            start = time.perf_counter()
+            for source in hits:
+                record = {"_source": source}
+                pid = current_oaiserver.oaiid_fetcher(source["id"], source)
+                record_dumper(pid, record)
+            elapsed = time.perf_counter() - start
+            click.secho(
+                f"{prefix}: {len(hits)} records in {elapsed:.2f}s "
+                f"({len(hits) / elapsed:.1f} records/s)",
+                fg="green",
+            )
+
+
+@benchmark.command("hits")
+@click.option("-q", "--query", default="", help="Query of the searched records.")
+@click.option(
+    "-n",
+    "--size",
+    default=100,
+    show_default=True,
+    type=int,
+    help="Number of records per search page.",
+)
+@click.option(
+    "-r",
+    "--runs",
+    default=5,
+    show_default=True,
+    type=int,
+    help="Number of times the hits are serialized.",
+)
+@with_appcontext
+def benchmark_hits(query, size, runs):
+    """Measure the serialization of the hits of a search results page.
+
+    The hits are serialized with and without the precompiled link templates.
+
+    $ invenio rdm-records benchmark hits -n 100
+    """
+    enabled = current_app.config.get("RDM_LINKS_TEMPLATES_ENABLED", True)
+    with current_app.test_request_context():
+        result = current_rdm_records_service.search(
+            system_identity, params={"q": query, "size": size}
+        )
+        try:
+            for templates in (False, True):
+                current_app.config["RDM_LINKS_TEMPLATES_ENABLED"] = templates
+                timings = []
+                for _ in range(runs):
+                    start = time.perf_counter()
+                    hits = list(result.hits)
+                    timings.append(time.perf_counter() - start)
+                if not hits:
+                    click.secho("No indexed records to serialize.", fg="red")
+                    return
+                click.secho(
+                    f"link templates {'on' if templates else 'off'}: "
+                    f"{len(hits)} hits in {min(timings) * 1000:.1f}ms "
+                    f"(best of {runs})",
+                    fg="green",
+                )
+        finally:
+            current_app.config["RDM_LINKS_TEMPLATES_ENABLED"] = enabled
+
+
+@benchmark.command("grants")
+@click.argument("record_id")
+@click.option(
+    "-n",
+    "--size",
+    default=1000,
+    show_default=True,
+    type=int,
+    help="Number of user grants in the payload.",
+)
+@click.option(
+    "--notify/--no-notify",
+    default=True,
+    show_default=True,
+    help="Whether the grants request a notification.",
+)
+@with_appcontext
+def benchmark_grants(record_id, size, notify):
+    """Measure the bulk creation of access grants on a record.
+
+    The grants are created for existing users, in a unit of work which is rolled
+    back afterwards, so that the record is left unchanged.
+
+    $ invenio rdm-records benchmark grants <record_id> -n 1000
+    """
+    user_ids = [
+        str(id_)
+        for (id_,) in db.session.query(current_datastore.user_model.id).limit(size)
+    ]
+    if len(user_ids) < size:
+        click.secho(f"Only {len(user_ids)} users available.", fg="yellow")
+
+    payload = {
+        "grants": [
+            {
+                "subject": {"type": "user", "id": user_id},
+                "permission": "view",
+                "notify": notify,
+            }
+            for user_id in user_ids
+        ]
+    }
+
+    access_service = current_rdm_records_service.access
+    with UnitOfWork(db.session) as uow:
+        start = time.perf_counter()
+        access_service.bulk_create_grants(system_identity, record_id, payload, uow=uow)
+        elapsed = time.perf_counter() - start
+        uow.rollback()
+
+    click.secho(
+        f"{len(user_ids)} grants in {elapsed:.2f}s "
+        f"({len(user_ids) / elapsed:.1f} grants/s)",
+        fg="green",
+    )
+
+
+@benchmark.command("tokens")
+@click.option(
+    "-n",
+    "--runs",
+    default=10000,
+    show_default=True,
+    type=int,
+    help="Number of times each token is loaded.",
+)
+@with_appcontext
+def benchmark_tokens(runs):
+    """Measure the loading of secret link tokens.
+
+    The tokens are loaded both with and without the cache of recently loaded
+    tokens, for each supported algorithm and token type.
+
+    $ invenio rdm-records benchmark tokens -n 10000
+    """
+    expires_at = datetime.now(timezone.utc) + timedelta(days=1)
+    for algorithm in SUPPORTED_DIGEST_ALGORITHMS:
+        for serializer in (
+            SecretLinkSerializer(algorithm_name=algorithm),
+            TimedSecretLinkSerializer(expires_at=expires_at, algorithm_name=algorithm),
+        ):
+            token = serializer.create_token(uuid.uuid4())
+            for cached in (False, True):
+                _load_token.cache_clear()
+                start = time.perf_counter()
+                for _ in range(runs):
+                    if not cached:
+                        _load_token.cache_clear()
+                    SecretLink.load_token(token)
+                elapsed = time.perf_counter() - start
+                click.secho(
+                    f"{algorithm} {type(serializer).__name__} "
+                    f"{'cached' if cached else 'uncached'}: "
+                    f"{elapsed / runs * 1e6:.1f}us/token",
+                    fg="green",
+                )
+
+
+_STARTUP_BENCHMARK_SCRIPT = """
+import time
+start = time.perf_counter()
+from werkzeug.utils import import_string
+app = import_string({factory!r})()
+created = time.perf_counter()
+ext = app.extensions["invenio-rdm-records"]
+eager = "records_service" in ext.__dict__
+with app.app_context():
+    # drop the services built while creating the app, to time a first access
+    ext.init_services(app)
+    reset = time.perf_counter()
+    ext.records_service
+print(created - start, time.perf_counter() - reset, int(eager))
+"""
+
+
+@benchmark.command("startup")
+@click.option(
+    "-f",
+    "--factory",
+    default="invenio_app.factory:create_ui",
+    show_default=True,
+    help="Import path of the application factory.",
+)
+@click.option(
+    "-n",
+    "--runs",
+    default=5,
+    show_default=True,
+    type=int,
+    help="Number of fresh processes to measure.",
+)
+def benchmark_startup(factory, runs):
+    """Measure the time to create the application in a fresh process.
+
+    Also measures the time to build the records service on first access. The
+    services already built while creating the application (e.g. by the resources
+    of registered blueprints) are reset before measuring it.
+
+    $ invenio rdm-records benchmark startup -n 5
+    """
+    script = _STARTUP_BENCHMARK_SCRIPT.format(factory=factory)
+    timings = []
+    eager = False
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        *values, built = output.split()[-3:]
+        timings.append([float(t) for t in values])
+        eager = eager or built == "1"
+
+    for label, values in zip(("app", "records service"), zip(*timings)):
+        click.secho(
+            f"{label}: min {min(values):.3f}s, mean {sum(values) / runs:.3f}s",
+            fg="green",
+        )
+    if eager:
+        click.secho(
+            f"The records service is built while creating the app of {factory}.",
+            fg="yellow",
+        )
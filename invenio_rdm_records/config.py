@@ -58,6 +58,13 @@ password from ``users.yaml`` will be used. If that is also absent, a password
 will be generated randomly.
 """
 
+RDM_FIXTURES_VOCABULARIES_CHUNK_SIZE = 1000
+"""Number of vocabulary entries written per transaction when loading in bulk.
+
+Used by ``invenio rdm-records fixtures --bulk``, where the entries of each chunk
+are created or updated together and bulk indexed afterwards.
+"""
+
 RDM_RECORDS_UI_EDIT_URL = "/uploads/<pid_value>"
 """Default UI URL for the edit page of a Bibliographic Record."""
 
@@ -67,6 +74,50 @@ RDM_ARCHIVE_DOWNLOAD_ENABLED = True
 RDM_STATS_EXCLUDE_PREVIEW_FILE_DOWNLOAD_EVENTS = False
 """Exclude file-download stats events whose Referer is the file's own preview page."""
 
+RDM_CITATION_STYLES_PRELOAD = False
+"""Parse the styles in ``RDM_CITATION_STYLES`` when the API application starts.
+
+Parsed citation styles are kept in a process-wide cache either way; preloading
+them avoids paying the parsing cost on the first citation requests, at the cost
+of a slower application startup.
+"""
+
+RDM_STATS_REINDEX_CHUNK_SIZE = 10000
+"""Maximum number of parent records to reindex per stats reindexing chunk."""
+
+RDM_LINKS_TEMPLATES_ENABLED = True
+"""Expand the endpoint links of records and files from precompiled URL templates.
+
+The URL of each endpoint is built once per application, and the links are then
+expanded by substituting the variables, instead of going through the URL map for
+every link of every record.
+"""
+
+RDM_REBUILD_INDEX_PARTITION_SIZE = 10000
+"""Number of records per partition for ``rdm-records rebuild-index --partitioned``.
+
+Each partition is indexed as a single unit of work, e.g. by a Celery task, and the
+progress of the rebuild is saved after each finished partition.
+"""
+
+RDM_INDEXER_PREFETCH_CHUNK_SIZE = 500
+"""Number of bulk indexing queue messages to load and prefetch values for at once.
+
+During bulk indexing, the records of each chunk are loaded with a single query and
+values like the record statistics are fetched in bulk for the whole chunk.
+"""
+
+RDM_VOCABULARY_PROPS_INDEX_MAX_SIZE = 1000
+"""Maximum number of entries of a vocabulary to keep its props in memory.
+
+The props of smaller vocabularies (e.g. resource types, roles, date types), used
+by the serializers, are loaded at once and looked up in memory. Set to ``0`` to
+disable the in-memory index.
+"""
+
+RDM_VOCABULARY_PROPS_INDEX_TTL = 300
+"""Seconds after which the in-memory vocabulary props are reloaded."""
+
 #: Default site URL (used only when not in a context - e.g. like celery tasks).
 THEME_SITEURL = "http://127.0.0.1:5000"
 
@@ -321,6 +372,11 @@ RDM_COMMUNITY_REQUIRED_TO_PUBLISH = False
 """Enforces at least one community per record."""
 RDM_COMMUNITY_INCLUSION_REQUEST_CLS = CommunityInclusion
 """Request type for record inclusion requests."""
+RDM_RECORD_COMMUNITIES_BULK_ADD_CHUNK_SIZE = 1000
+"""Number of records resolved together when adding records to a community in bulk.
+
+The ``bulk_add_to_community`` task also commits the records in chunks of this size.
+"""
 RDM_ALLOW_OWNERS_REMOVE_COMMUNITY_FROM_RECORD = True
 """Allow record owners to remove communities from records.
 
@@ -555,6 +611,24 @@ RDM_OAI_PMH_SEARCH = {
 }
 """OAI-PMH search configuration."""
 
+RDM_OAI_PMH_PRERENDER_FORMATS = []
+"""OAI-PMH metadata prefixes to pre-render when indexing records.
+
+The metadata of public records is rendered for each of these metadata prefixes at
+index time and stored (compressed) in the record's search document, from which the
+OAI-PMH server then serves anonymous harvesters without rendering it again.
+Only the metadata formats of ``invenio_rdm_records.oai`` can be pre-rendered, e.g.
+``["oai_dc", "datacite", "oai_marcxml", "dcat"]``.
+
+The pre-rendered metadata is ignored (and rendered live instead) after changing
+this setting or upgrading the package, until the records are reindexed.
+
+The metadata is stored in the ``oai_metadata`` field of the records' mapping.
+Records indices created before the field was added to the mapping have to be
+updated with ``invenio rdm-records update-oai-mapping`` before enabling this
+setting, as they reject the unknown field.
+"""
+
 #
 # Persistent identifiers configuration
 #
@@ -869,6 +943,9 @@ RDM_COMMUNITY_CONTENT_MODERATION_HANDLERS = [
 RDM_USER_MODERATION_ENABLED = False
 """Flag to enable creation of user moderation requests on specific user actions."""
 
+RDM_USER_MODERATION_BATCH_SIZE = 500
+"""Number of records deleted or restored per transaction when moderating a user."""
+
 RDM_RECORDS_MAX_FILES_COUNT = 100
 """Max amount of files allowed to upload in the deposit form."""
 
@@ -944,6 +1021,39 @@ IIIF_TILES_CONVERTER_PARAMS = {
 }
 """Parameters to be passed to the tiles converter."""
 
+IIIF_TILES_BATCH_SIZE = 100
+"""Number of files of a record to convert per tiles generation batch.
+
+The status of the files' tiles is committed once per batch.
+"""
+
+IIIF_TILES_MAX_WORKERS = 4
+"""Maximum number of files converted in parallel by a tiles generation task."""
+
+#
+# IIIF derivatives cache configuration
+#
+RDM_IIIF_DERIVATIVES_CACHE_CLASS = None
+"""Cache class (or import path) for the IIIF image API derivative images.
+
+Derivatives are cached by the checksum of their original file and the requested
+region, size, rotation, quality and format. Disabled by default; set it to
+``"invenio_rdm_records.services.iiif.cache:LocalDerivativesCache"`` to cache them
+on the local filesystem.
+"""
+
+RDM_IIIF_DERIVATIVES_CACHE_BASE_PATH = "iiif-derivatives/"
+"""Base path of the local IIIF derivatives cache.
+
+Relative paths are resolved against the application instance path.
+"""
+
+RDM_IIIF_DERIVATIVES_CACHE_MAX_SIZE = 1024**3
+"""Maximum size in bytes of the local IIIF derivatives cache.
+
+When exceeded, the least recently used derivatives are evicted.
+"""
+
 RDM_RECORDS_RESTRICTION_GRACE_PERIOD = timedelta(days=30)
 """Grace period for changing record access to restricted."""
 
@@ -953,6 +1063,13 @@ RDM_RECORDS_ALLOW_RESTRICTION_AFTER_GRACE_PERIOD = False
 RDM_RECORDS_REQUIRE_SECRET_LINKS_EXPIRATION = False
 """Whether share access links require an expiration date to be set or not."""
 
+RDM_SECRET_LINKS_CACHE_TTL = 60
+"""Seconds to keep the resolved secret links of a parent record in memory.
+
+The links are keyed by the parent record's revision, so changes to them are
+visible right away. Set to ``0`` to only memoize them per request.
+"""
+
 RDM_RECORDS_CONTAINER_EXTENSIONS = [".zip"]
 """List of file extensions for container files.
 Experimental, this config can later be removed."""
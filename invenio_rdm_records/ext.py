@@ -8,6 +8,8 @@
 
 """DataCite-based data model for Invenio."""
 
+from functools import lru_cache
+from threading import RLock
 from warnings import warn
 
 from flask import Blueprint, current_app, g
@@ -19,6 +21,7 @@ from invenio_collections.services.config import CollectionServiceConfig
 from invenio_collections.services.service import CollectionsService
 from invenio_i18n import lazy_gettext as _
 from invenio_records_resources.resources.files import FileResource
+from werkzeug.local import LocalProxy
 
 from . import config
 from .oaiserver.resources.config import OAIPMHServerResourceConfig
@@ -92,13 +95,38 @@ blueprint = Blueprint(
 
 
 class InvenioRDMRecords(object):
-    """Invenio-RDM-Records extension."""
+    """Invenio-RDM-Records extension.
+
+    The services and resources are built lazily, on first access, so that
+    processes which only need a few of them (e.g. Celery workers) don't pay for
+    building all of them at startup.
+    """
 
     def __init__(self, app=None):
         """Extension initialization."""
+        self._factories = {}
+        self._factories_lock = RLock()
         if app:
             self.init_app(app)
 
+    def _lazy(self, name, factory):
+        """Register an attribute of the extension to be built on first access."""
+        self._factories[name] = factory
+        # drop a previously built value, e.g. when re-initializing the extension
+        self.__dict__.pop(name, None)
+
+    def __getattr__(self, name):
+        """Build lazily initialized attributes on first access."""
+        factories = self.__dict__.get("_factories", {})
+        if name not in factories:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        with self._factories_lock:
+            if name not in self.__dict__:
+                self.__dict__[name] = factories[name]()
+        return self.__dict__[name]
+
     def init_app(self, app):
         """Flask application initialization."""
         self.init_config(app)
@@ -162,137 +190,205 @@ class InvenioRDMRecords(object):
 
     def init_services(self, app):
         """Initialize services."""
-        service_configs = self.service_configs(app)
+        service_configs = lru_cache(maxsize=None)(lambda: self.service_configs(app))
 
         # Services
-        self.records_service = RDMRecordService(
-            service_configs.record,
-            files_service=RDMFileService(service_configs.file),
-            draft_files_service=RDMFileService(service_configs.file_draft),
-            access_service=RecordAccessService(service_configs.record),
-            pids_service=PIDsService(service_configs.record, PIDManager),
-            review_service=ReviewService(service_configs.record),
+        self._lazy(
+            "records_service",
+            lambda: RDMRecordService(
+                service_configs().record,
+                files_service=RDMFileService(service_configs().file),
+                draft_files_service=RDMFileService(service_configs().file_draft),
+                access_service=RecordAccessService(service_configs().record),
+                pids_service=PIDsService(service_configs().record, PIDManager),
+                review_service=ReviewService(service_configs().record),
+            ),
+        )
+        self._lazy(
+            "storage_service",
+            lambda: StorageService(records_service=self.records_service),
         )
-        self.storage_service = StorageService(records_service=self.records_service)
 
-        self.records_media_files_service = RDMRecordService(
-            service_configs.record_with_media_files,
-            files_service=RDMFileService(service_configs.media_file),
-            draft_files_service=RDMFileService(service_configs.media_file_draft),
-            pids_service=PIDsService(service_configs.record, PIDManager),
+        self._lazy(
+            "records_media_files_service",
+            lambda: RDMRecordService(
+                service_configs().record_with_media_files,
+                files_service=RDMFileService(service_configs().media_file),
+                draft_files_service=RDMFileService(service_configs().media_file_draft),
+                pids_service=PIDsService(service_configs().record, PIDManager),
+            ),
         )
 
-        self.iiif_service = IIIFService(
-            records_service=self.records_service, config=None
+        self._lazy(
+            "iiif_service",
+            lambda: IIIFService(records_service=self.records_service, config=None),
         )
 
-        self.record_communities_service = RecordCommunitiesService(
-            config=service_configs.record_communities,
+        self._lazy(
+            "record_communities_service",
+            lambda: RecordCommunitiesService(
+                config=service_configs().record_communities,
+            ),
         )
 
-        self.community_records_service = CommunityRecordsService(
-            config=service_configs.community_records,
+        self._lazy(
+            "community_records_service",
+            lambda: CommunityRecordsService(
+                config=service_configs().community_records,
+            ),
         )
 
-        self.community_inclusion_service = CommunityInclusionService()
-        self.record_requests_service = RecordRequestsService(
-            config=service_configs.record_requests
+        self._lazy("community_inclusion_service", CommunityInclusionService)
+        self._lazy(
+            "record_requests_service",
+            lambda: RecordRequestsService(config=service_configs().record_requests),
         )
 
-        self.oaipmh_server_service = OAIPMHServerService(
-            config=service_configs.oaipmh_server,
+        self._lazy(
+            "oaipmh_server_service",
+            lambda: OAIPMHServerService(
+                config=service_configs().oaipmh_server,
+            ),
         )
 
         # Community collections
-        self.community_collections_service = CollectionsService(
-            config=CollectionServiceConfig.build(app),
-            records_service=self.community_records_service,
+        self._lazy(
+            "community_collections_service",
+            lambda: CollectionsService(
+                config=CollectionServiceConfig.build(app),
+                records_service=self.community_records_service,
+            ),
         )
 
     def init_resource(self, app):
         """Initialize resources."""
-        self.records_resource = RDMRecordResource(
-            service=self.records_service,
-            config=RDMRecordResourceConfig.build(app),
+        self._lazy(
+            "records_resource",
+            lambda: RDMRecordResource(
+                service=self.records_service,
+                config=RDMRecordResourceConfig.build(app),
+            ),
         )
 
         # Record files resource
-        self.record_files_resource = FileResource(
-            service=self.records_service.files,
-            config=RDMRecordFilesResourceConfig.build(app),
+        self._lazy(
+            "record_files_resource",
+            lambda: FileResource(
+                service=self.records_service.files,
+                config=RDMRecordFilesResourceConfig.build(app),
+            ),
         )
 
         # Draft files resource
-        self.draft_files_resource = FileResource(
-            service=self.records_service.draft_files,
-            config=RDMDraftFilesResourceConfig.build(app),
+        self._lazy(
+            "draft_files_resource",
+            lambda: FileResource(
+                service=self.records_service.draft_files,
+                config=RDMDraftFilesResourceConfig.build(app),
+            ),
         )
 
-        self.record_media_files_resource = FileResource(
-            service=self.records_media_files_service.files,
-            config=RDMRecordMediaFilesResourceConfig.build(app),
+        self._lazy(
+            "record_media_files_resource",
+            lambda: FileResource(
+                service=self.records_media_files_service.files,
+                config=RDMRecordMediaFilesResourceConfig.build(app),
+            ),
         )
 
         # Draft files resource
-        self.draft_media_files_resource = FileResource(
-            service=self.records_media_files_service.draft_files,
-            config=RDMDraftMediaFilesResourceConfig.build(app),
+        self._lazy(
+            "draft_media_files_resource",
+            lambda: FileResource(
+                service=self.records_media_files_service.draft_files,
+                config=RDMDraftMediaFilesResourceConfig.build(app),
+            ),
         )
 
         # Parent Records
-        self.parent_record_links_resource = RDMParentRecordLinksResource(
-            service=self.records_service,
-            config=RDMParentRecordLinksResourceConfig.build(app),
+        self._lazy(
+            "parent_record_links_resource",
+            lambda: RDMParentRecordLinksResource(
+                service=self.records_service,
+                config=RDMParentRecordLinksResourceConfig.build(app),
+            ),
         )
 
-        self.parent_grants_resource = RDMParentGrantsResource(
-            service=self.records_service,
-            config=RDMParentGrantsResourceConfig.build(app),
+        self._lazy(
+            "parent_grants_resource",
+            lambda: RDMParentGrantsResource(
+                service=self.records_service,
+                config=RDMParentGrantsResourceConfig.build(app),
+            ),
         )
 
-        self.grant_user_access_resource = RDMGrantsAccessResource(
-            service=self.records_service,
-            config=RDMGrantUserAccessResourceConfig.build(app),
+        self._lazy(
+            "grant_user_access_resource",
+            lambda: RDMGrantsAccessResource(
+                service=self.records_service,
+                config=RDMGrantUserAccessResourceConfig.build(app),
+            ),
         )
 
-        self.grant_group_access_resource = RDMGrantsAccessResource(
-            service=self.records_service,
-            config=RDMGrantGroupAccessResourceConfig.build(app),
+        self._lazy(
+            "grant_group_access_resource",
+            lambda: RDMGrantsAccessResource(
+                service=self.records_service,
+                config=RDMGrantGroupAccessResourceConfig.build(app),
+            ),
         )
 
         # Record's communities
-        self.record_communities_resource = RDMRecordCommunitiesResource(
-            service=self.record_communities_service,
-            config=RDMRecordCommunitiesResourceConfig.build(app),
+        self._lazy(
+            "record_communities_resource",
+            lambda: RDMRecordCommunitiesResource(
+                service=self.record_communities_service,
+                config=RDMRecordCommunitiesResourceConfig.build(app),
+            ),
         )
 
-        self.record_requests_resource = RDMRecordRequestsResource(
-            service=self.record_requests_service,
-            config=RDMRecordRequestsResourceConfig.build(app),
+        self._lazy(
+            "record_requests_resource",
+            lambda: RDMRecordRequestsResource(
+                service=self.record_requests_service,
+                config=RDMRecordRequestsResourceConfig.build(app),
+            ),
         )
 
         # Community's records
-        self.community_records_resource = RDMCommunityRecordsResource(
-            service=self.community_records_service,
-            config=RDMCommunityRecordsResourceConfig.build(app),
+        self._lazy(
+            "community_records_resource",
+            lambda: RDMCommunityRecordsResource(
+                service=self.community_records_service,
+                config=RDMCommunityRecordsResourceConfig.build(app),
+            ),
         )
 
         # OAI-PMH
-        self.oaipmh_server_resource = OAIPMHServerResource(
-            service=self.oaipmh_server_service,
-            config=OAIPMHServerResourceConfig.build(app),
+        self._lazy(
+            "oaipmh_server_resource",
+            lambda: OAIPMHServerResource(
+                service=self.oaipmh_server_service,
+                config=OAIPMHServerResourceConfig.build(app),
+            ),
         )
 
         # IIIF
-        self.iiif_resource = IIIFResource(
-            service=self.iiif_service,
-            config=IIIFResourceConfig.build(app),
+        self._lazy(
+            "iiif_resource",
+            lambda: IIIFResource(
+                service=self.iiif_service,
+                config=IIIFResourceConfig.build(app),
+            ),
         )
 
         # Community collections
-        self.community_collections_resource = CollectionsResource(
-            service=self.community_collections_service,
-            config=RDMCollectionsResourceConfig.build(app),
+        self._lazy(
+            "community_collections_resource",
+            lambda: CollectionsResource(
+                service=self.community_collections_service,
+                config=RDMCollectionsResourceConfig.build(app),
+            ),
         )
 
     def fix_datacite_configs(self, app):
@@ -340,28 +436,69 @@ def api_finalize_app(app):
     NOTE: replace former @record_once decorator
     """
     init(app)
+    init_citation_styles(app)
+
+
+def init_citation_styles(app):
+    """Parse the configured citation styles ahead of their first use."""
+    if not app.config.get("RDM_CITATION_STYLES_PRELOAD"):
+        return
+
+    from citeproc_styles import get_style_filepath
+
+    from .resources.serializers.csl import StringCitationSerializer, get_citation_style
+
+    locale = StringCitationSerializer._default_locale
+    for style, _ in app.config.get("RDM_CITATION_STYLES", []):
+        try:
+            get_citation_style(get_style_filepath(style.lower()), locale)
+        except Exception:
+            app.logger.warning(f"Could not preload CSL style {style}.", exc_info=True)
 
 
 def init(app):
     """Init app."""
     # Register services - cannot be done in extension because
     # Invenio-Records-Resources might not have been initialized.
+    # The services are registered through proxies, so that they are only built
+    # once they are used.
     sregistry = app.extensions["invenio-records-resources"].registry
     ext = app.extensions["invenio-rdm-records"]
-    sregistry.register(ext.records_service, service_id="records")
-    sregistry.register(ext.records_service.files, service_id="files")
-    sregistry.register(ext.records_service.draft_files, service_id="draft-files")
-    sregistry.register(ext.records_media_files_service, service_id="record-media-files")
-    sregistry.register(ext.records_media_files_service.files, service_id="media-files")
+
+    def lazy(getter):
+        return LocalProxy(lambda: getter(ext))
+
+    sregistry.register(lazy(lambda ext: ext.records_service), service_id="records")
+    sregistry.register(lazy(lambda ext: ext.records_service.files), service_id="files")
+    sregistry.register(
+        lazy(lambda ext: ext.records_service.draft_files), service_id="draft-files"
+    )
     sregistry.register(
-        ext.records_media_files_service.draft_files, service_id="draft-media-files"
+        lazy(lambda ext: ext.records_media_files_service),
+        service_id="record-media-files",
     )
-    sregistry.register(ext.oaipmh_server_service, service_id="oaipmh-server")
-    sregistry.register(ext.iiif_service, service_id="rdm-iiif")
     sregistry.register(
-        ext.community_collections_service, service_id="community-collections"
+        lazy(lambda ext: ext.records_media_files_service.files),
+        service_id="media-files",
+    )
+    sregistry.register(
+        lazy(lambda ext: ext.records_media_files_service.draft_files),
+        service_id="draft-media-files",
+    )
+    sregistry.register(
+        lazy(lambda ext: ext.oaipmh_server_service), service_id="oaipmh-server"
+    )
+    sregistry.register(lazy(lambda ext: ext.iiif_service), service_id="rdm-iiif")
+    sregistry.register(
+        lazy(lambda ext: ext.community_collections_service),
+        service_id="community-collections",
     )
     # Register indexers
     iregistry = app.extensions["invenio-indexer"].registry
-    iregistry.register(ext.records_service.indexer, indexer_id="records")
-    iregistry.register(ext.records_service.draft_indexer, indexer_id="records-drafts")
+    iregistry.register(
+        lazy(lambda ext: ext.records_service.indexer), indexer_id="records"
+    )
+    iregistry.register(
+        lazy(lambda ext: ext.records_service.draft_indexer),
+        indexer_id="records-drafts",
+    )
@@ -23,9 +23,13 @@ class FixturesEngine:
     types of data from vocabularies, access control and records.
     """
 
-    def __init__(self, identity):
-        """Initialize the class."""
+    def __init__(self, identity, bulk=False):
+        """Initialize the class.
+
+        :param bulk: load the vocabulary entries in chunks instead of one by one.
+        """
         self._identity = identity
+        self._bulk = bulk
 
     def run(self):
         """Run the fixture loading."""
@@ -38,6 +42,7 @@ class FixturesEngine:
             app_data_folder=app_data_folder,
             pkg_data_folder=data_folder,
             filename="vocabularies.yaml",
+            bulk=self._bulk,
         ).load()
 
         UsersFixture(
@@ -69,6 +74,7 @@ class FixturesEngine:
             app_data_folder=app_data_folder,
             pkg_data_folder=data_folder,
             filename="vocabularies.yaml",
+            bulk=self._bulk,
         ).load(reload=fixture)
 
 
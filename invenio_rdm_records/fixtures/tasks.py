@@ -60,6 +60,28 @@ def create_vocabulary_record(service_str, data):
         service.create(system_identity, data)
 
 
+@shared_task
+def create_vocabulary_records(service_str, entries):
+    """Create or update vocabulary records in bulk.
+
+    All the entries are written in a single transaction and bulk indexed
+    afterwards. Existing entries are updated, so that loading the same entries
+    again is safe.
+    """
+    service = current_service_registry.get(service_str)
+    data = [
+        ((entry["type"], entry["id"]) if "type" in entry else entry.get("id"), entry)
+        for entry in entries
+    ]
+    results = service.create_or_update_many(system_identity, data)
+    for result in results.results:
+        if result.errors or result.exc:
+            current_app.logger.warning(
+                f"could not {result.op_type} fixture {result.record}: "
+                f"{result.errors or result.exc}"
+            )
+
+
 @shared_task
 def create_demo_record(user_id, data, publish=True, create_file=False):
     """Create demo record."""
@@ -10,6 +10,7 @@
 import csv
 import json
 from collections import defaultdict
+from itertools import islice
 from os.path import splitext
 from pathlib import Path
 
@@ -22,7 +23,7 @@ from invenio_vocabularies.records.models import VocabularyScheme, VocabularyType
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import load_only
 
-from .tasks import create_vocabulary_record
+from .tasks import create_vocabulary_record, create_vocabulary_records
 
 
 #
@@ -138,6 +139,7 @@ class PrioritizedVocabulariesFixtures:
         pkg_data_folder=None,
         filename="vocabularies.yaml",
         delay=True,
+        bulk=False,
     ):
         """Constructor.
 
@@ -147,6 +149,7 @@ class PrioritizedVocabulariesFixtures:
                          Defaults to `./data` and really only changeable for
                          tests.
         filename: vocabularies filename to check at each location
+        bulk: create or update the entries in chunks instead of one by one
         """
         self._identity = identity
         # Path("./app_data") assumes app_data is in current working directory
@@ -154,6 +157,7 @@ class PrioritizedVocabulariesFixtures:
         self._pkg_data_folder = pkg_data_folder or Path(__file__).parent / "data"
         self._filename = filename
         self._delay = delay
+        self._bulk = bulk
         self._loaded_vocabularies = set()
 
     def _entry_points(self):
@@ -241,7 +245,9 @@ class PrioritizedVocabulariesFixtures:
 
     def load_vocabularies(self, filepath):
         """Load vocabularies listed in vocabularies file."""
-        fixture = VocabulariesFixture(self._identity, filepath, delay=self._delay)
+        fixture = VocabulariesFixture(
+            self._identity, filepath, delay=self._delay, bulk=self._bulk
+        )
         self._loaded_vocabularies = fixture.load(ignore=self._loaded_vocabularies)
 
 
@@ -252,11 +258,12 @@ class VocabulariesFixture:
     vocabularies file.
     """
 
-    def __init__(self, identity, filepath, delay=True):
+    def __init__(self, identity, filepath, delay=True, bulk=False):
         """Initialize the fixture."""
         self._identity = identity
         self._filepath = filepath
         self._delay = delay
+        self._bulk = bulk
 
     def read(self):
         """Return content of vocabularies file."""
@@ -295,7 +302,11 @@ class VocabulariesFixture:
         ids = set(ignore) if ignore else set()
 
         for id_, entry in self.read():
-            ids.update(entry.load(self._identity, ignore=ids, delay=self._delay))
+            ids.update(
+                entry.load(
+                    self._identity, ignore=ids, delay=self._delay, bulk=self._bulk
+                )
+            )
 
         return ids
 
@@ -339,12 +350,25 @@ class VocabularyEntry:
         """Vocabularies actually loaded."""
         return [self._id]
 
-    def load(self, identity, ignore=None, delay=False):
-        """Template method design pattern for loading entries."""
+    def load(self, identity, ignore=None, delay=False, bulk=False):
+        """Template method design pattern for loading entries.
+
+        In bulk mode, the entries are streamed from the data files and created
+        or updated in chunks, each chunk in a single transaction.
+        """
         ignore = ignore or set()
         self.pre_load(identity, ignore=ignore)
-        for data in self.iterate(ignore=ignore):
-            self.create_record(data, delay=delay)
+        if bulk:
+            chunk_size = current_app.config["RDM_FIXTURES_VOCABULARIES_CHUNK_SIZE"]
+            entries = self.iterate(ignore=ignore)
+            while chunk := list(islice(entries, chunk_size)):
+                self.create_records(chunk, delay=delay)
+                current_app.logger.info(
+                    f"sent {len(chunk)} entries of vocabulary {self._id}"
+                )
+        else:
+            for data in self.iterate(ignore=ignore):
+                self.create_record(data, delay=delay)
         return self.loaded()
 
     def create_record(self, data, delay=False):
@@ -354,6 +378,13 @@ class VocabularyEntry:
         else:  # mostly for tests
             create_vocabulary_record(self.service_str, data)
 
+    def create_records(self, entries, delay=False):
+        """Create or update the records of a chunk of entries."""
+        if delay:
+            create_vocabulary_records.delay(self.service_str, entries)
+        else:  # mostly for tests
+            create_vocabulary_records(self.service_str, entries)
+
 
 class GenericVocabularyEntry(VocabularyEntry):
     """Vocabulary fixture with single data-file."""
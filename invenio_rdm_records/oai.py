@@ -4,9 +4,15 @@
 
 """Invenio-RDM-Records OAI Functionality."""
 
-from datacite import schema45
-from dcxml import simpledc
+import base64
+import zlib
+from contextlib import contextmanager
+from functools import lru_cache, partial, wraps
+
 from flask import current_app, g
+from flask_principal import AnonymousIdentity
+from invenio_access.permissions import any_user
+from invenio_oaiserver.utils import serializer
 from invenio_pidstore.errors import PersistentIdentifierError, PIDDoesNotExistError
 from invenio_pidstore.fetchers import FetchedPID
 from invenio_pidstore.models import PersistentIdentifier
@@ -23,54 +29,189 @@ from .resources.serializers.marcxml import MARCXMLSerializer
 from .services.pids.providers.oai import OAIPIDProvider
 
 
+@lru_cache(maxsize=None)
+def _get_serializer(serializer_cls):
+    """Get the serializer instance shared by the OAI-PMH metadata formats.
+
+    The instances are created on first use, and then reused so that the schemas
+    (and for DCAT, the XSLT) don't get rebuilt for every record of a ListRecords
+    page.
+    """
+    return serializer_cls()
+
+
+@contextmanager
+def anonymous_identity():
+    """Set an anonymous identity as the current identity for the context."""
+    identity = AnonymousIdentity()
+    identity.provides.add(any_user)
+    previous = g.pop("identity", None)
+    g.identity = identity
+    try:
+        yield identity
+    finally:
+        g.pop("identity", None)
+        if previous is not None:
+            g.identity = previous
+
+
+def _is_harvestable(source):
+    """Check if a record source is served by the OAI-PMH server.
+
+    Mirrors the default filter of the ``OAIRecordSearch``.
+    """
+    return (
+        bool(source.get("pids", {}).get("oai", {}).get("identifier"))
+        and source.get("access", {}).get("record") == "public"
+        and not source.get("is_deleted")
+    )
+
+
+PRERENDER_FORMAT_VERSION = 1
+"""Version of the pre-rendered metadata, to bump when the rendering changes."""
+
+
+def _prerender_key():
+    """Get the key of the pre-rendered metadata.
+
+    The key changes with the package version (i.e. the formatters and serializers
+    code), the format version and the configured metadata prefixes, so that
+    metadata pre-rendered differently is not served.
+    """
+    from . import __version__
+
+    prefixes = current_app.config.get("RDM_OAI_PMH_PRERENDER_FORMATS") or []
+    return f"{__version__}:{PRERENDER_FORMAT_VERSION}:{','.join(sorted(prefixes))}"
+
+
+def _formatter_key(formatter):
+    """Get the key of a metadata format formatter in the pre-rendered metadata."""
+    return f"{formatter.__module__}:{formatter.__name__}"
+
+
+def prerender_metadata(source):
+    """Pre-render the configured OAI-PMH metadata formats of a record source.
+
+    Only the formatters decorated with ``prerendered`` and configured without extra
+    arguments can be pre-rendered. The metadata is rendered for anonymous users,
+    and stored as compressed XML together with the key of its rendering.
+
+    :param source: The record source, as indexed in the search engine.
+    :returns: The pre-rendered metadata to store in the source, or ``None``.
+    """
+    prefixes = current_app.config.get("RDM_OAI_PMH_PRERENDER_FORMATS")
+    if not prefixes or not _is_harvestable(source):
+        return None
+
+    formats = {}
+    pid = oaiid_fetcher(None, source)
+    with anonymous_identity():
+        for prefix in prefixes:
+            formatter = serializer(prefix)
+            if isinstance(formatter, partial):
+                if formatter.keywords:
+                    continue
+                formatter = formatter.func
+            if not hasattr(formatter, "__wrapped__"):
+                continue
+
+            try:
+                xml = formatter.__wrapped__(pid, {"_source": source})
+            except Exception:
+                current_app.logger.warning(
+                    f"Failed to pre-render '{prefix}' OAI-PMH metadata.", exc_info=True
+                )
+                continue
+            formats[_formatter_key(formatter)] = base64.b64encode(
+                zlib.compress(etree.tostring(xml))
+            ).decode("ascii")
+
+    if not formats:
+        return None
+    return {"key": _prerender_key(), "formats": formats}
+
+
+def get_prerendered_metadata(source, formatter):
+    """Get the pre-rendered XML of a metadata format from a record source.
+
+    :returns: The XML etree, or ``None`` if the format was not pre-rendered, or
+        was pre-rendered differently (e.g. by another version of the package).
+    """
+    oai_metadata = source.get("oai_metadata")
+    if not oai_metadata or oai_metadata.get("key") != _prerender_key():
+        return None
+
+    xml = oai_metadata["formats"].get(_formatter_key(formatter))
+    if xml is None:
+        return None
+    return etree.fromstring(zlib.decompress(base64.b64decode(xml)))
+
+
+def prerendered(formatter):
+    """Serve an OAI-PMH metadata format from its pre-rendered XML when available.
+
+    The pre-rendered metadata is only served to anonymous users, for whom it was
+    rendered. Otherwise, or if it is stale, the metadata is rendered live.
+    """
+
+    @wraps(formatter)
+    def wrapper(pid, record, **serializer_kwargs):
+        if not serializer_kwargs and g.identity.id is None:
+            xml = get_prerendered_metadata(record["_source"], formatter)
+            if xml is not None:
+                return xml
+        return formatter(pid, record, **serializer_kwargs)
+
+    return wrapper
+
+
+@prerendered
 def dublincore_etree(pid, record, **serializer_kwargs):
     """Get DublinCore XML etree for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
-    # TODO: DublinCoreXMLSerializer should be able to dump an etree directly
-    # instead. See https://github.com/inveniosoftware/flask-resources/issues/117
-    obj = DublinCoreXMLSerializer(**serializer_kwargs).dump_obj(item.to_dict())
-    return simpledc.dump_etree(obj)
+    projection = current_rdm_records_service.oai_projection(
+        g.identity, record["_source"]
+    )
+    serializer = (
+        DublinCoreXMLSerializer(**serializer_kwargs)
+        if serializer_kwargs
+        else _get_serializer(DublinCoreXMLSerializer)
+    )
+    return serializer.dump_etree(projection)
 
 
+@prerendered
 def marcxml_etree(pid, record):
     """OAI MARCXML format for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
-    # TODO: MARCXMLSerializer should directly be able to dump an etree instead
-    # of internally creating an etree, then dump to xml, then parse into an
-    # etree. See https://github.com/inveniosoftware/flask-resources/issues/117
-    return etree.fromstring(
-        MARCXMLSerializer().serialize_object(item.to_dict()).encode(encoding="utf-8")
+    projection = current_rdm_records_service.oai_projection(
+        g.identity, record["_source"]
     )
+    return _get_serializer(MARCXMLSerializer).dump_etree(projection)
 
 
+@prerendered
 def dcat_etree(pid, record):
     """OAI DCAT-AP format for OAI-PMH."""
-    item = current_rdm_records_service.oai_result_item(g.identity, record["_source"])
-    # TODO: Ditto. See https://github.com/inveniosoftware/flask-resources/issues/117
-    return etree.fromstring(
-        DCATSerializer().serialize_object(item.to_dict()).encode(encoding="utf-8")
+    projection = current_rdm_records_service.oai_projection(
+        g.identity, record["_source"]
     )
+    return _get_serializer(DCATSerializer).dump_etree(projection)
 
 
+@prerendered
 def datacite_etree(pid, record):
     """DataCite XML format for OAI-PMH.
 
     It assumes that record is a search result.
     """
-    # TODO: Ditto. See https://github.com/inveniosoftware/flask-resources/issues/117
-    data_dict = DataCite45XMLSerializer().dump_obj(record["_source"])
-    return schema45.dump_etree(data_dict)
+    return _get_serializer(DataCite45XMLSerializer).dump_etree(record["_source"])
 
 
+@prerendered
 def oai_datacite_etree(pid, record):
     """OAI DataCite XML format for OAI-PMH.
 
     It assumes that record is a search result.
     """
-    # TODO: See https://github.com/inveniosoftware/flask-resources/issues/117
-    # This should be made into a serializer similar to the ones above.
-    resource_dict = DataCite45XMLSerializer().dump_obj(record["_source"])
-
     nsmap = {
         None: "http://schema.datacite.org/oai/oai-1.1/",
         "xsi": "http://www.w3.org/2001/XMLSchema-instance",
@@ -90,7 +231,7 @@ def oai_datacite_etree(pid, record):
     payload = etree.SubElement(oai_datacite, "payload")
 
     # dump the record's metadata as usual
-    resource = schema45.dump_etree(resource_dict)
+    resource = _get_serializer(DataCite45XMLSerializer).dump_etree(record["_source"])
     payload.append(resource)
 
     # set up the elements' contents
@@ -38,7 +38,7 @@ class StatisticsDumperExt(SearchDumperExt):
 
         try:
             parent_data = dict_lookup(data, self.keys, parent=True)
-            parent_data[self.key] = Statistics.get_record_stats(
+            parent_data[self.key] = Statistics.get_prefetched_record_stats(
                 recid=recid, parent_recid=parent_recid
             )
         except KeyError as e:
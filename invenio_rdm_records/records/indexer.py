@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Record indexer with per-chunk prefetching for bulk indexing."""
+
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from itertools import islice
+
+from flask import current_app
+from invenio_indexer.api import RecordIndexer
+
+from ..oai import prerender_metadata
+from .stats import Statistics
+from .systemfields import IsVerifiedField
+
+_chunk_records = ContextVar("rdm_records_indexer_chunk_records", default=(None, {}))
+"""Indexer and records loaded for the bulk indexing chunk being processed."""
+
+
+def build_index_action(indexer, record, index=None):
+    """Build the bulk index action of a record with any record indexer.
+
+    :param index: name of the index to write to, instead of the write alias of
+        the record's index.
+    """
+    record_index = indexer.record_to_index(record)
+    arguments = {}
+    body = indexer._prepare_record(record, record_index, arguments)
+
+    action = {
+        "_op_type": "index",
+        "_index": index or indexer._prepare_index(record_index),
+        "_id": str(record.id),
+        "_version": record.revision_id,
+        "_version_type": indexer._version_type,
+        "_source": body,
+    }
+    action.update(arguments)
+    return action
+
+
+class RDMRecordIndexer(RecordIndexer):
+    """Record indexer that prefetches expensive dump values per bulk chunk.
+
+    When processing the bulk indexing queue, the messages are consumed in chunks.
+    The records of each chunk are loaded with a single database query, and values
+    which would otherwise be computed one by one while dumping each record (e.g.
+    the record statistics, the existence of their drafts or the verification of
+    their owners) are fetched in bulk for the whole chunk.
+
+    If configured, the OAI-PMH metadata formats of the records are pre-rendered
+    and stored in their search documents.
+    """
+
+    def _chunk_size(self):
+        """Get the number of queue messages to process together."""
+        return current_app.config.get("RDM_INDEXER_PREFETCH_CHUNK_SIZE", 500)
+
+    @contextmanager
+    def prefetch(self, records):
+        """Prefetch the values needed for dumping the given records."""
+        with ExitStack() as stack:
+            stack.enter_context(
+                IsVerifiedField.prefetch(
+                    r.parent.access.owner.owner_id for r in records if r.parent
+                )
+            )
+            published = [r for r in records if not r.is_draft]
+            if published:
+                type(published[0]).has_draft.prefetch(published)
+                stack.enter_context(
+                    Statistics.prefetch(
+                        (r.pid.pid_value, r.parent.pid.pid_value) for r in published
+                    )
+                )
+            yield
+
+    def _load_chunk(self, messages):
+        """Load the records to be indexed for a chunk of queue messages."""
+        ids = [
+            payload["id"]
+            for payload in (message.decode() for message in messages)
+            if payload["op"] != "delete"
+        ]
+        if not ids:
+            return {}
+
+        return {str(r.id): r for r in self.record_cls.get_records(ids)}
+
+    @contextmanager
+    def _prefetched_chunk(self, messages):
+        """Load and prefetch the records of a chunk for the context."""
+        with ExitStack() as stack:
+            records = {}
+            try:
+                records = self._load_chunk(messages)
+                stack.enter_context(self.prefetch(list(records.values())))
+            except Exception:
+                # don't let a failed prefetch block the indexing, the values
+                # will be computed for each record individually instead
+                current_app.logger.warning(
+                    "Failed to prefetch bulk indexing chunk.", exc_info=True
+                )
+
+            token = _chunk_records.set((self, records))
+            try:
+                yield
+            finally:
+                _chunk_records.reset(token)
+
+    def _prepare_record(self, record, index, arguments=None, **kwargs):
+        """Prepare record data for indexing, with its pre-rendered OAI-PMH metadata."""
+        data = super()._prepare_record(record, index, arguments, **kwargs)
+        oai_metadata = prerender_metadata(data)
+        if oai_metadata:
+            data["oai_metadata"] = oai_metadata
+        return data
+
+    def _actionsiter(self, message_iterator):
+        """Iterate bulk actions, chunk by chunk."""
+        chunk_size = self._chunk_size()
+        while chunk := list(islice(message_iterator, chunk_size)):
+            with self._prefetched_chunk(chunk):
+                yield from super()._actionsiter(iter(chunk))
+
+    def index_action(self, record, index=None):
+        """Build the bulk index action of a record."""
+        return build_index_action(self, record, index=index)
+
+    def _index_action(self, payload):
+        """Bulk index action, using the record loaded with its chunk if present."""
+        indexer, records = _chunk_records.get()
+        record = records.get(payload["id"]) if indexer is self else None
+        if record is None:
+            record = self.record_cls.get_record(payload["id"])
+        return self.index_action(record)
@@ -11,7 +11,10 @@ from invenio_records_resources.services.uow import TaskOp
 
 from invenio_rdm_records.records.processors.base import RecordFilesProcessor
 from invenio_rdm_records.services.iiif.storage import tiles_storage
-from invenio_rdm_records.services.iiif.tasks import cleanup_tiles_file, generate_tiles
+from invenio_rdm_records.services.iiif.tasks import (
+    cleanup_tiles_file,
+    generate_record_tiles,
+)
 
 
 class TilesProcessor(RecordFilesProcessor):
@@ -84,9 +87,12 @@ class TilesProcessor(RecordFilesProcessor):
                     )
 
     def _process_file(self, file_record, draft, record, file_type, uow=None):
-        """Process a file record to kickoff pyramidal tiff generation."""
+        """Process a file record to kickoff pyramidal tiff generation.
+
+        :returns: ``True`` if the tiles generation of the file should be queued.
+        """
         if not self._can_process_file(file_record, draft, record):
-            return
+            return False
 
         status_file = record.media_files.get(f"{file_record.key}.ptif")
         if status_file:
@@ -94,7 +100,7 @@ class TilesProcessor(RecordFilesProcessor):
                 file_record.file.id
             )
             if status_file.processor["status"] == "finished" and not has_file_changed:
-                return
+                return False
 
         try:
             with db.session.begin_nested():
@@ -125,14 +131,7 @@ class TilesProcessor(RecordFilesProcessor):
                 status_file.access.hidden = True
                 status_file.commit()
                 record.media_files.commit(f"{file_record.key}.ptif")
-            uow.register(
-                TaskOp(
-                    generate_tiles,
-                    record_id=record["id"],
-                    file_key=file_record.key,
-                    file_type=file_type,
-                )
-            )
+            return True
         except Exception:
             # Nested transaction for current file is rolled back
             current_app.logger.exception(
@@ -142,6 +141,7 @@ class TilesProcessor(RecordFilesProcessor):
                     "file_key": file_record.key,
                 },
             )
+            return False
 
     def _process(self, draft, record, uow):
         """Process the whole record to generate pyramidal tifs for valid files."""
@@ -170,10 +170,20 @@ class TilesProcessor(RecordFilesProcessor):
             record_files = list(record.files.values())
             record_media_files = list(record.media_files.values())
 
-            for file_record in record_files:
-                self._process_file(file_record, draft, record, "files", uow)
-            for file_record in record_media_files:
-                self._process_file(file_record, draft, record, "media_files", uow)
+            # Generate the tiles of all the files in a single task
+            files = [
+                (file_record.key, file_type)
+                for file_type, file_records in (
+                    ("files", record_files),
+                    ("media_files", record_media_files),
+                )
+                for file_record in file_records
+                if self._process_file(file_record, draft, record, file_type, uow)
+            ]
+            if files:
+                uow.register(
+                    TaskOp(generate_record_tiles, record_id=record["id"], files=files)
+                )
 
         if not len(record.media_files.entries):
             record.media_files.enabled = False
@@ -7,13 +7,23 @@ In contrast to the very liberal defaults provided by Invenio-Stats, these permis
 factories deny access unless otherwise specified.
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from flask import current_app
+from invenio_search.engine import dsl
 from invenio_stats.proxies import current_stats
 
+_prefetched_stats = ContextVar("rdm_records_prefetched_stats", default=None)
+"""Statistics fetched in bulk for the records of the current indexing chunk."""
+
 
 class Statistics:
     """Statistics API class."""
 
+    views_fallback = {"views": 0, "unique_views": 0}
+    downloads_fallback = {"downloads": 0, "unique_downloads": 0, "data_volume": 0}
+
     @classmethod
     def _get_query(cls, query_name):
         """Build the statistics query from configuration."""
@@ -33,11 +43,7 @@ class Statistics:
             # when the aggregation search index hasn't been created yet
             current_app.logger.warning(e)
 
-            fallback_result = {
-                "views": 0,
-                "unique_views": 0,
-            }
-            views = views_all = downloads = downloads_all = fallback_result
+            views = views_all = cls.views_fallback
 
         try:
             downloads = cls._get_query("record-download").run(recid=recid)
@@ -49,13 +55,13 @@ class Statistics:
             # because they are a separate index that can fail independently
             current_app.logger.warning(e)
 
-            fallback_result = {
-                "downloads": 0,
-                "unique_downloads": 0,
-                "data_volume": 0,
-            }
-            downloads = downloads_all = fallback_result
+            downloads = downloads_all = cls.downloads_fallback
+
+        return cls._build_stats(views, views_all, downloads, downloads_all)
 
+    @classmethod
+    def _build_stats(cls, views, views_all, downloads, downloads_all):
+        """Build the statistics dictionary from the query results."""
         stats = {
             "this_version": {
                 "views": views["views"],
@@ -74,3 +80,98 @@ class Statistics:
         }
 
         return stats
+
+    @classmethod
+    def get_records_stats(cls, records):
+        """Fetch the statistics for several records with a single multi-search.
+
+        :param records: Iterable of ``(recid, parent_recid)`` tuples.
+        :returns: Dictionary mapping each ``recid`` to its statistics.
+        """
+        records = list(records)
+        if not records:
+            return {}
+
+        recids = list(dict.fromkeys(recid for recid, _ in records))
+        parent_recids = list(dict.fromkeys(parent for _, parent in records))
+        searches = [
+            ("record-view", "recid", recids, cls.views_fallback),
+            ("record-download", "recid", recids, cls.downloads_fallback),
+            (
+                "record-view-all-versions",
+                "parent_recid",
+                parent_recids,
+                cls.views_fallback,
+            ),
+            (
+                "record-download-all-versions",
+                "parent_recid",
+                parent_recids,
+                cls.downloads_fallback,
+            ),
+        ]
+
+        try:
+            queries = {name: cls._get_query(name) for name, *_ in searches}
+            multi_search = dsl.MultiSearch(using=queries["record-view"].client)
+            for name, param, values, _ in searches:
+                for value in values:
+                    multi_search = multi_search.add(
+                        queries[name].build_query(None, None, **{param: value})
+                    )
+            responses = iter(multi_search.execute(raise_on_error=False))
+        except Exception as e:
+            # fall back to the (individually fault-tolerant) per-record queries
+            current_app.logger.warning(e)
+            return {
+                recid: cls.get_record_stats(recid=recid, parent_recid=parent_recid)
+                for recid, parent_recid in records
+            }
+
+        # the multi-search responses come back in the order the searches were added
+        # note: failed searches (e.g. missing aggregation index) are returned as None
+        results = {}
+        for name, _, values, fallback in searches:
+            for value in values:
+                response = next(responses)
+                results[name, value] = (
+                    queries[name].process_query_result(response.to_dict(), None, None)
+                    if response is not None
+                    else fallback
+                )
+
+        return {
+            recid: cls._build_stats(
+                results["record-view", recid],
+                results["record-view-all-versions", parent_recid],
+                results["record-download", recid],
+                results["record-download-all-versions", parent_recid],
+            )
+            for recid, parent_recid in records
+        }
+
+    @classmethod
+    @contextmanager
+    def prefetch(cls, records):
+        """Fetch the statistics of the given records in bulk for the context.
+
+        Inside of the context, ``get_prefetched_record_stats()`` serves the
+        statistics from the prefetched results instead of querying the search
+        engine for each record.
+
+        :param records: Iterable of ``(recid, parent_recid)`` tuples.
+        """
+        token = _prefetched_stats.set(cls.get_records_stats(records))
+        try:
+            yield
+        finally:
+            _prefetched_stats.reset(token)
+
+    @classmethod
+    def get_prefetched_record_stats(cls, recid, parent_recid):
+        """Get the prefetched statistics for the record, or fetch them if missing."""
+        prefetched = _prefetched_stats.get() or {}
+        if recid in prefetched:
+            return prefetched[recid]
+
+        return cls.get_record_stats(recid=recid, parent_recid=parent_recid)
@@ -4,9 +4,69 @@
 
 """Links class for the access system field."""
 
+import time
+from datetime import datetime, timezone
+
+from flask import current_app, g, has_app_context
 from invenio_db import db
 
 from ....secret_links.models import SecretLink
+from ....secret_links.permissions import LinkNeed
+
+
+class ResolvedLinksCache:
+    """Cache of the resolved secret links of parent records.
+
+    The resolved links are memoized for the current application context (i.e.
+    the request), and kept for ``RDM_SECRET_LINKS_CACHE_TTL`` seconds across
+    requests. They are keyed by the parent record's ID and revision, so that any
+    change to the parent's links (which commits the parent) uses a new entry.
+    """
+
+    max_size = 10000
+
+    def __init__(self):
+        """Constructor."""
+        self._entries = {}
+
+    def _request_cache(self):
+        """Get the cache of the current application context, if any."""
+        if not has_app_context():
+            return None
+        return g.setdefault("_rdm_resolved_secret_links", {})
+
+    def get(self, key):
+        """Get the resolved links for the key, if cached."""
+        request_cache = self._request_cache()
+        if request_cache is not None and key in request_cache:
+            return request_cache[key]
+
+        expires, value = self._entries.get(key, (None, None))
+        if expires is None or expires < time.monotonic():
+            return None
+        if request_cache is not None:
+            request_cache[key] = value
+        return value
+
+    def set(self, key, value):
+        """Cache the resolved links for the key."""
+        request_cache = self._request_cache()
+        if request_cache is not None:
+            request_cache[key] = value
+
+        ttl = current_app.config.get("RDM_SECRET_LINKS_CACHE_TTL", 0)
+        if ttl:
+            if len(self._entries) >= self.max_size:
+                # drop the oldest entry
+                self._entries.pop(next(iter(self._entries)), None)
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self):
+        """Clear the cache across requests."""
+        self._entries.clear()
+
+
+resolved_links_cache = ResolvedLinksCache()
 
 
 class Link:
@@ -121,20 +181,38 @@ class Links(list):
     def resolve_all(self):
         """Resolve all available links in this list and return them.
 
-        Note: This will perform database queries!
+        Note: This will perform a database query for the unresolved links!
         """
-        resolved_links = (link.resolve() for link in self)
-        return [link for link in resolved_links if link is not None]
+        unresolved = {link.link_id: link for link in self if link._entity is None}
+        if unresolved:
+            entities = SecretLink.query.filter(
+                SecretLink.id.in_(list(unresolved))
+            ).all()
+            for entity in entities:
+                unresolved[str(entity.id)]._entity = entity
+
+        return [link._entity for link in self if link._entity is not None]
 
-    def needs(self, permission):
+    def needs(self, permission, cache_key=None):
         """Get allowed needs for the given permission level.
 
-        Note: This will perform database queries!
+        Note: This will perform database queries, unless the links are cached for
+        the given ``cache_key`` (e.g. the parent record's ID and revision)!
         """
+        resolved = resolved_links_cache.get(cache_key) if cache_key else None
+        if resolved is None:
+            resolved = [
+                (str(link.id), link.permission_level, link.expires_at)
+                for link in self.resolve_all()
+            ]
+            if cache_key:
+                resolved_links_cache.set(cache_key, resolved)
+
+        now = datetime.now(timezone.utc)
         return [
-            link.need
-            for link in self.resolve_all()
-            if not link.is_expired and link.permission_level == permission
+            LinkNeed(link_id)
+            for link_id, permission_level, expires_at in resolved
+            if permission_level == permission and not (expires_at and now > expires_at)
         ]
 
     def dump(self):
@@ -7,6 +7,7 @@ The HasDraftCheckField is used to check if an associated draft exists for a
 a record.
 """
 
+from invenio_db import db
 from invenio_records.dictutils import dict_set
 from invenio_records.systemfields import SystemField
 from sqlalchemy.orm.exc import NoResultFound
@@ -40,11 +41,45 @@ class HasDraftCheckField(SystemField):
         if self.draft_cls is None:
             return False
 
-        try:
-            self.draft_cls.get_record(record.id)
-            return True
-        except NoResultFound:
-            return False
+        has_draft = self._get_cache(record)
+        if has_draft is None:
+            try:
+                self.draft_cls.get_record(record.id)
+                has_draft = True
+            except NoResultFound:
+                has_draft = False
+            if record.id is not None:
+                self._set_cache(record, has_draft)
+        return has_draft
+
+    def prefetch(self, records):
+        """Check if drafts exist for several records at once.
+
+        The drafts are looked up with a single query, and the result is cached
+        on each record instance.
+
+        .. code-block:: python
+
+            RDMRecord.has_draft.prefetch(records)
+        """
+        if self.draft_cls is None:
+            return
+
+        ids = [r.id for r in records if r.id is not None]
+        if not ids:
+            return
+
+        model_cls = self.draft_cls.model_cls
+        draft_ids = {
+            row.id
+            for row in db.session.query(model_cls.id).filter(
+                model_cls.id.in_(ids),
+                model_cls.is_deleted != True,  # noqa
+            )
+        }
+        for record in records:
+            if record.id is not None:
+                self._set_cache(record, record.id in draft_ids)
 
     def pre_dump(self, record, data, **kwargs):
         """Called before a record is dumped in a secondary storage system."""
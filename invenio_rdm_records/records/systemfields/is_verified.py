@@ -2,8 +2,25 @@
 # SPDX-License-Identifier: MIT
 """Record 'verified' system field."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from invenio_access.permissions import system_user_id
+from invenio_accounts.models import User
+from invenio_db import db
 from invenio_records_resources.records.systemfields.calculated import CalculatedField
+from sqlalchemy import event
+
+_verified_owners = ContextVar("rdm_records_verified_owners", default=None)
+"""Verification status of the record owners, by user id, for the current batch."""
+
+
+@event.listens_for(User.verified_at, "set")
+def _invalidate_verified_owner(user, value, oldvalue, initiator):
+    """Drop the cached verification status of a user when it changes."""
+    verified_owners = _verified_owners.get()
+    if verified_owners is not None:
+        verified_owners.pop(str(user.id), None)
 
 
 class IsVerifiedField(CalculatedField):
@@ -13,9 +30,60 @@ class IsVerifiedField(CalculatedField):
         """Constructor."""
         super().__init__(key=key, use_cache=False)
 
+    @staticmethod
+    def _fetch_verified_owners(user_ids):
+        """Fetch the verification status of several users with a single query."""
+        ids = {int(user_id) for user_id in user_ids if str(user_id).isdigit()}
+        verified = {str(user_id): False for user_id in user_ids}
+        if ids:
+            rows = db.session.query(User.id, User.verified_at).filter(User.id.in_(ids))
+            verified.update({str(row.id): row.verified_at is not None for row in rows})
+        return verified
+
+    @classmethod
+    @contextmanager
+    def prefetch(cls, user_ids=()):
+        """Cache the verification status of the record owners for the context.
+
+        Inside of the context, the verification status of each owner is fetched
+        at most once, instead of resolving the owner on each calculation. The
+        given owners are fetched upfront with a single query.
+
+        .. code-block:: python
+
+            with IsVerifiedField.prefetch(owner_ids):
+                dumps = [parent.dumps() for parent in parents]
+
+        :param user_ids: Iterable of user ids of the owners to fetch.
+        """
+        user_ids = {str(user_id) for user_id in user_ids if user_id is not None}
+        user_ids.discard(str(system_user_id))
+        verified_owners = dict(_verified_owners.get() or {})
+        verified_owners.update(
+            cls._fetch_verified_owners(user_ids - verified_owners.keys())
+        )
+
+        token = _verified_owners.set(verified_owners)
+        try:
+            yield
+        finally:
+            _verified_owners.reset(token)
+
     def calculate(self, record):
         """Calculate the ``is_verified`` property of the record."""
-        owner = record.access.owner.resolve()
+        owner = record.access.owner
+        verified_owners = _verified_owners.get()
+        if (
+            verified_owners is not None
+            and owner.owner_type == "user"
+            and owner.owner_id != system_user_id
+        ):
+            user_id = str(owner.owner_id)
+            if user_id not in verified_owners:
+                verified_owners.update(self._fetch_verified_owners([user_id]))
+            return verified_owners[user_id]
+
+        owner = owner.resolve()
         if not owner:
             # `null` or deleted user
             return False
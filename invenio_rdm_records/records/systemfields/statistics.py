@@ -37,6 +37,50 @@ class RecordStatisticsField(SystemField):
             recid=recid, parent_recid=parent_recid
         )
 
+    def prefetch(self, records):
+        """Fetch the statistics of several records at once.
+
+        The statistics are fetched with a single multi-get request against the
+        records' search index, and the ones that couldn't be found there are
+        fetched with a single multi-search over the aggregation indices.
+        Records which already have their statistics are left untouched.
+
+        .. code-block:: python
+
+            RDMRecord.stats.prefetch(records)
+        """
+        missing = [r for r in records if not r.get("stats")]
+        if not missing:
+            return
+
+        stats = {}
+        indices = {}
+        for record in missing:
+            indices.setdefault(build_alias_name(record.index._name), []).append(record)
+        for index, index_records in indices.items():
+            try:
+                res = current_search_client.mget(
+                    index=index,
+                    body={"ids": [str(r.id) for r in index_records]},
+                    params={"_source_includes": "stats"},
+                )
+                for doc in res["docs"]:
+                    if doc.get("found"):
+                        stats[doc["_id"]] = doc["_source"].get("stats")
+            except Exception:
+                pass
+
+        # as a fallback, use the more up-to-date aggregations indices
+        fallback = [r for r in missing if not stats.get(str(r.id))]
+        fallback_stats = Statistics.get_records_stats(
+            (r["id"], r.parent["id"]) for r in fallback
+        )
+        for record in fallback:
+            stats[str(record.id)] = fallback_stats[record["id"]]
+
+        for record in missing:
+            record["stats"] = stats[str(record.id)]
+
     #
     # Data descriptor methods (i.e. attribute access)
     #
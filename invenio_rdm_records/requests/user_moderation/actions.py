@@ -11,8 +11,9 @@ from invenio_vocabularies.proxies import current_service
 
 from ...proxies import current_rdm_records_service
 from .tasks import (
-    delete_record,
-    restore_record,
+    chunked,
+    delete_records,
+    restore_records,
     user_block_cleanup,
     user_restore_cleanup,
 )
@@ -45,9 +46,11 @@ def on_block(user_id, uow=None, **kwargs):
     if actor_id is not None:
         tombstone_data["removed_by"] = {"user": str(actor_id)}
 
-    # Soft-delete all the published records of that user
-    for recid in get_user_records(user_id):
-        uow.register(TaskOp(delete_record, recid=recid, tombstone_data=tombstone_data))
+    # Soft-delete all the published records of that user, in batches
+    for record_ids in chunked(get_user_records(user_id, uuids=True)):
+        uow.register(
+            TaskOp(delete_records, record_ids=record_ids, tombstone_data=tombstone_data)
+        )
 
     # Send cleanup task to make sure all records are deleted
     uow.register(
@@ -69,9 +72,9 @@ def on_restore(user_id, uow=None, **kwargs):
     """
     user_id = str(user_id)
 
-    # restore all the deleted records of that user
-    for recid in get_user_records(user_id):
-        uow.register(TaskOp(restore_record, recid=recid))
+    # restore all the deleted records of that user, in batches
+    for record_ids in chunked(get_user_records(user_id, uuids=True)):
+        uow.register(TaskOp(restore_records, record_ids=record_ids))
 
     # Send cleanup task to make sure all records are restored
     uow.register(
@@ -3,7 +3,10 @@
 
 """User moderation tasks."""
 
+from itertools import islice
+
 from celery import shared_task
+from flask import current_app
 from invenio_access.permissions import system_identity
 from invenio_users_resources.records.api import UserAggregate
 
@@ -16,38 +19,124 @@ from invenio_rdm_records.services.errors import DeletionStatusException
 from .utils import get_user_records
 
 
+def chunked(iterable, size=None):
+    """Split an iterable into lists of (at most) the moderation batch size."""
+    size = size or current_app.config["RDM_USER_MODERATION_BATCH_SIZE"]
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _process_batches(user_id, record_ids, process, still_applies, action):
+    """Process the records of a user in batches, with one transaction per batch.
+
+    If a batch fails, its records are processed one by one so that a single
+    faulty record doesn't block the others. The processing stops early if the
+    moderation action doesn't apply to the user anymore.
+    """
+    total = len(record_ids)
+    done = 0
+    for chunk in chunked(record_ids):
+        if not still_applies():
+            current_app.logger.info(
+                "Stopped %s the records of user %s after %s/%s records.",
+                action,
+                user_id,
+                done,
+                total,
+            )
+            return
+
+        try:
+            process(chunk)
+        except Exception:
+            current_app.logger.warning(
+                "Failed %s a batch of records of user %s, retrying one by one.",
+                action,
+                user_id,
+                exc_info=True,
+            )
+            for record_id in chunk:
+                try:
+                    process([record_id])
+                except Exception:
+                    current_app.logger.exception(
+                        "Failed %s record %s of user %s.", action, record_id, user_id
+                    )
+
+        done += len(chunk)
+        current_app.logger.info(
+            "%s %s/%s records of user %s.", action.capitalize(), done, total, user_id
+        )
+
+
+def _is_blocked(user_id):
+    """Check if the user is (still) blocked."""
+    return UserAggregate.get_record(user_id).blocked
+
+
 @shared_task(ignore_result=True)
 def user_block_cleanup(user_id, tombstone_data):
     """User block action cleanup."""
-    user = UserAggregate.get_record(user_id)
     # Bail out if the user is not blocked (i.e. we restored him before the task ran)
-    if not user.blocked:
+    if not _is_blocked(user_id):
         return
 
-    for recid in get_user_records(
+    record_ids = list(
+        get_user_records(
+            user_id,
+            from_db=True,
+            # Only fetch published records that might have not been deleted yet.
+            status=[RecordDeletionStatusEnum.PUBLISHED],
+            uuids=True,
+        )
+    )
+    _process_batches(
         user_id,
-        from_db=True,
-        # Only fetch published records that might have not been deleted yet.
-        status=[RecordDeletionStatusEnum.PUBLISHED],
-    ):
-        delete_record.delay(recid, tombstone_data)
+        record_ids,
+        lambda chunk: delete_records(chunk, tombstone_data),
+        lambda: _is_blocked(user_id),
+        "deleting",
+    )
 
 
 @shared_task(ignore_result=True)
 def user_restore_cleanup(user_id):
     """User restore action cleanup."""
-    user = UserAggregate.get_record(user_id)
     # Bail out if the user is blocked (i.e. we blocked him before the task ran)
-    if user.blocked:
+    if _is_blocked(user_id):
         return
 
-    for recid in get_user_records(
+    record_ids = list(
+        get_user_records(
+            user_id,
+            from_db=True,
+            # Only fetch deleted records that might have not been restored yet.
+            status=[RecordDeletionStatusEnum.DELETED],
+            uuids=True,
+        )
+    )
+    _process_batches(
         user_id,
-        from_db=True,
-        # Only fetch deleted records that might have not been restored yet.
-        status=[RecordDeletionStatusEnum.DELETED],
-    ):
-        restore_record.delay(recid)
+        record_ids,
+        restore_records,
+        lambda: not _is_blocked(user_id),
+        "restoring",
+    )
+
+
+@shared_task(ignore_result=True)
+def delete_records(record_ids, tombstone_data):
+    """Delete a batch of records, in a single transaction."""
+    current_rdm_records_service.bulk_delete_records(
+        system_identity, record_ids, tombstone_data
+    )
+
+
+@shared_task(ignore_result=True)
+def restore_records(record_ids):
+    """Restore a batch of records, in a single transaction."""
+    current_rdm_records_service.bulk_restore_records(system_identity, record_ids)
 
 
 @shared_task(ignore_result=True)
@@ -10,8 +10,12 @@ from invenio_search.api import RecordsSearchV2
 from ...proxies import current_rdm_records_service
 
 
-def get_user_records(user_id, from_db=False, status=None):
-    """Helper function for getting all the records of the user."""
+def get_user_records(user_id, from_db=False, status=None, uuids=False):
+    """Helper function for getting all the records of the user.
+
+    By default the PID values of the records are returned, or their UUIDs (as
+    strings) if ``uuids`` is set.
+    """
     record_cls = current_rdm_records_service.record_cls
     model_cls = record_cls.model_cls
     parent_cls = record_cls.parent_record_cls
@@ -19,7 +23,9 @@ def get_user_records(user_id, from_db=False, status=None):
 
     if from_db:
         query = (
-            db.session.query(model_cls.json["id"].as_string())
+            db.session.query(
+                model_cls.id if uuids else model_cls.json["id"].as_string()
+            )
             .join(parent_model_cls)
             .filter(
                 parent_model_cls.json["access"]["owned_by"]["user"].as_string()
@@ -29,16 +35,16 @@ def get_user_records(user_id, from_db=False, status=None):
         if status:
             query = query.filter(model_cls.deletion_status.in_(status))
 
-        return (row[0] for row in query.yield_per(1000))
+        return (str(id_) if uuids else id_ for (id_,) in query.yield_per(1000))
     else:
         search = (
             RecordsSearchV2(index=record_cls.index._name)
             .filter("term", **{"parent.access.owned_by.user": user_id})
-            .source(["id"])
+            .source(["uuid" if uuids else "id"])
         )
         if status:
             if not isinstance(status, (tuple, list)):
                 status = [status]
             status = [s.value for s in status]
             search = search.filter("terms", deletion_status=status)
-        return (hit["id"] for hit in search.scan())
+        return (hit["uuid" if uuids else "id"] for hit in search.scan())
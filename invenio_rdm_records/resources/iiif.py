@@ -7,6 +7,7 @@
 
 import textwrap
 from abc import ABC, abstractmethod
+from datetime import timezone
 from functools import wraps
 from importlib.metadata import version
 from urllib.parse import urljoin
@@ -86,7 +87,7 @@ class IIIFResourceConfig(ResourceConfig, ConfiguratorMixin):
     }
 
     request_headers = {
-        "If-Modified-Since": ma.fields.DateTime(),
+        "If-Modified-Since": ma.fields.DateTime(format="rfc"),
     }
 
     response_handler = {"application/json": ResponseHandler(JSONSerializer())}
@@ -283,7 +284,7 @@ class IIIFResource(ErrorHandlersMixin, Resource):
         size = resource_requestctx.view_args["size"]
         rotation = resource_requestctx.view_args["rotation"]
         quality = resource_requestctx.view_args["quality"]
-        to_serve = self.service.image_api(
+        derivative = self.service.image_derivative(
             identity=g.identity,
             uuid=uuid,
             region=region,
@@ -292,12 +293,24 @@ class IIIFResource(ErrorHandlersMixin, Resource):
             quality=quality,
             image_format=image_format,
         )
+        etag = derivative.etag
+        last_modified = derivative.last_modified
+        if etag and request.if_none_match.contains_weak(etag):
+            raise HTTPJSONException(code=304)
+        if_modified_since = resource_requestctx.headers.get("If-Modified-Since")
+        if if_modified_since and if_modified_since.tzinfo is None:
+            if_modified_since = if_modified_since.replace(tzinfo=timezone.utc)
+        # HTTP dates have a precision of seconds
+        if (
+            if_modified_since
+            and last_modified
+            and if_modified_since >= last_modified.replace(microsecond=0)
+        ):
+            raise HTTPJSONException(code=304)
+
         # decide the mime_type from the requested image_format
         mimetype = self.config.supported_formats.get(image_format, "image/jpeg")
-        # TODO: get from cache on the service image.last_modified
-        last_modified = None
-        send_file_kwargs = {"mimetype": mimetype}
-        # last_modified is not supported before flask 0.12
+        send_file_kwargs = {"mimetype": mimetype, "etag": etag or False}
         if last_modified:
             send_file_kwargs.update(last_modified=last_modified)
 
@@ -321,11 +334,7 @@ class IIIFResource(ErrorHandlersMixin, Resource):
                 send_file_kwargs.update(
                     download_name=secure_filename(filename),
                 )
-        if_modified_since = resource_requestctx.headers.get("If-Modified-Since")
-        if if_modified_since and last_modified and if_modified_since >= last_modified:
-            raise HTTPJSONException(code=304)
-
-        response = send_file(to_serve, **send_file_kwargs)
+        response = send_file(derivative.open(), **send_file_kwargs)
         return response
 
 
@@ -10,7 +10,7 @@
 
 from functools import wraps
 
-from flask import abort, current_app, flash, g, redirect, url_for
+from flask import Response, abort, current_app, flash, g, redirect, request, url_for
 from flask_resources import Resource, resource_requestctx, response_handler, route
 from invenio_base import invenio_url_for
 from invenio_drafts_resources.resources import RecordResource
@@ -27,6 +27,7 @@ from invenio_records_resources.resources.records.resource import (
 from invenio_records_resources.resources.records.utils import search_preference
 from invenio_stats import current_stats
 from sqlalchemy.exc import NoResultFound
+from werkzeug.http import quote_etag
 
 
 def response_header_signposting(f):
@@ -56,6 +57,12 @@ def response_header_signposting(f):
     return inner
 
 
+def if_none_match_revision_ids():
+    """Get the revision ids from the ETags of the ``If-None-Match`` header."""
+    etags = request.if_none_match.as_set(include_weak=True)
+    return {int(etag) for etag in etags if etag.isdigit()}
+
+
 class RDMRecordResource(RecordResource):
     """RDM record resource."""
 
@@ -134,7 +141,23 @@ class RDMRecordResource(RecordResource):
     @response_header_signposting
     @response_handler()
     def read(self):
-        """Read an item."""
+        """Read an item.
+
+        For conditional requests, a ``304 Not Modified`` response is returned
+        without loading and serializing the record if it is unmodified.
+        """
+        revision_ids = if_none_match_revision_ids()
+        if revision_ids:
+            revision_id = self.service.get_unmodified_revision_id(
+                g.identity, resource_requestctx.view_args["pid_value"], revision_ids
+            )
+            if revision_id is not None:
+                response = Response(status=304)
+                response.headers["ETag"] = quote_etag(str(revision_id))
+                # We pass None to create a tuple as the response_handler always
+                # expects an iterable
+                return response, None
+
         try:
             item = self.service.read(
                 g.identity,
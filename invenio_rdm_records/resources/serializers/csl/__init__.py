@@ -4,15 +4,9 @@
 """CSL JSON and  citation string serializers for Invenio RDM Records."""
 
 import re
+from functools import lru_cache
+from threading import Lock
 
-from citeproc import (
-    Citation,
-    CitationItem,
-    CitationStylesBibliography,
-    CitationStylesStyle,
-    formatter,
-)
-from citeproc.source.json import CiteProcJSON
 from citeproc_styles import get_style_filepath
 from citeproc_styles.errors import StyleNotFoundError
 from flask import current_app
@@ -42,46 +36,81 @@ class CSLJSONSerializer(MarshmallowSerializer):
         )
 
 
-def get_citation_string(json, id, style, locale):
-    """Get the citation string from CiteProc library."""
+@lru_cache(maxsize=128)
+def get_citation_style(style, locale):
+    """Get the parsed CSL style for the given style file path and locale.
+
+    Parsing the CSL style and locale files is expensive, so the parsed styles are
+    kept in a process-wide LRU cache. Since citeproc keeps rendering state on the
+    style's elements, the style comes with a lock that is held while rendering.
+    """
+    # citeproc is imported on first use, as it is only needed for citations
+    from citeproc import CitationStylesStyle
+
+    return CitationStylesStyle(validate=False, style=style, locale=locale), Lock()
+
+
+def _clean_result(text):
+    """Remove double spaces, punctuation."""
+    text = re.sub(r"\s\s+", " ", text)
+    text = re.sub(r"\.\.+", ".", text)
+    return text
+
 
-    def _clean_result(text):
-        """Remove double spaces, punctuation."""
-        text = re.sub(r"\s\s+", " ", text)
-        text = re.sub(r"\.\.+", ".", text)
+def _replace_doi_link(text, doi, new_doi_link):
+    """Replace the citation DOI link with the correct one.
+
+    Citation styles that generate a DOI URL in their citation generate it with the
+    form: "https://doi.org/<prefix>/<suffix>". However, when using a
+    Datacite test account (i.e. when `DATACITE_TEST_MODE = True`) and
+    potentially when using other providers' test accounts, the actual DOI URL is
+    of a different form: "https://handle.test.datacite.org/<prefix>/<suffix> as of
+    writing. By relying on a passed DOI URL instead, we can make sure the
+    correct URL is used. The DOI url is passed in the namespaced entry
+    json["_extras"]["links"]["doi"].
+    """
+    if doi and new_doi_link:
+        return text.replace(f"https://doi.org/{doi}", new_doi_link)
+    else:
         return text
 
-    def _replace_doi_link(text, doi, new_doi_link):
-        """Replace the citation DOI link with the correct one.
-
-        Citation styles that generate a DOI URL in their citation generate it with the
-        form: "https://doi.org/<prefix>/<suffix>". However, when using a
-        Datacite test account (i.e. when `DATACITE_TEST_MODE = True`) and
-        potentially when using other providers' test accounts, the actual DOI URL is
-        of a different form: "https://handle.test.datacite.org/<prefix>/<suffix> as of
-        writing. By relying on a passed DOI URL instead, we can make sure the
-        correct URL is used. The DOI url is passed in the namespaced entry
-        json["_extras"]["links"]["doi"].
-        """
-        if doi and new_doi_link:
-            return text.replace(f"https://doi.org/{doi}", new_doi_link)
-        else:
-            return text
-
-    extras = json.pop("_extras", {})
-    source = CiteProcJSON([json])
-    citation_style = CitationStylesStyle(validate=False, style=style, locale=locale)
-    bib = CitationStylesBibliography(citation_style, source, formatter.plain)
-    citation = Citation([CitationItem(id)])
-    bib.register(citation)
-
-    citation_raw = str(bib.bibliography()[0])
-    citation_doi_replaced = _replace_doi_link(
-        citation_raw,
-        json.get("DOI"),
-        extras.get("links", {}).get("doi"),
-    )
-    return _clean_result(citation_doi_replaced)
+
+def get_citation_strings(jsons, ids, style, locale):
+    """Get the citation strings for several records from CiteProc library.
+
+    Each record is formatted through its own bibliography (e.g. so that numeric
+    styles don't number the records across the list), using the cached parsed
+    style.
+    """
+    from citeproc import Citation, CitationItem, CitationStylesBibliography, formatter
+    from citeproc.source.json import CiteProcJSON
+
+    extras = [json.pop("_extras", {}) for json in jsons]
+    citation_style, lock = get_citation_style(style, locale)
+
+    rendered = []
+    with lock:
+        for json, id in zip(jsons, ids):
+            source = CiteProcJSON([json])
+            bib = CitationStylesBibliography(citation_style, source, formatter.plain)
+            bib.register(Citation([CitationItem(id)]))
+            rendered.append(bib.bibliography())
+
+    return [
+        _clean_result(
+            _replace_doi_link(
+                str(citation_raw[0]) if citation_raw else "",
+                json.get("DOI"),
+                extra.get("links", {}).get("doi"),
+            )
+        )
+        for json, extra, citation_raw in zip(jsons, extras, rendered)
+    ]
+
+
+def get_citation_string(json, id, style, locale):
+    """Get the citation string from CiteProc library."""
+    return get_citation_strings([json], [id], style, locale)[0]
 
 
 def get_style_location(style):
@@ -137,6 +166,17 @@ class StringCitationSerializer(MarshmallowSerializer):
 
         :param record: dict from RecordItem.to_dict().
         """
+        return self._serialize_records([record])[0]
+
+    def serialize_object_list(self, records):
+        """Serialize a list of records.
+
+        :param records: List of records instance.
+        """
+        return "\n".join(self._serialize_records(records["hits"]["hits"]))
+
+    def _get_style_and_locale(self):
+        """Get the style file path and locale to format the citations with."""
         style, locale = (
             self.url_args_retriever()
             if callable(self.url_args_retriever)
@@ -146,21 +186,21 @@ class StringCitationSerializer(MarshmallowSerializer):
         style = style or self._default_style
         locale = locale or self._default_locale
 
-        style_filepath = get_style_location(style)
+        return get_style_location(style), locale
 
-        # Pass the record links under _extras namespace
-        # so that DOI link can be replaced
-        record_dumped = self.dump_obj(record)
-        record_dumped.setdefault("_extras", {})
-        record_dumped["_extras"]["links"] = record.get("links", {})
+    def _serialize_records(self, records):
+        """Format the citation strings of the records."""
+        style_filepath, locale = self._get_style_and_locale()
 
-        return get_citation_string(record_dumped, record["id"], style_filepath, locale)
+        records_dumped = []
+        for record in records:
+            # Pass the record links under _extras namespace
+            # so that DOI link can be replaced
+            record_dumped = self.dump_obj(record)
+            record_dumped.setdefault("_extras", {})
+            record_dumped["_extras"]["links"] = record.get("links", {})
+            records_dumped.append(record_dumped)
 
-    def serialize_object_list(self, records):
-        """Serialize a list of records.
-
-        :param records: List of records instance.
-        """
-        return "\n".join(
-            [self.serialize_object(rec) for rec in records["hits"]["hits"]]
+        return get_citation_strings(
+            records_dumped, [r["id"] for r in records], style_filepath, locale
         )
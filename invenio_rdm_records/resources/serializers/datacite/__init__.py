@@ -43,6 +43,10 @@ class DataCite43XMLSerializer(MarshmallowSerializer):
             encoder=encoder,
         )
 
+    def dump_etree(self, obj):
+        """Dump the object into a DataCite v4.3 etree."""
+        return schema43.dump_etree(self.dump_obj(obj))
+
 
 class DataCite45JSONSerializer(MarshmallowSerializer):
     """Marshmallow based DataCite schema v4.5 JSON serializer for records."""
@@ -74,3 +78,7 @@ class DataCite45XMLSerializer(MarshmallowSerializer):
             schema_kwargs={"dumpers": [JournalDataciteDumper()]},  # Order matters
             encoder=encoder,
         )
+
+    def dump_etree(self, obj):
+        """Dump the object into a DataCite v4.5 etree."""
+        return schema45.dump_etree(self.dump_obj(obj))
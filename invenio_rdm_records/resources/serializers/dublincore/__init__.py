@@ -48,3 +48,7 @@ class DublinCoreXMLSerializer(MarshmallowSerializer):
             encoder=simpledc.tostring,
             **options,
         )
+
+    def dump_etree(self, obj):
+        """Dump the object into a Dublin Core etree."""
+        return simpledc.dump_etree(self.dump_obj(obj))
@@ -6,7 +6,9 @@
 """Helpers for serializers."""
 
 import math
+import time
 
+from flask import current_app
 from invenio_access.permissions import system_identity
 from invenio_i18n import lazy_gettext as _
 from invenio_search.engine import dsl
@@ -15,19 +17,92 @@ from invenio_vocabularies.proxies import current_service as vocabulary_service
 from .errors import VocabularyItemNotFoundError
 
 
+class VocabularyPropsIndex:
+    """In-process index of the props of small vocabularies.
+
+    Vocabularies with up to ``RDM_VOCABULARY_PROPS_INDEX_MAX_SIZE`` entries are
+    loaded with a single search, and the props of their entries are then looked
+    up in memory. Each index is reloaded after ``RDM_VOCABULARY_PROPS_INDEX_TTL``
+    seconds, so that vocabulary updates are eventually picked up by all processes.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._indices = {}
+
+    def _load(self, vocabulary, fields):
+        """Load the props of all the entries of a small vocabulary."""
+        max_size = current_app.config.get("RDM_VOCABULARY_PROPS_INDEX_MAX_SIZE", 0)
+        if not max_size:
+            return None
+
+        results = vocabulary_service.read_all(
+            system_identity,
+            ["id"] + list(fields),
+            vocabulary,
+            cache=False,
+            max_records=max_size,
+        )
+        if results.total > max_size:
+            # too big to be kept in memory
+            return None
+        return {h["id"]: h.get("props", {}) for h in results.hits}
+
+    def _get_index(self, vocabulary, fields):
+        """Get the index of a vocabulary, (re)loading it if expired."""
+        key = (vocabulary, tuple(fields))
+        ttl = current_app.config.get("RDM_VOCABULARY_PROPS_INDEX_TTL", 300)
+        now = time.monotonic()
+
+        loaded_at, index = self._indices.get(key, (None, None))
+        if loaded_at is None or now - loaded_at > ttl:
+            index = self._load(vocabulary, fields)
+            self._indices[key] = (now, index)
+        return index
+
+    def _search_many(self, vocabulary, fields, ids):
+        """Search the props of the given entries of a vocabulary."""
+        # This is ok given that read_all is cached per vocabulary+fields+filter
+        results = vocabulary_service.read_all(
+            system_identity,
+            ["id"] + list(fields),
+            vocabulary,
+            extra_filter=dsl.Q("terms", id=sorted(ids)),
+        )
+        return {h["id"]: h.get("props", {}) for h in results.hits}
+
+    def get_many(self, vocabulary, fields, ids):
+        """Get the props of multiple entries of a vocabulary.
+
+        Entries which are not found are not part of the returned dictionary.
+        """
+        ids = set(ids)
+        index = self._get_index(vocabulary, fields) or {}
+        found = {id_: index[id_] for id_ in ids if id_ in index}
+
+        # entries added since the index was loaded, or of a big vocabulary
+        missing = ids - found.keys()
+        if missing:
+            found.update(self._search_many(vocabulary, fields, missing))
+        return found
+
+    def invalidate(self, vocabulary=None):
+        """Drop the index of a vocabulary, or of all vocabularies."""
+        if vocabulary is None:
+            self._indices.clear()
+            return
+        for key in [k for k in self._indices if k[0] == vocabulary]:
+            self._indices.pop(key, None)
+
+
+vocabulary_props_index = VocabularyPropsIndex()
+
+
 def get_vocabulary_props(vocabulary, fields, id_):
     """Returns props associated with a vocabulary, id_."""
-    # This is ok given that read_all is cached per vocabulary+fields and
-    # is reused overtime
-    results = vocabulary_service.read_all(
-        system_identity,
-        ["id"] + fields,
-        vocabulary,
-        extra_filter=dsl.Q("term", id=id_),
-    )
-
-    for h in results.hits:
-        return h.get("props", {})
+    props = vocabulary_props_index.get_many(vocabulary, fields, [id_])
+    if id_ in props:
+        return props[id_]
 
     raise VocabularyItemNotFoundError(
         _(
@@ -4,10 +4,17 @@
 
 """Secret links for sharing access to records."""
 
+import json
+import time
 import uuid
+from copy import deepcopy
 from datetime import date, datetime, timezone
+from functools import lru_cache
 
+from flask import current_app
 from invenio_db import db
+from itsdangerous import BadData
+from itsdangerous.encoding import base64_decode, want_bytes
 from sqlalchemy_utils import UUIDType
 
 from .errors import InvalidPermissionLevelError
@@ -17,6 +24,47 @@ from .signals import link_created, link_revoked
 
 SUPPORTED_DIGEST_ALGORITHMS = ("HS256", "HS512")
 
+TOKEN_CACHE_SIZE = 1024
+"""Number of recently loaded tokens kept in memory."""
+
+
+@lru_cache(maxsize=16)
+def _get_serializer(secret_key, algorithm_name, timed):
+    """Get the (reusable) serializer for the given secret key and algorithm."""
+    serializer_cls = TimedSecretLinkSerializer if timed else SecretLinkSerializer
+    return serializer_cls(algorithm_name=algorithm_name)
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _load_token(secret_key, token):
+    """Load a token with the serializer matching its header.
+
+    The algorithm of the token, and whether it expires, are read from its
+    (unverified) header, which picks the only serializer that can validate it.
+
+    :returns: a ``(data, expires)`` tuple, with the expiry timestamp of the
+        token (``None`` for non-expiring tokens), or ``None`` if the token is
+        invalid.
+    """
+    try:
+        header = json.loads(base64_decode(want_bytes(token).split(b".", 1)[0]))
+    except Exception:
+        return None
+    if not isinstance(header, dict):
+        return None
+    algorithm = header.get("alg")
+    if algorithm not in SUPPORTED_DIGEST_ALGORITHMS:
+        return None
+
+    timed = "exp" in header
+    serializer = _get_serializer(secret_key, algorithm, timed)
+    try:
+        data = serializer.load_token(token, force=True)
+        # the header was verified along with the signature
+        return data, int(header["exp"]) if timed else None
+    except BadData:
+        return None
+
 
 class SecretLink(db.Model):
     """Secret links for sharing permissions on records."""
@@ -164,15 +212,17 @@ class SecretLink(db.Model):
         If ``force`` is set to ``True``, the token's expiration date is
         ignored.
         """
-        for algorithm in SUPPORTED_DIGEST_ALGORITHMS:
-            s = SecretLinkSerializer(algorithm_name=algorithm)
-            st = TimedSecretLinkSerializer(algorithm_name=algorithm)
-
-            for serializer in (s, st):
-                # serializer.validate_token() already handles BadData
-                data = serializer.validate_token(
-                    token, expected_data=expected_data, force=force
-                )
-
-                if data:
-                    return data
+        loaded = _load_token(current_app.config["SECRET_KEY"], token)
+        if loaded is None:
+            return None
+
+        data, expires = loaded
+        if not force and expires is not None and expires < int(time.time()):
+            return None
+
+        # Compare expected data with data in token.
+        for k, v in (expected_data or {}).items():
+            if data["data"].get(k) != v:
+                return None
+
+        return deepcopy(data)
@@ -6,14 +6,17 @@
 
 """RDM record access settings service."""
 
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 
 import arrow
 from flask import current_app
 from flask_login import current_user
 from invenio_access.permissions import authenticated_user, system_identity
+from invenio_accounts.proxies import current_datastore
 from invenio_audit_logs.services.uow import AuditLogOp
 from invenio_base import invenio_url_for
+from invenio_db import db
 from invenio_drafts_resources.services.records import RecordService
 from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
 from invenio_i18n import lazy_gettext as _
@@ -24,6 +27,7 @@ from invenio_records_resources.services.uow import RecordCommitOp, unit_of_work
 from invenio_requests.proxies import current_requests_service
 from invenio_search.engine import dsl
 from invenio_users_resources.proxies import current_user_resources
+from invenio_users_resources.records.api import GroupAggregate, UserAggregate
 from marshmallow.exceptions import ValidationError
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -45,6 +49,7 @@ from ...secret_links.errors import InvalidPermissionLevelError
 from ..decorators import groups_enabled
 from ..errors import AccessRequestExistsError, GrantExistsError
 from ..results import GrantSubjectExpandableField
+from .uow import BulkNotificationOp
 
 
 class RecordAccessService(RecordService):
@@ -438,6 +443,53 @@ class RecordAccessService(RecordService):
             #       "not found" errors, to not leak information about existence
             return False
 
+    def _validate_grant_subjects(self, identity, grants):
+        """Check if the grant subjects exist and are visible, with batched lookups.
+
+        Users and groups are fetched with one query per subject type, instead of
+        reading them one by one through their services.
+        """
+        subject_ids = defaultdict(set)
+        for grant in grants:
+            subject_ids[grant.subject_type].add(str(grant.subject_id))
+
+        found = set()
+        user_ids = [int(id_) for id_ in subject_ids.pop("user", ()) if id_.isdigit()]
+        if user_ids:
+            user_model = current_datastore.user_model
+            with db.session.no_autoflush:
+                users = db.session.query(user_model).filter(user_model.id.in_(user_ids))
+                for user in users:
+                    if current_user_resources.users_service.check_permission(
+                        identity, "read", record=UserAggregate.from_model(user)
+                    ):
+                        found.add(("user", str(user.id)))
+
+        role_ids = subject_ids.pop(RecordAccessService.group_subject_type, ())
+        if role_ids:
+            role_model = current_datastore.role_model
+            with db.session.no_autoflush:
+                roles = db.session.query(role_model).filter(role_model.id.in_(role_ids))
+                for role in roles:
+                    if current_user_resources.groups_service.check_permission(
+                        identity, "read", record=GroupAggregate.from_model(role)
+                    ):
+                        found.add((RecordAccessService.group_subject_type, role.id))
+
+        for grant in grants:
+            subject = (grant.subject_type, str(grant.subject_id))
+            if subject in found:
+                continue
+            if grant.subject_type in subject_ids:
+                # e.g. system roles, which are resolved without a database query
+                if not self._validate_grant_subject(identity, grant):
+                    return False
+                found.add(subject)
+            else:
+                return False
+
+        return True
+
     @unit_of_work()
     def bulk_create_grants(self, identity, id_, data, expand=False, uow=None):
         """Bulk create access grants for a record (resp. its parent)."""
@@ -453,50 +505,53 @@ class RecordAccessService(RecordService):
 
         grants = data["grants"]
 
-        new_grants = []
-
-        # fail if any of the grants already exist
-        if any(
-            existing_grant.subject_id == grant["subject"]["id"]
-            and existing_grant.subject_type == grant["subject"]["type"]
-            for existing_grant in parent.access.grants
+        # checks if groups are enabled in the instance
+        if not current_app.config.get("USERS_RESOURCES_GROUPS_ENABLED", False) and any(
+            grant["subject"]["type"] == RecordAccessService.group_subject_type
             for grant in grants
         ):
-            raise GrantExistsError()
+            raise PermissionDeniedError()
 
+        # fail if any of the grants already exist, or are given more than once
+        subjects = {
+            (grant.subject_type, grant.subject_id) for grant in parent.access.grants
+        }
         for grant in grants:
-            # checks if groups are enabled in the instance
-            if (
-                not current_app.config.get("USERS_RESOURCES_GROUPS_ENABLED", False)
-                and grant["subject"]["type"] == RecordAccessService.group_subject_type
-            ):
-                raise PermissionDeniedError()
+            subject = (grant["subject"]["type"], grant["subject"]["id"])
+            if subject in subjects:
+                raise GrantExistsError()
+            subjects.add(subject)
 
-            # Creation
-            new_grant = parent.access.grants.create(
+        # Creation
+        new_grants = [
+            parent.access.grants.create(
                 subject_type=grant["subject"]["type"],
                 subject_id=grant["subject"]["id"],
                 permission=grant["permission"],
                 origin=grant.get("origin"),
             )
+            for grant in grants
+        ]
 
-            if not self._validate_grant_subject(identity, new_grant):
-                raise ValidationError(
-                    _("Could not find the specified subject."), field_name="subject.id"
-                )
+        if not self._validate_grant_subjects(identity, new_grants):
+            raise ValidationError(
+                _("Could not find the specified subject."), field_name="subject.id"
+            )
 
-            if grant["subject"]["type"] == "user" and grant.get("notify"):
-                uow.register(
-                    NotificationOp(
-                        GrantUserAccessNotificationBuilder.build(
-                            record=record,
-                            user={"user": grant["subject"]["id"]},
-                            permission=grant["permission"],
-                            message=grant.get("message"),
-                        )
+        uow.register(
+            BulkNotificationOp(
+                [
+                    GrantUserAccessNotificationBuilder.build(
+                        record=record,
+                        user={"user": grant["subject"]["id"]},
+                        permission=grant["permission"],
+                        message=grant.get("message"),
                     )
-                )
-            new_grants.append(new_grant)
+                    for grant in grants
+                    if grant["subject"]["type"] == "user" and grant.get("notify")
+                ]
+            )
+        )
 
         uow.register(ParentRecordCommitOp(parent, indexer_context=dict(service=self)))
         self._update_record_request(record, uow)
@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Unit of work operations for the access service."""
+
+from invenio_records_resources.services.uow import Operation
+
+from ..tasks import broadcast_notifications
+
+
+class BulkNotificationOp(Operation):
+    """Send a batch of notifications with a single task, after commit."""
+
+    def __init__(self, notifications):
+        """Initialize operation."""
+        super().__init__()
+        self._notifications = notifications
+
+    def on_post_commit(self, uow):
+        """Start task to send the notifications."""
+        if self._notifications:
+            broadcast_notifications.delay([n.dumps() for n in self._notifications])
@@ -5,14 +5,18 @@
 
 """RDM Record Communities Service."""
 
+from collections import defaultdict
+
 from flask import current_app
 from flask_principal import AnonymousIdentity
 from invenio_access.permissions import system_identity
 from invenio_communities.proxies import current_communities
+from invenio_db import db
 from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
 from invenio_i18n import lazy_gettext as _
 from invenio_notifications.services.uow import NotificationOp
 from invenio_pidstore.errors import PIDDoesNotExistError, PIDUnregistered
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_records_resources.services import (
     RecordIndexerMixin,
     Service,
@@ -31,6 +35,7 @@ from sqlalchemy.orm.exc import NoResultFound
 
 from ...notifications.builders import CommunityInclusionSubmittedNotificationBuilder
 from ...proxies import current_rdm_records, current_rdm_records_service
+from ...records.models import RDMParentCommunity
 from ...requests import CommunityInclusion, CommunitySubmission
 from ..errors import (
     CannotRemoveCommunityError,
@@ -454,12 +459,79 @@ class RecordCommunitiesService(Service, RecordIndexerMixin):
             uow=uow,
         )
 
+        community = current_communities.service.record_cls.pid.resolve(community_id)
+        parent_community = getattr(community, "parent", None)
+
+        record_ids = list(record_ids)
+        chunk_size = current_app.config["RDM_RECORD_COMMUNITIES_BULK_ADD_CHUNK_SIZE"]
+        for i in range(0, len(record_ids), chunk_size):
+            errors.extend(
+                self._bulk_add_chunk(
+                    community_id,
+                    community,
+                    parent_community,
+                    record_ids[i : i + chunk_size],
+                    set_default_flag["value"],
+                    uow,
+                )
+            )
+        return errors
+
+    def _get_parents_by_record_pid(self, record_ids):
+        """Get the parents of published records, given the records' PID values.
+
+        The parents are loaded with one query, without loading the records.
+        Records which cannot be resolved are left out of the returned mapping.
+        """
+        record_model = self.record_cls.model_cls
+        parent_ids = dict(
+            db.session.query(PersistentIdentifier.pid_value, record_model.parent_id)
+            .join(record_model, record_model.id == PersistentIdentifier.object_uuid)
+            .filter(
+                PersistentIdentifier.pid_type == "recid",
+                PersistentIdentifier.pid_value.in_(record_ids),
+                PersistentIdentifier.status == PIDStatus.REGISTERED,
+            )
+        )
+        parents = {
+            parent.id: parent
+            for parent in self.record_cls.parent_record_cls.get_records(
+                set(parent_ids.values())
+            )
+        }
+        return {
+            record_id: parents[parent_id] for record_id, parent_id in parent_ids.items()
+        }
+
+    def _bulk_add_chunk(
+        self, community_id, community, parent_community, record_ids, set_default, uow
+    ):
+        """Add a chunk of records to a community."""
+        errors = []
+        parents = self._get_parents_by_record_pid(record_ids)
+
+        # fetch the inclusions of all the parents in a single query
+        communities = defaultdict(set)
+        for parent_id, included_id in db.session.query(
+            RDMParentCommunity.record_id, RDMParentCommunity.community_id
+        ).filter(RDMParentCommunity.record_id.in_([p.id for p in parents.values()])):
+            communities[parent_id].add(included_id)
+
         for record_id in record_ids:
-            record = self.record_cls.pid.resolve(record_id)
-            community = current_communities.service.record_cls.pid.resolve(community_id)
+            parent = parents.get(record_id)
+            if parent is None:
+                errors.append(
+                    {
+                        "record_id": record_id,
+                        "community_id": community_id,
+                        "message": _("The record does not exist."),
+                    }
+                )
+                continue
 
-            already_included = community.id in record.parent.communities
-            if already_included:
+            parent_communities = communities[parent.id]
+
+            if community.id in parent_communities:
                 errors.append(
                     {
                         "record_id": record_id,
@@ -469,22 +541,21 @@ class RecordCommunitiesService(Service, RecordIndexerMixin):
                 )
                 continue
 
-            parent_community = getattr(community, "parent", None)
-            already_in_parent = (
-                parent_community
-                and str(parent_community.id) in record.parent.communities
-            )
+            if parent_community and parent_community.id not in parent_communities:
+                parent.communities.add(parent_community, request=None)
+                parent_communities.add(parent_community.id)
 
-            if parent_community and not already_in_parent:
-                record.parent.communities.add(parent_community, request=None)
-
-            set_default = set_default_flag["value"] or not record.parent.communities
-            record.parent.communities.add(community, request=None, default=set_default)
+            parent.communities.add(
+                community,
+                request=None,
+                default=set_default or not parent_communities,
+            )
+            parent_communities.add(community.id)
 
             # Commit and bulk re-index everything
             uow.register(
                 ParentRecordCommitOp(
-                    record.parent,
+                    parent,
                     indexer_context={"service": current_rdm_records_service},
                     bulk_index=True,
                 )
@@ -31,17 +31,12 @@ from invenio_drafts_resources.services.records.search_params import AllVersionsP
 from invenio_indexer.api import RecordIndexer
 from invenio_records_resources.services import (
     ConditionalLink,
-    EndpointLink,
     ExternalLink,
 )
 from invenio_records_resources.services import (
     FileServiceConfig as BaseFileServiceConfig,
 )
-from invenio_records_resources.services import (
-    NestedLinks,
-    RecordEndpointLink,
-    pagination_endpoint_links,
-)
+from invenio_records_resources.services import NestedLinks, pagination_endpoint_links
 from invenio_records_resources.services.base.config import (
     ConfiguratorMixin,
     FromConfig,
@@ -49,7 +44,6 @@ from invenio_records_resources.services.base.config import (
     SearchOptionsMixin,
     ServiceConfig,
 )
-from invenio_records_resources.services.files.links import FileEndpointLink
 from invenio_records_resources.services.files.schema import FileSchema
 from invenio_records_resources.services.records.config import (
     RecordServiceConfig as BaseRecordServiceConfig,
@@ -69,6 +63,7 @@ from invenio_rdm_records.services.review.policy import NewRecordVersionReviewPol
 
 from ..records import RDMDraft, RDMRecord
 from ..records.api import RDMDraftMediaFiles, RDMRecordMediaFiles
+from ..records.indexer import RDMRecordIndexer
 from . import facets
 from .components import DefaultRecordsComponents
 from .customizations import (
@@ -76,6 +71,7 @@ from .customizations import (
     FromConfigPIDsProviders,
     FromConfigRequiredPIDs,
 )
+from .links import EndpointLink, FileEndpointLink, RecordEndpointLink
 from .permissions import RDMRecordPermissionPolicy
 from .request_policies import (
     FileModificationPolicyEvaluator,
@@ -96,6 +92,7 @@ from .schemas.quota import QuotaSchema
 from .schemas.record_communities import RecordCommunitiesSchema
 from .schemas.tombstone import TombstoneSchema
 from .search_params import (
+    ExcludeOAIMetadataParam,
     MetricsParam,
     PublishedRecordsParam,
     SharedOrMyDraftsParam,
@@ -217,6 +214,7 @@ class RDMSearchOptions(SearchOptions, SearchOptionsMixin):
         StatusParam,
         PublishedRecordsParam,
         MetricsParam,
+        ExcludeOAIMetadataParam,
     ]
 
 
@@ -237,7 +235,8 @@ class RDMSearchDraftsOptions(SearchDraftsOptions, SearchOptionsMixin):
     }
 
     params_interpreters_cls = [
-        SharedOrMyDraftsParam
+        SharedOrMyDraftsParam,
+        ExcludeOAIMetadataParam,
     ] + SearchDraftsOptions.params_interpreters_cls
 
 
@@ -245,7 +244,8 @@ class RDMSearchVersionsOptions(SearchVersionsOptions, SearchOptionsMixin):
     """Search options for record versioning search."""
 
     params_interpreters_cls = [
-        PublishedRecordsParam
+        PublishedRecordsParam,
+        ExcludeOAIMetadataParam,
     ] + SearchVersionsOptions.params_interpreters_cls
 
 
@@ -585,6 +585,9 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
     record_cls = FromConfig("RDM_RECORD_CLS", default=RDMRecord)
     draft_cls = FromConfig("RDM_DRAFT_CLS", default=RDMDraft)
 
+    # Indexer
+    indexer_cls = RDMRecordIndexer
+
     # Schemas
     schema = FromConfig("RDM_RECORD_SCHEMA", default=RDMRecordSchema)
     schema_parent = RDMParentSchema
@@ -676,6 +679,20 @@ class RDMRecordServiceConfig(RecordServiceConfig, ConfiguratorMixin):
         "RDM_RECORDS_SERVICE_COMPONENTS", default=DefaultRecordsComponents
     )
 
+    # OAI-PMH projection of records
+    oai_fields = (
+        "id",
+        "pids",
+        "metadata",
+        "custom_fields",
+        "access",
+        "files",
+        "parent",
+        "created",
+        "updated",
+    )
+    oai_links = ("self", "self_html", "doi")
+
     # Links
     links_item = {
         # Record
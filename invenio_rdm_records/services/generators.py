@@ -8,15 +8,18 @@
 
 import operator
 from collections import namedtuple
-from functools import partial, reduce
+from copy import copy
+from functools import partial, reduce, wraps
 from itertools import chain
 
-from flask import current_app
+from flask import current_app, g, has_request_context
 from flask_principal import UserNeed
 from invenio_communities.generators import CommunityRoleNeed, CommunityRoles
 from invenio_communities.proxies import current_roles
+from invenio_db import db
 from invenio_records_permissions.generators import ConditionalGenerator, Generator
 from invenio_search.engine import dsl
+from sqlalchemy import inspect
 
 from ..records import RDMDraft
 from ..records.systemfields.access.grants import Grant
@@ -30,6 +33,75 @@ CommunityInclusionNeed = partial(_Need, "community-inclusion")
 """Defines a need for a community inclusion."""
 
 
+def _has_pending_changes(record):
+    """Check if the database model of a record has changes not yet flushed."""
+    model = getattr(record, "model", None)
+    if not isinstance(model, db.Model):
+        return False
+    state = inspect(model)
+    return state.transient or state.pending or state.modified
+
+
+def _record_memo_key(record):
+    """Key identifying the revision of a record and its parent, if persisted.
+
+    Records or parents with pending changes are not identified by their revision
+    yet, so they have no key.
+    """
+    if record is None or getattr(record, "id", None) is None:
+        return None
+
+    parent = getattr(record, "parent", None)
+    if _has_pending_changes(record) or _has_pending_changes(parent):
+        return None
+    return (
+        type(record).__name__,
+        str(record.id),
+        record.revision_id,
+        str(parent.id) if parent is not None else None,
+        parent.revision_id if parent is not None else None,
+    )
+
+
+def memoize_per_request(f):
+    """Memoize the needs/excludes of a generator for a record, within a request.
+
+    Policies evaluate the same generators many times for a record (e.g. through
+    ``SameAs`` chains), which is expensive for generators querying the database.
+    The results are keyed by the generator, and by the record's and its parent's
+    revisions. Only use it for generators which don't depend on other arguments.
+    """
+
+    @wraps(f)
+    def wrapper(self, record=None, **kwargs):
+        record_key = _record_memo_key(record)
+        if record_key is None or not has_request_context():
+            return f(self, record=record, **kwargs)
+
+        memo = g.setdefault("_rdm_generators_memo", {})
+        stats = g.setdefault("_rdm_generators_memo_stats", {"hits": 0, "misses": 0})
+        key = (id(self), f.__name__, *record_key)
+        if key in memo:
+            stats["hits"] += 1
+        else:
+            stats["misses"] += 1
+            memo[key] = f(self, record=record, **kwargs)
+        # copy the result, so that callers can't modify the memoized one
+        return copy(memo[key])
+
+    return wrapper
+
+
+def generators_memo_stats():
+    """Get the generators evaluations memoized (hits) or not (misses) so far.
+
+    The counters are kept for the current request.
+    """
+    if not has_request_context():
+        return {"hits": 0, "misses": 0}
+    return dict(g.get("_rdm_generators_memo_stats", {"hits": 0, "misses": 0}))
+
+
 class IfRestricted(ConditionalGenerator):
     """IfRestricted.
 
@@ -176,6 +248,7 @@ class IfRecordDeleted(Generator):
 class RecordOwners(Generator):
     """Allows record owners."""
 
+    @memoize_per_request
     def needs(self, record=None, **kwargs):
         """Enabling Needs."""
         if record is None:
@@ -199,6 +272,7 @@ class AccessGrant(Generator):
         """Constructor."""
         self._permission = permission
 
+    @memoize_per_request
     def needs(self, record=None, **kwargs):
         """Enabling needs."""
         if record is None:
@@ -256,7 +330,9 @@ class SecretLinks(Generator):
         if record is None:
             return []
 
-        return record.parent.access.links.needs(self.permission)
+        parent = record.parent
+        cache_key = (str(parent.id), parent.revision_id) if parent.id else None
+        return parent.access.links.needs(self.permission, cache_key=cache_key)
 
     def query_filter(self, identity=None, **kwargs):
         """Filters for current identity secret links."""
@@ -269,6 +345,7 @@ class SecretLinks(Generator):
 class SubmissionReviewer(Generator):
     """Roles for community's reviewers."""
 
+    @memoize_per_request
     def needs(self, record=None, **kwargs):
         """Set of Needs granting permission."""
         request = record.get_review()
@@ -292,6 +369,7 @@ class RequestReviewers(Generator):
         """Check if reviewers are enabled."""
         return current_app.config.get("REQUESTS_REVIEWERS_ENABLED", False)
 
+    @memoize_per_request
     def needs(self, record=None, **kwargs):
         """Set of Needs granting permission."""
         if not self._reviewers_enabled():
@@ -344,6 +422,7 @@ class RecordCommunitiesAction(CommunityRoles):
                 community_ids.add(n.value)
         return list(community_ids)
 
+    @memoize_per_request
     def needs(self, record=None, **kwargs):
         """Set of Needs granting permission."""
         if record is None:
@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""IIIF derivative images cache."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Union
+
+from flask import current_app
+
+
+class DerivativesCache:
+    """Base class for IIIF derivative images caches.
+
+    Derivatives are identified by a key, which is built from the checksum of the
+    original file and the IIIF image API parameters used to generate them.
+    """
+
+    @staticmethod
+    def make_key(checksum, region, size, rotation, quality, image_format):
+        """Build the cache key of a derivative image."""
+        params = "/".join((checksum, region, size, rotation, quality, image_format))
+        return hashlib.sha256(params.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Union[bytes, None]:
+        """Get the content of a cached derivative, if present."""
+        return None
+
+    def open(self, key: str):
+        """Open a cached derivative in read mode, if present."""
+        return None
+
+    def set(self, key: str, data: bytes):
+        """Cache the content of a derivative."""
+        pass
+
+
+class LocalDerivativesCache(DerivativesCache):
+    """Local filesystem cache with size-based LRU eviction.
+
+    Each cache hit updates the modification time of the cached file, so that the
+    least recently used derivatives are evicted first once the cache exceeds its
+    maximum size.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_path: Union[str, None] = None,
+        max_size: Union[int, None] = None,
+    ):
+        """Constructor."""
+        self._base_path = base_path
+        self._max_size = max_size
+        self._size = None
+
+    @property
+    def base_path(self):
+        """Return base path from object/config."""
+        path = Path(
+            self._base_path
+            or current_app.config.get("RDM_IIIF_DERIVATIVES_CACHE_BASE_PATH")
+        )
+        if path.is_absolute():
+            return path
+        # If relative path, resolve against instance path
+        return Path(current_app.instance_path) / path
+
+    @property
+    def max_size(self):
+        """Return the maximum size in bytes from object/config."""
+        return self._max_size or current_app.config.get(
+            "RDM_IIIF_DERIVATIVES_CACHE_MAX_SIZE"
+        )
+
+    def _get_file_path(self, key):
+        """Get file path, partitioned by the first characters of the key."""
+        return self.base_path / key[:2] / key[2:4] / key
+
+    def _cached_files(self):
+        """List the cached files."""
+        return [p for p in self.base_path.glob("*/*/*") if p.is_file()]
+
+    def get(self, key):
+        """Get the content of a cached derivative, and mark it as recently used."""
+        path = self._get_file_path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def open(self, key):
+        """Open a cached derivative in read mode, and mark it as recently used."""
+        path = self._get_file_path(key)
+        try:
+            fp = path.open("rb")
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return fp
+
+    def set(self, key, data):
+        """Cache the content of a derivative, evicting old ones if needed."""
+        path = self._get_file_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first, to never serve partially written files
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "wb") as fout:
+            fout.write(data)
+        os.replace(tmp_path, path)
+
+        if self._size is None:
+            self._size = sum(p.stat().st_size for p in self._cached_files())
+        else:
+            self._size += len(data)
+
+        if self.max_size and self._size > self.max_size:
+            self.evict()
+
+    def evict(self):
+        """Evict the least recently used derivatives until under 90% of max size."""
+        stats = []
+        for path in self._cached_files():
+            try:
+                stats.append((path, path.stat()))
+            except FileNotFoundError:
+                # evicted concurrently
+                continue
+
+        size = sum(stat.st_size for _, stat in stats)
+        target = self.max_size * 0.9
+        for path, stat in sorted(stats, key=lambda s: s[1].st_mtime):
+            if size <= target:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+
+        self._size = size
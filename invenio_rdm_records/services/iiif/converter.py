@@ -3,18 +3,26 @@
 
 """IIIF Tiles converter."""
 
+from functools import lru_cache
+
 from flask import current_app
 
-try:
-    import pyvips
 
-    HAS_VIPS = True
-except ModuleNotFoundError:
-    # Python module pyvips not installed
-    HAS_VIPS = False
-except OSError:
-    # Underlying library libvips not installed
-    HAS_VIPS = False
+@lru_cache(maxsize=None)
+def import_pyvips():
+    """Import PyVIPS on first use, since loading libvips is slow.
+
+    Returns ``None`` if PyVIPS is not available.
+    """
+    try:
+        import pyvips
+    except ModuleNotFoundError:
+        # Python module pyvips not installed
+        return None
+    except OSError:
+        # Underlying library libvips not installed
+        return None
+    return pyvips
 
 
 class ImageConverter:
@@ -62,7 +70,7 @@ class PyVIPSImageConverter(ImageConverter):
             input_file.seek(offset, whence)
             return input_file.tell()
 
-        source = pyvips.SourceCustom()
+        source = import_pyvips().SourceCustom()
         source.on_read(read_handler)
         source.on_seek(seek_handler)
 
@@ -90,7 +98,7 @@ class PyVIPSImageConverter(ImageConverter):
             else:
                 return 0
 
-        target = pyvips.TargetCustom()
+        target = import_pyvips().TargetCustom()
         target.on_write(write_handler)
         target.on_read(read_handler)
         target.on_seek(seek_handler)
@@ -100,7 +108,8 @@ class PyVIPSImageConverter(ImageConverter):
 
     def convert(self, in_stream, out_stream):
         """Convert to ptifs."""
-        if not HAS_VIPS:
+        pyvips = import_pyvips()
+        if pyvips is None:
             return
 
         try:
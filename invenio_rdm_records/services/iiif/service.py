@@ -7,31 +7,101 @@
 
 import importlib.metadata as metadata
 import io
+from functools import cached_property, lru_cache
 
+import arrow
+from flask import current_app
 from flask_iiif.api import IIIFImageAPIWrapper
 from invenio_records_resources.services import Service
+from werkzeug.utils import import_string
 
 from ..errors import IdentifierShapeException
+from .cache import DerivativesCache
+from .converter import import_pyvips
 
-try:
-    metadata.distribution("wand")
-    from wand.image import Image
 
-    HAS_IMAGEMAGICK = True
-except (metadata.PackageNotFoundError, ImportError):
-    # ImageMagick notinstalled
-    HAS_IMAGEMAGICK = False
+@lru_cache(maxsize=None)
+def import_wand_image():
+    """Import the Wand (ImageMagick) image class on first use.
 
-try:
-    import pyvips
+    Returns ``None`` if Wand is not available.
+    """
+    try:
+        metadata.distribution("wand")
+        from wand.image import Image
+    except (metadata.PackageNotFoundError, ImportError):
+        # ImageMagick notinstalled
+        return None
+    return Image
+
+
+class IIIFImageDerivative:
+    """Derivative image of a file for the IIIF image API.
+
+    The image is only generated (or read from the derivatives cache) when opened,
+    so that its validators (``etag`` and ``last_modified``) can be used for
+    conditional requests beforehand.
+    """
+
+    def __init__(self, service, file_, region, size, rotation, quality, image_format):
+        """Constructor."""
+        self._service = service
+        self._file = file_
+        self.region = region
+        self.size = size
+        self.rotation = rotation
+        self.quality = quality
+        self.image_format = image_format
+
+    @cached_property
+    def cache_key(self):
+        """Key of the derivative, if its original file has a checksum."""
+        checksum = self._file.data.get("checksum")
+        if not checksum:
+            return None
+        return self._service.derivatives_cache.make_key(
+            checksum,
+            self.region,
+            self.size,
+            self.rotation,
+            self.quality,
+            self.image_format,
+        )
+
+    @property
+    def etag(self):
+        """Entity tag of the derivative."""
+        return self.cache_key
+
+    @property
+    def last_modified(self):
+        """Last modification date of the derivative (i.e. of its original file)."""
+        updated = self._file.data.get("updated")
+        return arrow.get(updated).datetime if updated else None
+
+    def open(self):
+        """Open the derivative image, generating it if not cached."""
+        cache = self._service.derivatives_cache
+        if self.cache_key:
+            data = cache.get(self.cache_key)
+            if data is not None:
+                return io.BytesIO(data)
+
+        data = self._service._open_image(self._file)
+        image = IIIFImageAPIWrapper.open_image(data)
+        image.apply_api(
+            region=self.region,
+            size=self.size,
+            rotation=self.rotation,
+            quality=self.quality,
+        )
+        # prepare image to be serve
+        to_serve = image.serve(image_format=self.image_format)
+        image.close_image()
 
-    HAS_VIPS = True
-except ModuleNotFoundError:
-    # Python module pyvips not installed
-    HAS_VIPS = False
-except OSError:
-    # Underlying library libvips not installed
-    HAS_VIPS = False
+        if self.cache_key:
+            cache.set(self.cache_key, to_serve.getvalue())
+        return to_serve
 
 
 class IIIFService(Service):
@@ -45,6 +115,14 @@ class IIIFService(Service):
         super().__init__(config)
         self._records_service = records_service
 
+    @cached_property
+    def derivatives_cache(self):
+        """Cache of the derivative images, as configured."""
+        cache_cls = current_app.config.get("RDM_IIIF_DERIVATIVES_CACHE_CLASS")
+        if isinstance(cache_cls, str):
+            cache_cls = import_string(cache_cls)
+        return (cache_cls or DerivativesCache)()
+
     def _iiif_uuid(self, uuid):
         """Split the uuid content.
 
@@ -90,13 +168,28 @@ class IIIFService(Service):
         return read(identity=identity, id_=id_)
 
     def _open_image(self, file_):
-        fp = file_.get_stream("rb")
         # If the file is not a PDF or text, return the file
         if file_.data["mimetype"] not in {"application/pdf", "text/plain"}:
-            return fp
-
+            return file_.get_stream("rb")
+
+        # The rasterized first page is cached as the full size PNG derivative, so
+        # that the document is rasterized once per file version
+        cache_key = None
+        checksum = file_.data.get("checksum")
+        if checksum:
+            cache_key = self.derivatives_cache.make_key(
+                checksum, "full", "max", "0", "default", "png"
+            )
+            cached = self.derivatives_cache.open(cache_key)
+            if cached is not None:
+                return cached
+
+        # prefer PyVIPS since it doesn't load the whole file in memory
+        pyvips = import_pyvips()
+        Image = import_wand_image() if pyvips is None else None
+        fp = file_.get_stream("rb")
         # If Wand (ImageMagick) or PyVIPS is installed, extract the first page
-        if HAS_VIPS:  # prefer PyVIPS since it doesn't load the whole file in memory
+        if pyvips is not None:
 
             def _seek_handler(offset, whence):
                 fp.seek(offset, whence)
@@ -108,20 +201,20 @@ class IIIFService(Service):
 
             # PyVIPS returns by default the first page of the PDF
             first_page = pyvips.Image.new_from_source(source, "", access="sequential")
-            # Convert to memory to be able to return a file-like object
-            first_page_buf = io.BytesIO(first_page.write_to_memory())
-            fp.close()
-            return first_page_buf
-        elif HAS_IMAGEMAGICK:
+            first_page_data = first_page.write_to_buffer(".png")
+        elif Image is not None:
             first_page = Image(blob=fp)
             first_page_buf = io.BytesIO()
             with first_page.convert(format="png") as converted:
                 converted.save(file=first_page_buf)
-            first_page_buf.seek(0)
-            fp.close()
-            return first_page_buf
+            first_page_data = first_page_buf.getvalue()
+        else:
+            return fp
 
-        return fp
+        fp.close()
+        if cache_key:
+            self.derivatives_cache.set(cache_key, first_page_data)
+        return io.BytesIO(first_page_data)
 
     def get_file(self, identity, uuid, key=None):
         """Get the file for the given ``uuid``.
@@ -141,7 +234,7 @@ class IIIFService(Service):
         # TODO: add cache and check if the metadata is present
         return service.get_file_content(id_=id_, file_key=key, identity=identity)
 
-    def image_api(
+    def image_derivative(
         self,
         identity,
         uuid,
@@ -151,7 +244,7 @@ class IIIFService(Service):
         quality,
         image_format,
     ):
-        """Run the IIIF image API workflow.
+        """Get the derivative image of the IIIF image API workflow.
 
         :raises FileKeyNotFoundError: If the record has no file for the ``key``
         """
@@ -167,18 +260,25 @@ class IIIFService(Service):
 
         type_, id_, key = self._iiif_image_uuid(uuid)
         service = self.file_service(type_)
-        # TODO: check cache before this
         file_ = service.get_file_content(id_=id_, file_key=key, identity=identity)
-        data = self._open_image(file_)
-        # TODO: include image magic for pdf
-        image = IIIFImageAPIWrapper.open_image(data)
-        image.apply_api(
-            region=region,
-            size=size,
-            rotation=rotation,
-            quality=quality,
+        return IIIFImageDerivative(
+            self, file_, region, size, rotation, quality, image_format
         )
-        # prepare image to be serve
-        to_serve = image.serve(image_format=image_format)
-        image.close_image()
-        return to_serve
+
+    def image_api(
+        self,
+        identity,
+        uuid,
+        region,
+        size,
+        rotation,
+        quality,
+        image_format,
+    ):
+        """Run the IIIF image API workflow.
+
+        :raises FileKeyNotFoundError: If the record has no file for the ``key``
+        """
+        return self.image_derivative(
+            identity, uuid, region, size, rotation, quality, image_format
+        ).open()
@@ -3,11 +3,13 @@
 
 """IIIF Tiles generation storage."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from textwrap import wrap
 from typing import Union
 
 from flask import current_app
+from invenio_files_rest.errors import FileInstanceUnreadableError
 
 from invenio_rdm_records.records.api import RDMRecord
 from invenio_rdm_records.services.iiif.converter import (
@@ -37,6 +39,11 @@ class TilesStorage:
         """Save tiles."""
         pass
 
+    def save_many(self, record: RDMRecord, files: list, max_workers: int = 1):
+        """Save tiles of multiple files, yielding the results as they complete."""
+        for filename, file_type in files:
+            yield filename, self.save(record, filename, file_type)
+
     def open(self, record: RDMRecord, filename: str):
         """Open file in read mode."""
         pass
@@ -104,8 +111,10 @@ class LocalTilesStorage(TilesStorage):
         self._get_dir(record).mkdir(parents=True, exist_ok=True)
 
         # Open the input stream and output stream
-        with file_source[filename].open_stream("rb") as fin:
-            fout = outpath.open("w+b")
+        with (
+            file_source[filename].open_stream("rb") as fin,
+            outpath.open("w+b") as fout,
+        ):
             # Convert the file and log an error if the conversion fails
             if not self.converter.convert(fin, fout):
                 current_app.logger.info(f"Image conversion failed {record.id}")
@@ -113,6 +122,60 @@ class LocalTilesStorage(TilesStorage):
 
         return True
 
+    def save_many(self, record, files, max_workers=1):
+        """Convert and save multiple files to ptif, with a bounded pool of workers.
+
+        The conversions run in threads, since libvips releases the GIL while
+        processing images. The storages of the input files are resolved
+        beforehand, so that the workers don't access the database, and each
+        worker opens its own input stream. A file which cannot be read or
+        converted only fails its own conversion.
+
+        :param files: List of ``(filename, file_type)`` tuples.
+        :returns: Iterator of ``(filename, conversion_state)`` as they complete.
+        """
+        app = current_app._get_current_object()
+        converter = self.converter
+        self._get_dir(record).mkdir(parents=True, exist_ok=True)
+
+        def _convert(storage, outpath):
+            with app.app_context():
+                with storage.open("rb") as fin, outpath.open("w+b") as fout:
+                    return converter.convert(fin, fout)
+
+        def _log_failure(filename):
+            current_app.logger.exception(
+                "Image conversion failed.",
+                extra={"record_id": record["id"], "filename_": filename},
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for filename, file_type in files:
+                try:
+                    file_record = getattr(record, file_type)[filename]
+                    if not file_record.is_readable:
+                        raise FileInstanceUnreadableError()
+                    storage = file_record.object_version.file.storage()
+                except Exception:
+                    _log_failure(filename)
+                    yield filename, False
+                    continue
+                outpath = self._get_file_path(record, filename)
+                futures[executor.submit(_convert, storage, outpath)] = filename
+
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    conversion_state = bool(future.result())
+                except Exception:
+                    _log_failure(filename)
+                    conversion_state = False
+                else:
+                    if not conversion_state:
+                        current_app.logger.info(f"Image conversion failed {record.id}")
+                yield filename, conversion_state
+
     def open(self, record, filename):
         """Open the file in read mode."""
         return self._get_file_path(record, filename).open("rb")
@@ -4,6 +4,7 @@
 """Tasks for statistics."""
 
 from celery import shared_task
+from flask import current_app
 from invenio_db import db
 
 from invenio_rdm_records.proxies import current_rdm_records_service
@@ -14,20 +15,60 @@ from .storage import tiles_storage
 @shared_task(ignore_result=True)
 def generate_tiles(record_id, file_key, file_type):
     """Generate pyramidal TIFF."""
+    generate_record_tiles(record_id, [(file_key, file_type)])
+
+
+@shared_task(ignore_result=True)
+def generate_record_tiles(record_id, files):
+    """Generate the pyramidal TIFFs of multiple files of a record.
+
+    The files are converted in batches, by a bounded pool of workers. The status
+    of the ``.ptif`` media files is committed once before and once after each
+    batch, with the progress of the whole generation in their processor props.
+
+    :param files: List of ``(file_key, file_type)`` pairs.
+    """
     record = current_rdm_records_service.record_cls.pid.resolve(record_id)
-    status_file = record.media_files[file_key + ".ptif"]
-    status_file.processor["status"] = "processing"
-    status_file.commit()
-    db.session.commit()
-
-    conversion_state = tiles_storage.save(record, file_key, file_type)
-
-    status_file.processor["status"] = "finished" if conversion_state else "failed"
-    status_file.file.file_model.uri = str(
-        tiles_storage._get_file_path(record, file_key)
-    )
-    status_file.commit()
-    db.session.commit()
+    batch_size = current_app.config.get("IIIF_TILES_BATCH_SIZE", 100)
+    max_workers = current_app.config.get("IIIF_TILES_MAX_WORKERS", 4)
+
+    total = len(files)
+    done = 0
+    for i in range(0, total, batch_size):
+        batch = files[i : i + batch_size]
+        status_files = {
+            file_key: record.media_files[file_key + ".ptif"] for file_key, _ in batch
+        }
+        for status_file in status_files.values():
+            status_file.processor["status"] = "processing"
+            status_file.commit()
+        db.session.commit()
+
+        results = tiles_storage.save_many(record, batch, max_workers=max_workers)
+        try:
+            for file_key, conversion_state in results:
+                done += 1
+                status_file = status_files.pop(file_key)
+                status_file.processor["status"] = (
+                    "finished" if conversion_state else "failed"
+                )
+                status_file.processor.setdefault("props", {})["progress"] = {
+                    "done": done,
+                    "total": total,
+                }
+                status_file.file.file_model.uri = str(
+                    tiles_storage._get_file_path(record, file_key)
+                )
+                status_file.commit()
+        finally:
+            # don't leave the files without a result as processing
+            for status_file in status_files.values():
+                status_file.processor["status"] = "failed"
+                status_file.commit()
+            db.session.commit()
+        current_app.logger.info(
+            f"Generated tiles for {done}/{total} files of record {record_id}."
+        )
 
 
 @shared_task(
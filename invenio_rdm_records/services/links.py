@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Endpoint links expanded from precompiled URL templates.
+
+Building a URL with ``invenio_url_for`` goes through the werkzeug URL map for
+every link of every record. Instead, the links here build the URL of an
+endpoint once per application (and set of variables) with placeholder values,
+and then expand it for each record by substituting and quoting the values the
+same way werkzeug does.
+"""
+
+import re
+from urllib.parse import quote, quote_plus
+from weakref import WeakKeyDictionary
+
+from flask import current_app
+from invenio_base import invenio_url_for
+from invenio_records_resources.services import EndpointLink as BaseEndpointLink
+
+_PLACEHOLDER = "rdmlinkvar{}x"
+_PLACEHOLDER_RE = re.compile(r"rdmlinkvar(\d+)x")
+
+# Safe characters of werkzeug's ``BaseConverter.to_url`` and query encoding
+_PATH_SAFE = "!$&'()*+,/:;=@"
+_QUERY_SAFE = "!$'()*,/:;?@"
+_ANCHOR_SAFE = "%!#$&'()*+,/:;=?@"
+
+# Value used to check that a compiled template builds the same URL as werkzeug
+_PROBE = "a b/c?d=e&f+g%h#ü"
+
+
+class URLTemplate:
+    """URL of an endpoint with slots for the values of its variables."""
+
+    def __init__(self, parts, slots):
+        """Constructor.
+
+        :param parts: the literal parts of the URL, around the slots.
+        :param slots: ``(name, in_query)`` tuple of each slot.
+        """
+        self._parts = parts
+        self._slots = slots
+
+    def expand(self, values):
+        """Expand the template with the given values."""
+        url = [self._parts[0]]
+        for (name, in_query), part in zip(self._slots, self._parts[1:]):
+            value = str(values[name])
+            if in_query:
+                url.append(quote_plus(value, safe=_QUERY_SAFE))
+            else:
+                url.append(quote(value, safe=_PATH_SAFE))
+            url.append(part)
+        return "".join(url)
+
+
+def compile_url_template(endpoint, names):
+    """Compile the URL template of an endpoint for the given variable names.
+
+    Returns ``None`` if the URL cannot be built from a template, e.g. when a
+    converter of the endpoint's rule validates or transforms its values.
+    """
+    try:
+        url = invenio_url_for(
+            endpoint, **{name: _PLACEHOLDER.format(i) for i, name in enumerate(names)}
+        )
+    except Exception:
+        return None
+
+    query_start = url.find("?")
+    slots = [
+        (names[int(match.group(1))], query_start != -1 and match.start() > query_start)
+        for match in _PLACEHOLDER_RE.finditer(url)
+    ]
+    if sorted(name for name, _ in slots) != sorted(names):
+        return None
+    template = URLTemplate(_PLACEHOLDER_RE.split(url)[::2], slots)
+
+    # Check that the values are quoted the same way as werkzeug does
+    probe = {name: f"{i}{_PROBE}" for i, name in enumerate(names)}
+    try:
+        if template.expand(probe) != invenio_url_for(endpoint, **probe):
+            return None
+    except Exception:
+        return None
+    return template
+
+
+# Compiled templates per application, as some applications build the URLs of
+# the other one (e.g. UI links are built from the API application).
+_templates = WeakKeyDictionary()
+
+
+def url_for_template(endpoint, anchor=None, **values):
+    """Build the URL of an endpoint from its compiled template.
+
+    Behaves like ``invenio_url_for``, to which it falls back when the
+    endpoint's URL cannot be built from a template.
+    """
+    app = current_app._get_current_object()
+    config = app.config
+    template = None
+    if config.get("RDM_LINKS_TEMPLATES_ENABLED", True) and not any(
+        isinstance(v, (list, tuple, dict)) for v in values.values()
+    ):
+        values = {k: v for k, v in values.items() if v is not None}
+        key = (
+            endpoint,
+            tuple(values),
+            config.get("SITE_UI_URL"),
+            config.get("SITE_API_URL"),
+        )
+        app_templates = _templates.get(app)
+        if app_templates is None:
+            app_templates = _templates[app] = {}
+        if key not in app_templates:
+            app_templates[key] = compile_url_template(endpoint, key[1])
+        template = app_templates[key]
+
+    if template is None:
+        return invenio_url_for(endpoint, _anchor=anchor, **values)
+
+    url = template.expand(values)
+    if anchor is not None:
+        url = f"{url}#{quote(anchor, safe=_ANCHOR_SAFE)}"
+    return url
+
+
+class EndpointLink(BaseEndpointLink):
+    """Endpoint link expanded from a precompiled URL template."""
+
+    def expand(self, obj, context):
+        """Expand the endpoint."""
+        vars = context.copy()
+        if context.get("args"):
+            vars["args"] = context["args"].copy()
+
+        self.vars(obj, vars)
+        if self._vars_func:
+            self._vars_func(obj, vars)
+
+        values = {k: v for k, v in vars.items() if k in self._params}
+        values.update(vars.get("args", {}))
+        values = dict(sorted(values.items()))
+        return url_for_template(
+            self._endpoint, anchor=self._anchor_func(obj, vars), **values
+        )
+
+
+class RecordEndpointLink(EndpointLink):
+    """Record link expanded from a precompiled URL template."""
+
+    def __init__(self, *args, **kwargs):
+        """Constructor."""
+        super().__init__(*args, **kwargs)
+        if "pid_value" not in self._params:
+            self._params.append("pid_value")
+
+    @staticmethod
+    def vars(record, vars):
+        """Variables for the endpoint expansion."""
+        # Some records don't have record.pid.pid_value yet (e.g. drafts)
+        pid_value = getattr(record.pid, "pid_value", None)
+        if pid_value:
+            vars.update({"pid_value": pid_value})
+
+
+class FileEndpointLink(EndpointLink):
+    """File link expanded from a precompiled URL template."""
+
+    @staticmethod
+    def vars(file_record, vars):
+        """Variables for the endpoint expansion."""
+        vars.update({"key": file_record.key})
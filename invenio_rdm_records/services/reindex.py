@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Partitioned rebuild of the search indices.
+
+The records of each rebuilt index are split into ranges of ids (partitions),
+which can be indexed independently of each other, e.g. by several Celery
+workers. The partitions are indexed directly into the search engine (instead of
+going through the bulk indexing queue), optionally into a fresh index which
+replaces the current one once all its partitions are indexed.
+"""
+
+import json
+from contextlib import nullcontext
+
+from flask import current_app
+from invenio_db import db
+from invenio_records_resources.proxies import current_service_registry
+from invenio_search.engine import search
+from invenio_search.proxies import current_search, current_search_client
+from invenio_search.utils import build_alias_name, timestamp_suffix
+from sqlalchemy import func
+
+from ..records.indexer import build_index_action
+
+REBUILD_INDEX_TARGETS = {
+    "vocabularies": ("vocabularies", "indexer"),
+    "names": ("names", "indexer"),
+    "funders": ("funders", "indexer"),
+    "awards": ("awards", "indexer"),
+    "subjects": ("subjects", "indexer"),
+    "affiliations": ("affiliations", "indexer"),
+    "records": ("records", "indexer"),
+    "drafts": ("records", "draft_indexer"),
+}
+"""Indexes rebuilt by partitions, as ``target: (service id, indexer attribute)``."""
+
+
+def get_indexer(target):
+    """Get the indexer of a rebuild target."""
+    service_id, attr = REBUILD_INDEX_TARGETS[target]
+    return getattr(current_service_registry.get(service_id), attr)
+
+
+def _records_query(model_cls, *columns):
+    """Query the (not deleted) records of a model."""
+    return db.session.query(*columns).filter(model_cls.is_deleted == False)  # noqa
+
+
+def get_partitions(target, size):
+    """Split the records of a target into ranges of at most ``size`` records.
+
+    :returns: a list of ``(start, end)`` tuples of ids, where ``start`` is
+        inclusive and ``end`` exclusive (``None`` for the last partition).
+    """
+    model_cls = get_indexer(target).record_cls.model_cls
+    row_number = func.row_number().over(order_by=model_cls.id).label("row_number")
+    rows = _records_query(model_cls, model_cls.id, row_number).subquery()
+    starts = [
+        str(row.id)
+        for row in db.session.query(rows.c.id)
+        .filter((rows.c.row_number - 1) % size == 0)
+        .order_by(rows.c.id)
+    ]
+    return list(zip(starts, starts[1:] + [None]))
+
+
+def index_partition(target, start, end, index=None):
+    """Index the records of a partition.
+
+    The records are loaded and indexed in chunks of
+    ``RDM_INDEXER_PREFETCH_CHUNK_SIZE`` records. For indexers supporting it, the
+    values needed for dumping the records are prefetched per chunk.
+
+    :param index: name of the index to write to, instead of the write alias of
+        the target's index.
+    :returns: a tuple with the number of indexed records and the number of
+        records which failed to be indexed.
+    """
+    indexer = get_indexer(target)
+    record_cls = indexer.record_cls
+    model_cls = record_cls.model_cls
+    query = _records_query(model_cls, model_cls.id).filter(model_cls.id >= start)
+    if end is not None:
+        query = query.filter(model_cls.id < end)
+    ids = [row.id for row in query.order_by(model_cls.id)]
+
+    prefetch = getattr(indexer, "prefetch", None)
+    chunk_size = current_app.config["RDM_INDEXER_PREFETCH_CHUNK_SIZE"]
+    indexed = failed = 0
+    for i in range(0, len(ids), chunk_size):
+        records = record_cls.get_records(ids[i : i + chunk_size])
+        with prefetch(records) if prefetch else nullcontext():
+            actions = [
+                build_index_action(indexer, record, index=index) for record in records
+            ]
+
+        success, errors = search.helpers.bulk(
+            indexer.client,
+            actions,
+            stats_only=True,
+            raise_on_error=False,
+            request_timeout=current_app.config["INDEXER_BULK_REQUEST_TIMEOUT"],
+        )
+        if errors:
+            current_app.logger.warning(
+                f"Failed to index {errors} records of partition {start} of {target}."
+            )
+        indexed += success
+        failed += errors
+
+    return indexed, failed
+
+
+def create_rebuild_index(target):
+    """Create a fresh index to rebuild the index of a target into.
+
+    Refreshing the new index is disabled until it replaces the current index.
+
+    :returns: the name of the new index.
+    """
+    name = get_indexer(target).record_cls.index._name
+    (index, _), _ = current_search.create_index(
+        name, suffix=timestamp_suffix(), create_write_alias=False
+    )
+    current_search_client.indices.put_settings(
+        index=index, body={"index": {"refresh_interval": "-1"}}
+    )
+    return index
+
+
+def swap_index(target, index):
+    """Replace the current index of a target with a rebuilt one.
+
+    The aliases of the current index are moved to the new index, and the
+    current index is deleted, in a single atomic operation.
+    """
+    name = get_indexer(target).record_cls.index._name
+    with open(current_search.mappings[name]) as fp:
+        settings = json.load(fp).get("settings", {})
+    refresh_interval = settings.get("index", settings).get("refresh_interval")
+
+    client = current_search_client
+    client.indices.put_settings(
+        index=index, body={"index": {"refresh_interval": refresh_interval}}
+    )
+    client.indices.refresh(index=index)
+
+    alias = build_alias_name(name)
+    removals, additions = [], []
+    for old_index, info in client.indices.get(index=alias).items():
+        if old_index == index:
+            # already swapped
+            continue
+        aliases = dict(info["aliases"])
+        if old_index == alias:
+            # the index is not aliased, an alias replaces it with the same name
+            aliases[alias] = {}
+        removals.append({"remove_index": {"index": old_index}})
+        additions.extend(
+            {"add": {"index": index, "alias": alias_name, **props}}
+            for alias_name, props in aliases.items()
+        )
+    if removals:
+        client.indices.update_aliases(body={"actions": removals + additions})
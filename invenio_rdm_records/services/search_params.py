@@ -106,3 +106,15 @@ class MetricsParam(ParamInterpreter):
             if name and _type:
                 search.aggs.metric(name, _type, **kwargs)
         return search
+
+
+class ExcludeOAIMetadataParam(ParamInterpreter):
+    """Excludes the pre-rendered OAI-PMH metadata from the search results.
+
+    The metadata is only needed by the OAI-PMH server, which searches the records
+    on its own.
+    """
+
+    def apply(self, identity, search, params):
+        """Exclude the ``oai_metadata`` field from the source of the hits."""
+        return search.source(excludes=["oai_metadata"])
@@ -9,6 +9,7 @@
 """RDM Record Service."""
 
 from datetime import datetime, timezone
+from functools import cached_property, partial
 
 from flask import current_app
 from invenio_access.permissions import system_identity, system_user_id
@@ -17,9 +18,14 @@ from invenio_db import db
 from invenio_drafts_resources.services.records import RecordService
 from invenio_drafts_resources.services.records.uow import ParentRecordCommitOp
 from invenio_i18n import lazy_gettext as _
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_records_resources.services import LinksTemplate, ServiceSchemaWrapper
-from invenio_records_resources.services.errors import PermissionDeniedError
+from invenio_records_resources.services.errors import (
+    PermissionDeniedError,
+    RecordPermissionDeniedError,
+)
 from invenio_records_resources.services.uow import (
+    RecordBulkIndexOp,
     RecordCommitOp,
     RecordIndexDeleteOp,
     RecordIndexOp,
@@ -46,6 +52,7 @@ from .errors import (
     RecordDeletedException,
 )
 from .results import ParentCommunitiesExpandableField
+from .uow import RecordBulkIndexDeleteOp
 
 
 class RDMRecordService(RecordService):
@@ -186,6 +193,43 @@ class RDMRecordService(RecordService):
             links_tpl=self.links_item_tpl,
         )
 
+    @cached_property
+    def oai_schema(self):
+        """Schema for the OAI-PMH projection of records."""
+        return ServiceSchemaWrapper(
+            self, schema=partial(self.config.schema, only=self.config.oai_fields)
+        )
+
+    @cached_property
+    def oai_links_item_tpl(self):
+        """Item links template for the OAI-PMH projection of records."""
+        return LinksTemplate(
+            {
+                name: link
+                for name, link in self.config.links_item.items()
+                if name in self.config.oai_links
+            }
+        )
+
+    def oai_projection(self, identity, oai_record_source):
+        """Get the OAI-PMH projection of a record source in the OAI server.
+
+        Lightweight alternative to ``oai_result_item()``, with the same intended
+        usage: instead of the full result item, the projection only dumps the
+        fields and links that are used by the OAI-PMH metadata formats. The
+        schema and links template are built once and reused for every record.
+        The field permissions (e.g. for the files' entries) still apply.
+
+        The record is still loaded from its source and dumped with the schema, so
+        that the projection matches the result item.
+        """
+        record = self.record_cls.loads(oai_record_source)
+        projection = self.oai_schema.dump(
+            record, context=dict(identity=identity, record=record)
+        )
+        projection["links"] = self.oai_links_item_tpl.expand(identity, record)
+        return projection
+
     #
     # Deletion workflows
     #
@@ -203,6 +247,38 @@ class RDMRecordService(RecordService):
         if record.deletion_status.is_deleted:
             raise DeletionStatusException(record, RecordDeletionStatusEnum.PUBLISHED)
 
+        records, draft = self._delete_record(identity, record, data, uow=uow)
+
+        # Commit and reindex record and new latest record
+        for record_ in records:
+            uow.register(RecordCommitOp(record_, indexer=self.indexer))
+
+        # delete associated draft from index
+        if draft is not None:
+            uow.register(RecordIndexDeleteOp(draft, indexer=self.draft_indexer))
+
+        return self.result_item(
+            self,
+            identity,
+            record,
+            links_tpl=self.links_item_tpl,
+            expandable_fields=self.expandable_fields,
+            expand=expand,
+        )
+
+    def _get_draft_or_none(self, record):
+        """Get the draft associated with a record, if any."""
+        try:
+            return self.draft_cls.pid.resolve(record.pid.pid_value)
+        except NoResultFound:
+            return None
+
+    def _delete_record(self, identity, record, data, uow=None):
+        """Tombstone a record, without committing it.
+
+        Returns the records to commit and reindex, and the draft of the record to
+        delete from the index, if any.
+        """
         # Load tombstone data with the schema
         data, errors = self.schema_tombstone.load(
             data,
@@ -219,7 +295,7 @@ class RDMRecordService(RecordService):
             "delete_record", identity, data=data, record=record, uow=uow
         )
 
-        new_record_latest_version = None
+        records = [record]
         if record.versions.is_latest is True:
             # set latest to the previous non deleted record
             new_record_latest_version = (
@@ -227,32 +303,104 @@ class RDMRecordService(RecordService):
             )
             if new_record_latest_version:
                 new_record_latest_version.versions.set_latest()
+                records.append(new_record_latest_version)
 
-        # Commit and reindex record
-        uow.register(RecordCommitOp(record, indexer=self.indexer))
+        return records, self._get_draft_or_none(record)
 
-        # delete associated draft from index
-        try:
-            draft = self.draft_cls.pid.resolve(id_)
-            uow.register(RecordIndexDeleteOp(draft, indexer=self.draft_indexer))
-        except NoResultFound:
-            pass
+    def _restore_record(self, identity, record, uow=None):
+        """Restore a record, without committing it.
 
-        # Commit and reindex new latest record
-        if new_record_latest_version:
-            uow.register(
-                RecordCommitOp(new_record_latest_version, indexer=self.indexer)
-            )
+        Returns the records to commit and reindex, and the draft of the record to
+        reindex, if any.
+        """
+        # Run components
+        self.run_components("restore_record", identity, record=record, uow=uow)
 
-        return self.result_item(
-            self,
-            identity,
-            record,
-            links_tpl=self.links_item_tpl,
-            expandable_fields=self.expandable_fields,
-            expand=expand,
+        # set latest to the previous non deleted record
+        latest_record_version = self.record_cls.get_latest_published_by_parent(
+            record.parent
         )
 
+        if not latest_record_version:
+            # if all records were deleted then make the restored record latest
+            record.versions.set_latest()
+        elif record.versions.index > latest_record_version.versions.index:
+            # set current restored record as latest
+            record.versions.set_latest()
+
+        records = [record]
+        # the old latest record needs to be reindexed as well
+        if latest_record_version and record.id != latest_record_version.id:
+            records.append(latest_record_version)
+
+        return records, self._get_draft_or_none(record)
+
+    @unit_of_work()
+    def bulk_delete_records(self, identity, record_ids, data, uow=None):
+        """(Soft) delete published records in bulk.
+
+        The records are committed in the same unit of work and reindexed through
+        the bulk indexing queues. Records which are already deleted are skipped,
+        but reindexed to make sure that the search is up-to-date.
+
+        :param record_ids: The UUIDs of the records to delete.
+        :returns: The number of deleted records.
+        """
+        deleted = 0
+        to_index, drafts = {}, []
+        for record in self.record_cls.get_records(record_ids):
+            to_index[record.id] = None
+            if record.deletion_status.is_deleted:
+                continue
+
+            self.require_permission(identity, "delete", record=record)
+            records, draft = self._delete_record(identity, record, data, uow=uow)
+            for record_ in records:
+                uow.register(RecordCommitOp(record_))
+                to_index[record_.id] = None
+            if draft is not None:
+                drafts.append(draft.id)
+            deleted += 1
+
+        uow.register(RecordBulkIndexOp(list(to_index), indexer=self.indexer))
+        if drafts:
+            uow.register(RecordBulkIndexDeleteOp(drafts, indexer=self.draft_indexer))
+
+        return deleted
+
+    @unit_of_work()
+    def bulk_restore_records(self, identity, record_ids, uow=None):
+        """Restore (soft) deleted records in bulk.
+
+        The records are committed in the same unit of work and reindexed through
+        the bulk indexing queues. Records which are not deleted are skipped, but
+        reindexed to make sure that the search is up-to-date.
+
+        :param record_ids: The UUIDs of the records to restore.
+        :returns: The number of restored records.
+        """
+        restored = 0
+        to_index, drafts = {}, []
+        for record in self.record_cls.get_records(record_ids):
+            to_index[record.id] = None
+            if record.deletion_status != RecordDeletionStatusEnum.DELETED:
+                continue
+
+            self.require_permission(identity, "delete", record=record)
+            records, draft = self._restore_record(identity, record, uow=uow)
+            for record_ in records:
+                uow.register(RecordCommitOp(record_))
+                to_index[record_.id] = None
+            if draft is not None:
+                drafts.append(draft.id)
+            restored += 1
+
+        uow.register(RecordBulkIndexOp(list(to_index), indexer=self.indexer))
+        if drafts:
+            uow.register(RecordBulkIndexOp(drafts, indexer=self.draft_indexer))
+
+        return restored
+
     @unit_of_work()
     def request_deletion(self, identity, id_, data=None, uow=None, **kwargs):
         """Request deletion of a record."""
@@ -410,34 +558,15 @@ class RDMRecordService(RecordService):
         # Check permissions
         self.require_permission(identity, "delete", record=record)
 
-        # Run components
-        self.run_components("restore_record", identity, record=record, uow=uow)
+        records, draft = self._restore_record(identity, record, uow=uow)
 
-        # set latest to the previous non deleted record
-        latest_record_version = self.record_cls.get_latest_published_by_parent(
-            record.parent
-        )
-
-        if not latest_record_version:
-            # if all records were deleted then make the restored record latest
-            record.versions.set_latest()
-        elif record.versions.index > latest_record_version.versions.index:
-            # set current restored record as latest
-            record.versions.set_latest()
-
-        # Commit and reindex record
-        uow.register(RecordCommitOp(record, indexer=self.indexer))
+        # Commit and reindex record and old latest record
+        for record_ in records:
+            uow.register(RecordCommitOp(record_, indexer=self.indexer))
 
         # reindex associated draft
-        try:
-            draft = self.draft_cls.pid.resolve(id_)
+        if draft is not None:
             uow.register(RecordIndexOp(draft, indexer=self.draft_indexer))
-        except NoResultFound:
-            pass
-
-        # commit and reindex the old latest record
-        if latest_record_version and record.id != latest_record_version.id:
-            uow.register(RecordCommitOp(latest_record_version, indexer=self.indexer))
 
         return self.result_item(
             self,
@@ -670,7 +799,20 @@ class RDMRecordService(RecordService):
     def read(self, identity, id_, expand=False, include_deleted=False):
         """Retrieve a record."""
         record = self.record_cls.pid.resolve(id_)
-        result = super().read(identity, id_, expand=expand)
+        try:
+            self.require_permission(identity, "read", record=record)
+        except PermissionDeniedError:
+            raise RecordPermissionDeniedError(action_name="read", record=record)
+        self.run_components("read", identity, record=record)
+        result = self.result_item(
+            self,
+            identity,
+            record,
+            links_tpl=self.links_item_tpl,
+            expandable_fields=self.expandable_fields,
+            nested_links_item=getattr(self.config, "nested_links_item", None),
+            expand=expand,
+        )
 
         if not include_deleted and record.deletion_status.is_deleted:
             raise RecordDeletedException(record, result_item=result)
@@ -685,6 +827,44 @@ class RDMRecordService(RecordService):
 
         return result
 
+    def get_unmodified_revision_id(self, identity, id_, revision_ids):
+        """Get the revision id of a published record, if it is one of the given ones.
+
+        Meant for conditional requests: the revision and deletion status of the
+        record are fetched with a single query, and the record is only loaded
+        to check the read permission if its revision matches.
+
+        Returns ``None`` if the record is modified, not found, deleted or if it
+        cannot be read, in which case it should be read as usual.
+        """
+        model_cls = self.record_cls.model_cls
+        row = (
+            db.session.query(
+                model_cls.id, model_cls.version_id, model_cls.deletion_status
+            )
+            .join(
+                PersistentIdentifier, PersistentIdentifier.object_uuid == model_cls.id
+            )
+            .filter(
+                PersistentIdentifier.pid_type == "recid",
+                PersistentIdentifier.pid_value == id_,
+                PersistentIdentifier.status == PIDStatus.REGISTERED,
+                model_cls.is_deleted == False,  # noqa
+            )
+            .one_or_none()
+        )
+        if row is None or row.deletion_status != RecordDeletionStatusEnum.PUBLISHED:
+            return None
+        # the revision id of a record is its version id - 1
+        revision_id = row.version_id - 1
+        if revision_id not in revision_ids:
+            return None
+
+        record = self.record_cls.get_record(row.id)
+        if not self.check_permission(identity, "read", record=record):
+            return None
+        return revision_id
+
     def read_draft(self, identity, id_, expand=False):
         """Retrieve a draft of a record.
 
@@ -3,25 +3,25 @@
 
 """Storage Service."""
 
-import logging
 from math import ceil
 
 from flask import current_app
-from invenio_access.permissions import system_identity
 from invenio_accounts.models import User
 from invenio_db import db
 from invenio_files_rest.models import Bucket
-from invenio_search.engine import dsl
-from sqlalchemy import func
+from sqlalchemy import exists, func, literal
 
 from invenio_rdm_records.records.models import (
     RDMDraftMetadata,
+    RDMParentMetadata,
     RDMRecordMetadata,
     RDMRecordQuota,
     RDMUserQuota,
+    RDMVersionsState,
+)
+from invenio_rdm_records.records.systemfields.deletion_status import (
+    RecordDeletionStatusEnum,
 )
-
-logger = logging.getLogger(__name__)
 
 
 class StorageService:
@@ -123,102 +123,90 @@ class StorageService:
             0,
         )
 
-    def _search_user_resources(self, user, drafts=False):
-        """Fetch user records or drafts."""
-        filters = [dsl.Q("term", **{"parent.access.owned_by.user": user.id})]
+    def _usage_query(self, user_id, default_quota, draft=False):
+        """Query the usage of the records or drafts with additional quota.
+
+        The quota of the parent and the size of the bucket are joined in the
+        database, so that no record needs to be loaded.
+        """
+        model = RDMDraftMetadata if draft else RDMRecordMetadata
+        query = (
+            db.session.query(
+                model.json["id"].as_string().label("id"),
+                model.json["metadata"]["title"].as_string().label("title"),
+                model.json["metadata"]["publication_date"]
+                .as_string()
+                .label("publication_date"),
+                literal(not draft).label("is_published"),
+                RDMRecordQuota.quota_size.label("quota"),
+                func.coalesce(Bucket.size, 0).label("used_bytes"),
+            )
+            .join(RDMParentMetadata, RDMParentMetadata.id == model.parent_id)
+            .join(RDMRecordQuota, RDMRecordQuota.parent_id == model.parent_id)
+            .outerjoin(Bucket, Bucket.id == model.bucket_id)
+            .filter(
+                RDMParentMetadata.json["access"]["owned_by"]["user"].as_string()
+                == str(user_id),
+                RDMRecordQuota.quota_size > default_quota,
+                model.json.isnot(None),
+            )
+        )
 
-        if drafts:
-            filters.append(dsl.Q("term", is_published=False))
-            search_fn = self.records_service.search_drafts
+        if draft:
+            # only the drafts which were never published
+            query = query.filter(
+                ~exists().where(RDMRecordMetadata.id == RDMDraftMetadata.id)
+            )
         else:
-            search_fn = self.records_service.search
-
-        return search_fn(
-            system_identity,
-            extra_filter=dsl.Q("bool", must=filters),
-        )
+            # only the latest version of each published record
+            query = query.join(
+                RDMVersionsState, RDMVersionsState.latest_id == RDMRecordMetadata.id
+            ).filter(
+                RDMRecordMetadata.deletion_status == RecordDeletionStatusEnum.PUBLISHED
+            )
 
-    def _resolve_records_and_quotas(self, items, draft=False):
-        """Resolve search hits and fetch quotas."""
-        cls = (
-            self.records_service.draft_cls if draft else self.records_service.record_cls
-        )
+        return query
 
-        records = []
-        parent_ids = set()
-
-        for item in items:
-            try:
-                record = cls.pid.resolve(item["id"], registered_only=not draft)
-                records.append((item, record))
-                parent_ids.add(record.parent.id)
-            except Exception as e:
-                logger.warning("Failed to resolve record %s: %s", item.get("id"), e)
-
-        quotas = {
-            q.parent_id: q.quota_size
-            for q in RDMRecordQuota.query.filter(
-                RDMRecordQuota.parent_id.in_(parent_ids)
-            ).all()
-        }
+    def get_user_storage_usage(self, user, include_drafts=True):
+        """Return raw storage usage data."""
+        user_id = user.id if isinstance(user, User) else user
+        default_quota = self.default_quota(user)
 
-        return records, quotas
+        query = self._usage_query(user_id, default_quota)
+        if include_drafts:
+            query = query.union_all(
+                self._usage_query(user_id, default_quota, draft=True)
+            )
 
-    def _compute_usage(self, user, records, quotas):
-        """Compute quota usage."""
-        results = []
+        entries = []
         total_extra = 0
         total_used = 0
-        default_quota = self.default_quota(user)
-        for item, record in records:
-            pid = record.parent.id
-            quota = quotas.get(pid, default_quota)
-
-            if quota <= default_quota:
-                continue
-
-            used_bytes = record.files.total_bytes or 0
-            extra_quota = quota - default_quota
+        for row in query.yield_per(1000):
+            used_bytes = int(row.used_bytes)
+            extra_quota = row.quota - default_quota
             excess_usage = max(used_bytes - default_quota, 0)
             additional_used = min(excess_usage, extra_quota)
 
             total_extra += extra_quota
             total_used += additional_used
 
-            results.append(
+            entries.append(
                 {
-                    "item": item,
-                    "record": record,
-                    "quota": quota,
+                    "id": row.id,
+                    "title": row.title,
+                    "publication_date": row.publication_date,
+                    "is_published": row.is_published,
+                    "quota": row.quota,
                     "used_bytes": used_bytes,
                     "extra_quota": extra_quota,
                     "additional_used": additional_used,
                 }
             )
 
-        return results, total_extra, total_used
-
-    def _process_resources(self, user, items, draft=False):
-        """Resolve + compute in one step."""
-        resolved, quotas = self._resolve_records_and_quotas(items, draft=draft)
-        return self._compute_usage(user, resolved, quotas)
-
-    def get_user_storage_usage(self, user, include_drafts=True):
-        """Return raw storage usage data."""
-        record_data, extra_r, used_r = self._process_resources(
-            user, self._search_user_resources(user)
-        )
-
-        draft_data, extra_d, used_d = [], 0, 0
-        if include_drafts:
-            draft_data, extra_d, used_d = self._process_resources(
-                user, self._search_user_resources(user, drafts=True), draft=True
-            )
-        default_quota = self.default_quota(user)
         return {
             "default_quota": default_quota,
             "max_additional_quota": self.max_additional_quota,
-            "total_extra": extra_r + extra_d,
-            "total_used": used_r + used_d,
-            "entries": record_data + draft_data,
+            "total_extra": total_extra,
+            "total_used": total_used,
+            "entries": entries,
         }
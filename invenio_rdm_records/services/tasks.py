@@ -5,12 +5,15 @@
 """Celery tasks."""
 
 import math
+import time
 from datetime import datetime, timedelta, timezone
 
 from celery import shared_task
 from celery.schedules import crontab
 from flask import current_app
 from invenio_access.permissions import system_identity
+from invenio_notifications.models import Notification
+from invenio_notifications.proxies import current_notifications_manager
 from invenio_search.engine import dsl
 from invenio_search.proxies import current_search_client
 from invenio_search.utils import prefix_index
@@ -20,6 +23,7 @@ from invenio_rdm_records.services.signals import post_publish_signal
 
 from ..proxies import current_rdm_records
 from .errors import EmbargoNotLiftedError
+from .reindex import index_partition
 
 # runs every hour at minute 10 for a consistent offset from process and aggregate
 # event statistics.
@@ -54,9 +58,31 @@ def update_expired_embargos():
     current_app.logger.info(f"Lifted {lifted_embargoes} embargoes")
 
 
+def _reindex_stats_parents(parent_ids):
+    """Reindex all versions of the given parent records."""
+    records_q = dsl.Q("terms", parent__id=parent_ids)
+    current_rdm_records.records_service.reindex(
+        params={"allversions": True},
+        identity=system_identity,
+        search_query=records_q,
+    )
+
+
 @shared_task(ignore_result=True)
-def reindex_stats(stats_indices):
-    """Reindex the documents where the stats have changed."""
+def reindex_stats(stats_indices, chunk_size=None):
+    """Reindex the documents where the stats have changed.
+
+    The stats events are streamed in the order in which they were updated, and
+    the affected parent records are deduplicated in bounded chunks. The records
+    of each chunk are queued for reindexing, and only then the bookmark is moved
+    forward. This way, a run that got interrupted or failed resumes after the
+    last reindexed chunk rather than from the start, and a failed chunk is
+    retried by the next run.
+
+    A parent whose stats changed in several chunks is reindexed (and counted)
+    once per chunk.
+    """
+    chunk_size = chunk_size or current_app.config["RDM_STATS_REINDEX_CHUNK_SIZE"]
     bm = BookmarkAPI(current_search_client, "stats_reindex", "day")
     last_run = bm.get_bookmark()
     if not last_run:
@@ -65,32 +91,121 @@ def reindex_stats(stats_indices):
     reindex_start_time = datetime.now(timezone.utc).isoformat()
     indices = ",".join(map(lambda x: prefix_index(x) + "*", stats_indices))
 
-    all_parents = set()
-    query = dsl.Search(
-        using=current_search_client,
-        index=indices,
-    ).filter({"range": {"updated_timestamp": {"gte": last_run}}})
+    query = (
+        dsl.Search(
+            using=current_search_client,
+            index=indices,
+        )
+        .filter(
+            {
+                "range": {
+                    "updated_timestamp": {"gte": last_run, "lt": reindex_start_time}
+                }
+            }
+        )
+        .source(["parent_recid", "updated_timestamp"])
+        .sort("updated_timestamp")
+        .params(preserve_order=True)
+    )
+
+    start = time.monotonic()
+    num_events = num_parents = num_chunks = 0
+    parents = set()
+
+    def reindex_chunk(checkpoint):
+        nonlocal num_parents, num_chunks
+        _reindex_stats_parents(list(parents))
+        num_parents += len(parents)
+        num_chunks += 1
+        parents.clear()
+        if checkpoint:
+            bm.set_bookmark(checkpoint)
+
+        elapsed = time.monotonic() - start
+        current_app.logger.info(
+            "Stats reindex: reindexed chunk %d (%d events, %d parents in %.1fs, "
+            "%.1f events/s)",
+            num_chunks,
+            num_events,
+            num_parents,
+            elapsed,
+            num_events / elapsed if elapsed else 0,
+        )
 
     for result in query.scan():
-        parent_id = result.parent_recid
-        all_parents.add(parent_id)
-
-    if all_parents:
-        all_parents_list = list(all_parents)
-        step = 10000
-        end = len(list(all_parents))
-        for i in range(0, end, step):
-            records_q = dsl.Q("terms", parent__id=all_parents_list[i : i + step])
-            current_rdm_records.records_service.reindex(
-                params={"allversions": True},
-                identity=system_identity,
-                search_query=records_q,
-            )
+        num_events += 1
+        parents.add(result.parent_recid)
+        if len(parents) >= chunk_size:
+            # events with the same timestamp might still follow, but these will be
+            # picked up again since the bookmark is slightly rewound when fetched
+            reindex_chunk(checkpoint=result.updated_timestamp)
+
+    if parents:
+        reindex_chunk(checkpoint=None)
+
     bm.set_bookmark(reindex_start_time)
-    return "%d documents reindexed" % len(all_parents)
+    return "%d parents reindexed in %d chunks (counted once per chunk)" % (
+        num_parents,
+        num_chunks,
+    )
+
+
+@shared_task
+def reindex_partition(target, start, end, index=None):
+    """Index a partition of the records of a rebuilt index.
+
+    Returns the number of indexed and failed records, to report the rebuild's
+    progress.
+    """
+    return index_partition(target, start, end, index=index)
 
 
 @shared_task(ignore_result=True)
 def send_post_published_signal(pid):
     """Sends a signal for a published record."""
     post_publish_signal.send(current_app._get_current_object(), pid=pid)
+
+
+@shared_task(ignore_result=True)
+def broadcast_notifications(notifications):
+    """Broadcast a batch of notifications via the current ``NotificationManager``.
+
+    The ``notifications`` argument is expected to be a list of dictionaries, as
+    dumped by ``Notification.dumps()``.
+    """
+    for notification in notifications:
+        current_notifications_manager.handle_broadcast(Notification(**notification))
+
+
+@shared_task(ignore_result=True)
+def bulk_add_to_community(community_id, record_ids, set_default=False):
+    """Add records to a community, committing them in chunks.
+
+    Each chunk is added in its own transaction, so that large imports make
+    progress even if some chunk fails.
+    """
+    service = current_rdm_records.record_communities_service
+    chunk_size = current_app.config["RDM_RECORD_COMMUNITIES_BULK_ADD_CHUNK_SIZE"]
+    total = len(record_ids)
+    for i in range(0, total, chunk_size):
+        chunk = record_ids[i : i + chunk_size]
+        try:
+            errors = service.bulk_add(
+                system_identity, community_id, chunk, set_default=set_default
+            )
+        except Exception:
+            current_app.logger.exception(
+                "Failed to add records %s-%s to community %s.",
+                i,
+                i + len(chunk),
+                community_id,
+            )
+            continue
+
+        current_app.logger.info(
+            "Added %s/%s records to community %s (%s not added).",
+            i + len(chunk),
+            total,
+            community_id,
+            len(errors),
+        )
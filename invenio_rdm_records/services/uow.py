@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Unit of work operations for the RDM services."""
+
+from invenio_records_resources.services.uow import Operation
+
+
+class RecordBulkIndexDeleteOp(Operation):
+    """Record bulk index deletion operation."""
+
+    def __init__(self, records_iter, indexer=None):
+        """Initialize the records bulk index deletion operation.
+
+        :param records_iter: iterable of record ids.
+        :param indexer: indexer instance.
+        """
+        super().__init__()
+        self._records_iter = records_iter
+        self._indexer = indexer
+
+    def on_post_commit(self, uow):
+        """Run bulk index deletion as one of the last operations."""
+        if self._indexer is not None:
+            self._indexer.bulk_delete(self._records_iter)
@@ -8,6 +8,7 @@
 
 from flask import Blueprint, abort, current_app, g, render_template
 from flask_login import current_user, login_required
+from invenio_base import invenio_url_for
 from invenio_records_resources.services.files.transfer import constants
 
 from .proxies import current_rdm_records_storage_service
@@ -128,20 +129,23 @@ def _format_storage(data):
     rows = []
 
     for e in data["entries"]:
-        item = e["item"]
-        record = e["record"]
+        endpoint = (
+            "invenio_app_rdm_records.record_detail"
+            if e["is_published"]
+            else "invenio_app_rdm_records.deposit_edit"
+        )
 
         rows.append(
             {
-                "title": item.get("metadata", {}).get("title", "Empty title"),
-                "url": item["links"]["self_html"],
+                "title": e["title"] or "Empty title",
+                "url": invenio_url_for(endpoint, pid_value=e["id"]),
                 "additional_quota": round(e["extra_quota"] / BYTES_TO_GB, 1),
                 "used": round(e["used_bytes"] / BYTES_TO_GB, 1),
                 "total": round(
                     (data["default_quota"] + e["extra_quota"]) / BYTES_TO_GB, 1
                 ),
-                "date": item.get("metadata", {}).get("publication_date", ""),
-                "status": "Draft" if not record.is_published else "Published",
+                "date": e["publication_date"] or "",
+                "status": "Published" if e["is_published"] else "Draft",
             }
         )
 
@@ -4,6 +4,10 @@
 
 """Tests for the CLI."""
 
+import json
+
+import click
+import pytest
 from invenio_access.permissions import system_identity
 from invenio_communities import current_communities
 from invenio_communities.communities.records.api import Community
@@ -12,8 +16,11 @@ from invenio_requests import current_requests_service
 from invenio_requests.records import Request
 
 from invenio_rdm_records.cli import (
+    _rebuild_index_partitioned,
     create_records_custom_field,
     custom_field_exists_in_records,
+    rebuild_index,
+    update_oai_mapping,
 )
 from invenio_rdm_records.fixtures.demo import create_fake_community, create_fake_record
 from invenio_rdm_records.fixtures.tasks import (
@@ -26,6 +33,7 @@ from invenio_rdm_records.fixtures.tasks import (
 from invenio_rdm_records.proxies import current_rdm_records_service
 from invenio_rdm_records.records import RDMDraft, RDMRecord
 from invenio_rdm_records.requests import CommunitySubmission
+from invenio_rdm_records.services.tasks import reindex_partition
 
 
 def test_create_fake_demo_draft_record(
@@ -138,3 +146,135 @@ def test_create_records_custom_fields(app, location, db, search_clear, cli_runne
     result = cli_runner(custom_field_exists_in_records, "-f", "unknownfield")
     assert result.exit_code == 0
     assert "Field unknownfield does not exist" in result.output
+
+
+def test_update_oai_mapping(app, location, db, search_clear, cli_runner):
+    """Assert that the pre-rendered OAI-PMH metadata field is added to the index."""
+    result = cli_runner(update_oai_mapping)
+    assert result.exit_code == 0
+
+    mapping = list(RDMRecord.index.get_mapping().values())[0]["mappings"]
+    assert mapping["properties"]["oai_metadata"] == {
+        "type": "object",
+        "enabled": False,
+    }
+
+
+def test_rebuild_index_partitioned_resumes(base_app, mocker, tmp_path):
+    """Assert that a partitioned rebuild resumes after the finished partitions."""
+    state_file = tmp_path / "rebuild-index.json"
+    state_file.write_text(
+        json.dumps(
+            {
+                "options": {
+                    "targets": ["records", "drafts"],
+                    "partition_size": 2,
+                    "swap": True,
+                },
+                "progress": {
+                    "records": {
+                        "partitions": [["a", "b"], ["b", "c"], ["c", None]],
+                        "index": "rdmrecords-records-new",
+                        "done": [0],
+                        "finished": False,
+                    }
+                },
+            }
+        )
+    )
+    index_partition = mocker.patch(
+        "invenio_rdm_records.cli.index_partition", return_value=(10, 0)
+    )
+    get_partitions = mocker.patch(
+        "invenio_rdm_records.cli.get_partitions", return_value=[["x", None]]
+    )
+    mocker.patch(
+        "invenio_rdm_records.cli.create_rebuild_index", return_value="drafts-new"
+    )
+    swap_index = mocker.patch("invenio_rdm_records.cli.swap_index")
+
+    with base_app.app_context():
+        # the rebuild can only be resumed with the same options
+        with pytest.raises(click.ClickException):
+            _rebuild_index_partitioned(
+                ["records", "drafts"],
+                3,
+                workers=0,
+                swap=True,
+                state_file=str(state_file),
+            )
+        index_partition.assert_not_called()
+
+        _rebuild_index_partitioned(
+            ["records", "drafts"], 2, workers=0, swap=True, state_file=str(state_file)
+        )
+
+    assert [c.args for c in index_partition.call_args_list] == [
+        ("records", "b", "c"),
+        ("records", "c", None),
+        ("drafts", "x", None),
+    ]
+    get_partitions.assert_called_once_with("drafts", 2)
+    assert [c.args for c in swap_index.call_args_list] == [
+        ("records", "rdmrecords-records-new"),
+        ("drafts", "drafts-new"),
+    ]
+    assert not state_file.exists()
+
+
+def test_rebuild_index_partitioned_failed_partitions(base_app, mocker, tmp_path):
+    """Assert that partitions with failed documents are retried before swapping."""
+    state_file = tmp_path / "rebuild-index.json"
+    index_partition = mocker.patch(
+        "invenio_rdm_records.cli.index_partition", side_effect=[(2, 0), (1, 1)]
+    )
+    mocker.patch(
+        "invenio_rdm_records.cli.get_partitions",
+        return_value=[["a", "c"], ["c", None]],
+    )
+    mocker.patch(
+        "invenio_rdm_records.cli.create_rebuild_index", return_value="records-new"
+    )
+    swap_index = mocker.patch("invenio_rdm_records.cli.swap_index")
+
+    with base_app.app_context():
+        with pytest.raises(click.ClickException):
+            _rebuild_index_partitioned(
+                ["records"], 2, workers=0, swap=True, state_file=str(state_file)
+            )
+        swap_index.assert_not_called()
+        progress = json.loads(state_file.read_text())["progress"]["records"]
+        assert progress["done"] == [0]
+        assert progress["failed"] == {"1": 1}
+
+        index_partition.side_effect = [(2, 0)]
+        _rebuild_index_partitioned(
+            ["records"], 2, workers=0, swap=True, state_file=str(state_file)
+        )
+
+    assert [c.args for c in index_partition.call_args_list] == [
+        ("records", "a", "c"),
+        ("records", "c", None),
+        ("records", "c", None),
+    ]
+    swap_index.assert_called_once_with("records", "records-new")
+    assert not state_file.exists()
+
+
+def test_rebuild_index_partitioned_requires_result_backend(base_app, mocker):
+    """Assert that indexing the partitions with workers needs a result backend."""
+    conf = reindex_partition.app.conf
+    result_backend = conf.result_backend
+    rebuild = mocker.patch("invenio_rdm_records.cli._rebuild_index_partitioned")
+
+    conf.result_backend = "disabled"
+    try:
+        result = base_app.test_cli_runner().invoke(
+            rebuild_index, ["--partitioned", "--workers", "2"]
+        )
+    finally:
+        conf.result_backend = result_backend
+
+    assert result.exit_code != 0
+    assert "result backend" in result.output
+    rebuild.assert_not_called()
@@ -53,6 +53,26 @@ def test_load_languages(app, db, search_clear):
     assert item.id == "aae"
 
 
+def test_load_languages_in_bulk(app, db, search_clear, monkeypatch):
+    monkeypatch.setitem(app.config, "RDM_FIXTURES_VOCABULARIES_CHUNK_SIZE", 2)
+    id_ = "languages"
+    languages = GenericVocabularyEntry(
+        Path(__file__).parent / "data",
+        id_,
+        {"pid-type": "lng", "data-file": "vocabularies/languages.yaml"},
+    )
+
+    languages.load(system_identity, delay=False, bulk=True)
+    # Loading again updates the existing entries
+    languages.load(system_identity, delay=False, bulk=True)
+    vocabulary_service.indexer.refresh()
+
+    item = vocabulary_service.read(system_identity, (id_, "aae"))
+    assert item.id == "aae"
+    results = vocabulary_service.search(system_identity, type=id_)
+    assert results.total == 5
+
+
 def test_load_resource_types(app, db, search_clear):
     id_ = "resourcetypes"
     resource_types = GenericVocabularyEntry(
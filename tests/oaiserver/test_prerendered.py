@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the pre-rendered OAI-PMH metadata."""
+
+from flask import g
+from flask_principal import Identity
+from lxml import etree
+
+from invenio_rdm_records.oai import (
+    anonymous_identity,
+    oaiid_fetcher,
+    prerender_metadata,
+    prerendered,
+)
+
+rendered = []
+
+
+@prerendered
+def fake_etree(pid, record):
+    """Fake metadata format, keeping track of its live renderings."""
+    rendered.append(pid.pid_value)
+    return etree.Element("fake", id=record["_source"]["id"])
+
+
+def test_prerendered_metadata(base_app):
+    source = {
+        "id": "abcd-1234",
+        "version_id": 2,
+        "pids": {"oai": {"identifier": "oai:inveniordm:abcd-1234"}},
+        "access": {"record": "public"},
+        "is_deleted": False,
+    }
+    base_app.config["OAISERVER_METADATA_FORMATS"] = {
+        "fake_prerendered": {"serializer": (f"{__name__}:fake_etree", {})},
+    }
+    base_app.config["RDM_OAI_PMH_PRERENDER_FORMATS"] = ["fake_prerendered"]
+
+    with base_app.test_request_context():
+        source["oai_metadata"] = prerender_metadata(source)
+        assert set(source["oai_metadata"]["formats"]) == {f"{__name__}:fake_etree"}
+        assert rendered == ["oai:inveniordm:abcd-1234"]
+        pid = oaiid_fetcher(None, source)
+
+        # anonymous harvesters are served the pre-rendered metadata
+        with anonymous_identity():
+            xml = fake_etree(pid, {"_source": source})
+        assert etree.tostring(xml) == b'<fake id="abcd-1234"/>'
+        assert len(rendered) == 1
+
+        # metadata pre-rendered differently is rendered live
+        oai_metadata = {**source["oai_metadata"], "key": "0.0.1:1:fake_prerendered"}
+        with anonymous_identity():
+            fake_etree(pid, {"_source": {**source, "oai_metadata": oai_metadata}})
+        assert len(rendered) == 2
+
+        base_app.config["RDM_OAI_PMH_PRERENDER_FORMATS"] = ["fake_prerendered", "x"]
+        with anonymous_identity():
+            fake_etree(pid, {"_source": source})
+        assert len(rendered) == 3
+        base_app.config["RDM_OAI_PMH_PRERENDER_FORMATS"] = ["fake_prerendered"]
+
+        # authenticated users get the metadata rendered for their identity
+        g.identity = Identity(1)
+        fake_etree(pid, {"_source": source})
+        assert len(rendered) == 4
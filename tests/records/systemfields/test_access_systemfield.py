@@ -17,10 +17,15 @@ from invenio_rdm_records.records.systemfields.access import (
     Embargo,
     Grant,
     Grants,
+    Link,
+    Links,
     Owner,
     Protection,
     RecordAccess,
 )
+from invenio_rdm_records.records.systemfields.access.links import (
+    resolved_links_cache,
+)
 
 #
 # Protection
@@ -398,3 +403,39 @@ def test_access_field_update_owner(running_app, minimal_record, parent, users):
     parent.commit()
 
     assert new_owner == new_owner
+
+
+#
+# Secret links
+#
+
+
+def test_links_needs_cached(base_app, mocker):
+    expired = datetime.now(timezone.utc) - timedelta(days=1)
+    links = Links()
+    for id_, permission_level, expires_at in [
+        ("a", "view", None),
+        ("b", "edit", None),
+        ("c", "view", expired),
+    ]:
+        link = Link({"id": id_})
+        link._entity = mocker.Mock(
+            id=id_, permission_level=permission_level, expires_at=expires_at
+        )
+        links.add(link)
+    resolve_all = mocker.spy(links, "resolve_all")
+    resolved_links_cache.clear()
+
+    with base_app.app_context():
+        needs = links.needs("view", cache_key=("parent", 1))
+        assert [n.value for n in needs] == ["a"]
+        assert [n.value for n in links.needs("edit", cache_key=("parent", 1))] == ["b"]
+        # the links were resolved once for the request
+        assert resolve_all.call_count == 1
+
+    with base_app.app_context():
+        # ... and kept across requests for the same parent revision
+        links.needs("view", cache_key=("parent", 1))
+        assert resolve_all.call_count == 1
+        links.needs("view", cache_key=("parent", 2))
+        assert resolve_all.call_count == 2
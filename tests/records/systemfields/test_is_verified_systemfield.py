@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the is_verified field."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from invenio_accounts.models import User
+
+from invenio_rdm_records.records.api import RDMParent
+from invenio_rdm_records.records.systemfields import IsVerifiedField
+from invenio_rdm_records.records.systemfields.access import Owner
+
+
+def _parent(owner):
+    """Parent record owned by the given owner."""
+    return SimpleNamespace(access=SimpleNamespace(owner=Owner(owner)))
+
+
+def test_is_verified_prefetch(base_app, mocker):
+    """Test the verification status of the owners fetched per batch."""
+    fetch = mocker.patch.object(
+        IsVerifiedField,
+        "_fetch_verified_owners",
+        side_effect=lambda ids: {str(i): str(i) == "1" for i in ids},
+    )
+    field = RDMParent.is_verified
+
+    with base_app.app_context():
+        with IsVerifiedField.prefetch([1, 2, 2, "system", None]):
+            assert field.calculate(_parent({"user": 1})) is True
+            assert field.calculate(_parent({"user": 1})) is True
+            assert field.calculate(_parent({"user": 2})) is False
+            assert field.calculate(_parent({"user": "system"})) is True
+            # owners which were not prefetched are fetched once
+            assert field.calculate(_parent({"user": 3})) is False
+            assert field.calculate(_parent({"user": 3})) is False
+
+            # the cache is invalidated when the verification changes
+            user = User(id=2)
+            user.verified_at = datetime.now(timezone.utc)
+            assert field.calculate(_parent({"user": 2})) is False
+
+    assert [sorted(c.args[0]) for c in fetch.call_args_list] == [
+        ["1", "2"],
+        ["3"],
+        ["2"],
+    ]
@@ -22,3 +22,29 @@ def test_idempotence_dumps_loads(running_app, minimal_record):
     draft = RDMDraft.create(minimal_record)
     loaded_draft = RDMDraft.loads(draft.dumps())
     assert dict(draft) == dict(loaded_draft)
+
+
+def test_has_draft(running_app, db, minimal_record, mocker):
+    """Test the memoized and prefetched has_draft check."""
+    draft = RDMDraft.create(minimal_record)
+    draft.commit()
+    db.session.commit()
+    record = RDMRecord.publish(draft)
+    record.commit()
+    db.session.commit()
+
+    get_draft = mocker.spy(RDMDraft, "get_record")
+
+    # The check is done only once per record instance
+    record = RDMRecord.get_record(record.id)
+    assert record.has_draft is True
+    assert record.has_draft is True
+    assert get_draft.call_count == 1
+
+    # Prefetched for several records at once
+    draft.delete()
+    db.session.commit()
+    records = [RDMRecord.get_record(record.id), RDMRecord.get_record(record.id)]
+    RDMRecord.has_draft.prefetch(records)
+    assert [r.has_draft for r in records] == [False, False]
+    assert get_draft.call_count == 1
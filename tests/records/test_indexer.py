@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the RDM record indexer."""
+
+from contextlib import nullcontext
+from unittest.mock import Mock
+
+from invenio_indexer.api import RecordIndexer
+
+from invenio_rdm_records.records.indexer import RDMRecordIndexer, build_index_action
+
+
+def test_index_action_uses_chunk_records(base_app, mocker):
+    """Test that the records loaded with a chunk are only used by its indexer."""
+    record_cls = Mock()
+    indexer = RDMRecordIndexer(record_cls=record_cls)
+    other = RDMRecordIndexer(record_cls=record_cls)
+    loaded = Mock(id="a")
+    mocker.patch.object(RDMRecordIndexer, "_load_chunk", return_value={"a": loaded})
+    mocker.patch.object(RDMRecordIndexer, "prefetch", return_value=nullcontext())
+    index_action = mocker.patch.object(RDMRecordIndexer, "index_action")
+
+    with base_app.app_context():
+        with indexer._prefetched_chunk([]):
+            indexer._index_action({"id": "a"})
+            index_action.assert_called_once_with(loaded)
+            record_cls.get_record.assert_not_called()
+
+            other._index_action({"id": "a"})
+            record_cls.get_record.assert_called_once_with("a")
+
+        # outside of the chunk, the records are loaded one by one
+        indexer._index_action({"id": "a"})
+        assert record_cls.get_record.call_count == 2
+
+
+def test_build_index_action(base_app, mocker):
+    """Test the bulk index action of a record, with a plain record indexer."""
+    indexer = RecordIndexer(record_cls=Mock())
+    mocker.patch.object(indexer, "record_to_index", return_value="records")
+    mocker.patch.object(indexer, "_prepare_record", return_value={"id": "a"})
+    record = Mock(id="a", revision_id=3)
+
+    with base_app.app_context():
+        action = build_index_action(indexer, record, index="records-new")
+
+    assert action == {
+        "_op_type": "index",
+        "_index": "records-new",
+        "_id": "a",
+        "_version": 3,
+        "_version_type": indexer._version_type,
+        "_source": {"id": "a"},
+    }
@@ -5,6 +5,7 @@ from invenio_access.permissions import system_identity
 from invenio_db import db
 
 from invenio_rdm_records.proxies import current_rdm_records_service as records_service
+from invenio_rdm_records.proxies import current_rdm_records_storage_service
 from invenio_rdm_records.records.models import RDMRecordQuota, RDMUserQuota
 
 
@@ -81,3 +82,42 @@ def test_record_quota(app, identity_simple, minimal_record, location, resource_t
     draft = records_service.new_version(identity_simple, draft.pid.pid_value)._obj
     assert draft.bucket.quota_size == 1337
     assert draft.bucket.max_file_size == 420
+
+
+def test_user_storage_usage(
+    app, identity_simple, minimal_record, location, resource_type_v
+):
+    """Test the storage usage report, aggregated from the database."""
+    storage_service = current_rdm_records_storage_service
+    default_quota = storage_service.default_quota(identity_simple.id)
+
+    draft = records_service.create(identity_simple, minimal_record)._obj
+    # drafts without additional quota are not reported
+    usage = storage_service.get_user_storage_usage(identity_simple.id)
+    assert usage["entries"] == []
+    assert usage["total_extra"] == 0
+
+    records_service.set_quota(
+        system_identity,
+        draft.pid.pid_value,
+        {"quota_size": default_quota + 1000, "max_file_size": 420},
+    )
+    usage = storage_service.get_user_storage_usage(identity_simple.id)
+    assert usage["total_extra"] == 1000
+    assert usage["total_used"] == 0
+    assert [(e["id"], e["is_published"]) for e in usage["entries"]] == [
+        (draft.pid.pid_value, False)
+    ]
+    assert usage["entries"][0]["title"] == minimal_record["metadata"]["title"]
+
+    records_service.publish(identity_simple, draft.pid.pid_value)
+    usage = storage_service.get_user_storage_usage(identity_simple.id)
+    assert [(e["id"], e["is_published"]) for e in usage["entries"]] == [
+        (draft.pid.pid_value, True)
+    ]
+    assert (
+        storage_service.get_user_storage_usage(
+            identity_simple.id, include_drafts=False
+        )["entries"]
+        == usage["entries"]
+    )
@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the bulk fetching of record statistics."""
+
+import unittest.mock
+
+from invenio_search.engine import dsl
+
+from invenio_rdm_records.records import RDMRecord
+from invenio_rdm_records.records.stats import Statistics
+
+
+class FakeQuery:
+    """Statistics query returning the position of its search as metric values."""
+
+    def __init__(self, name):
+        """Constructor."""
+        self.name = name
+        self.client = None
+
+    def build_query(self, start_date, end_date, **kwargs):
+        """Build the search query."""
+        return dsl.Search(index=self.name).filter("term", **kwargs)
+
+    def process_query_result(self, query_result, start_date, end_date):
+        """Build the result using the query result."""
+        value = query_result["value"]
+        return {
+            "views": value,
+            "unique_views": value,
+            "downloads": value,
+            "unique_downloads": value,
+            "data_volume": value,
+        }
+
+
+def fake_execute(multi_search, raise_on_error=True):
+    """Return the index of each search as its result, and fail the second one."""
+    return [
+        None if i == 1 else unittest.mock.Mock(to_dict=lambda i=i: {"value": i})
+        for i, _ in enumerate(multi_search._searches)
+    ]
+
+
+@unittest.mock.patch.object(dsl.MultiSearch, "execute", fake_execute)
+@unittest.mock.patch.object(Statistics, "_get_query", FakeQuery)
+def test_get_records_stats_single_multi_search():
+    stats = Statistics.get_records_stats([("a", "p"), ("b", "p")])
+
+    # searches: views(a, b), downloads(a, b), views-all(p), downloads-all(p)
+    assert stats["a"]["this_version"]["views"] == 0
+    assert stats["a"]["this_version"]["downloads"] == 2
+    # a failed search falls back to zero
+    assert stats["b"]["this_version"]["views"] == 0
+    assert stats["b"]["this_version"]["downloads"] == 3
+    # the parent's statistics are fetched once and shared by its versions
+    assert stats["a"]["all_versions"] == stats["b"]["all_versions"]
+    assert stats["a"]["all_versions"]["views"] == 4
+    assert stats["a"]["all_versions"]["downloads"] == 5
+
+
+@unittest.mock.patch.object(dsl.MultiSearch, "execute", fake_execute)
+@unittest.mock.patch.object(Statistics, "_get_query", FakeQuery)
+def test_prefetched_record_stats():
+    with unittest.mock.patch.object(Statistics, "get_record_stats") as get_stats:
+        with Statistics.prefetch([("a", "p")]):
+            stats = Statistics.get_prefetched_record_stats("a", "p")
+            assert stats["all_versions"]["views"] == 2
+            assert not get_stats.called
+
+        # outside of the context, the statistics are fetched per record again
+        Statistics.get_prefetched_record_stats("a", "p")
+        get_stats.assert_called_once_with(recid="a", parent_recid="p")
+
+
+def test_get_records_stats_empty():
+    assert Statistics.get_records_stats([]) == {}
+
+
+class FakeRecord(dict):
+    """Record with the attributes used by the statistics system field."""
+
+    index = unittest.mock.Mock(_name="rdmrecords-records")
+
+    def __init__(self, id_, parent_id, **kwargs):
+        """Constructor."""
+        super().__init__(id=id_, **kwargs)
+        self.id = id_
+        self.parent = {"id": parent_id}
+
+
+def test_stats_field_prefetch(base_app, mocker):
+    search_client = mocker.patch(
+        "invenio_rdm_records.records.systemfields.statistics.current_search_client",
+        new=mocker.Mock(),
+    )
+    cached = FakeRecord("a", "p", stats={"cached": True})
+    indexed = FakeRecord("b", "p")
+    missing = FakeRecord("c", "p")
+    search_client.mget.return_value = {
+        "docs": [
+            {"_id": "b", "found": True, "_source": {"stats": {"indexed": True}}},
+            {"_id": "c", "found": False},
+        ]
+    }
+
+    with unittest.mock.patch.object(
+        Statistics, "get_records_stats", return_value={"c": {"aggregated": True}}
+    ) as get_records_stats:
+        with base_app.app_context():
+            RDMRecord.stats.prefetch([cached, indexed, missing])
+
+    # one multi-get for the records without stats, one fallback for the rest
+    search_client.mget.assert_called_once()
+    assert search_client.mget.call_args.kwargs["body"] == {"ids": ["b", "c"]}
+    assert list(get_records_stats.call_args.args[0]) == [("c", "p")]
+
+    assert cached["stats"] == {"cached": True}
+    assert indexed["stats"] == {"indexed": True}
+    assert missing["stats"] == {"aggregated": True}
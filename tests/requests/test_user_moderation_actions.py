@@ -15,6 +15,7 @@ from invenio_requests.proxies import (
 )
 
 from invenio_rdm_records.proxies import current_rdm_records_service as records_service
+from invenio_rdm_records.requests.user_moderation.tasks import _process_batches
 
 
 class MockRequestModerationTask(Task):
@@ -134,3 +135,29 @@ def test_is_verified_system_user(running_app, minimal_record):
     parent_dict = record.to_dict()["parent"]
     assert parent_dict["access"]["owned_by"]["user"] == system_identity.id
     assert parent_dict["is_verified"]
+
+
+def test_user_moderation_batches(base_app, monkeypatch):
+    """Test that records are processed in batches, falling back to one by one."""
+    monkeypatch.setitem(base_app.config, "RDM_USER_MODERATION_BATCH_SIZE", 2)
+    processed = []
+
+    def process(record_ids):
+        if "bad" in record_ids:
+            raise ValueError()
+        processed.append(record_ids)
+
+    with base_app.app_context():
+        _process_batches(
+            "1", ["a", "b", "c", "bad", "d"], process, lambda: True, "deleting"
+        )
+    assert processed == [["a", "b"], ["c"], ["d"]]
+
+    # the processing stops as soon as the action doesn't apply anymore
+    processed.clear()
+    still_applies = iter([True, False])
+    with base_app.app_context():
+        _process_batches(
+            "1", ["a", "b", "c"], process, lambda: next(still_applies), "deleting"
+        )
+    assert processed == [["a", "b"]]
@@ -13,7 +13,11 @@ from invenio_rdm_records.resources.serializers import (
     CSLJSONSerializer,
     StringCitationSerializer,
 )
-from invenio_rdm_records.resources.serializers.csl import get_citation_string
+from invenio_rdm_records.resources.serializers.csl import (
+    get_citation_string,
+    get_citation_strings,
+    get_citation_style,
+)
 from invenio_rdm_records.resources.serializers.csl.schema import CSLJSONSchema
 
 
@@ -174,3 +178,52 @@ def test_citation_string_serializer_empty_record(running_app, empty_record):
     serialized_record = serializer.dump(empty_record)
 
     assert serialized_record == expected_data
+
+
+def test_citation_strings_share_cached_style():
+    """Test formatting several records through one cached style."""
+    style = get_style_filepath("harvard-cite-them-right")
+    records = [
+        {
+            "id": f"record-{i}",
+            "type": "article",
+            "title": f"Title {i}",
+            "author": [{"family": "Doe", "given": "Jane"}],
+            "issued": {"date-parts": [[2020]]},
+        }
+        for i in range(3)
+    ]
+
+    get_citation_style.cache_clear()
+    citations = get_citation_strings(
+        [dict(r) for r in records], [r["id"] for r in records], style, "en-US"
+    )
+
+    assert citations == [
+        get_citation_string(dict(r), r["id"], style, "en-US") for r in records
+    ]
+    assert get_citation_style.cache_info().misses == 1
+
+
+def test_citation_strings_numeric_style():
+    """Test that numeric styles don't number the records across a list."""
+    style = get_style_filepath("ieee")
+    records = [
+        {
+            "id": f"record-{i}",
+            "type": "article",
+            "title": f"Title {i}",
+            "author": [{"family": "Doe", "given": "Jane"}],
+            "issued": {"date-parts": [[2020]]},
+        }
+        for i in range(3)
+    ]
+
+    citations = get_citation_strings(
+        [dict(r) for r in records], [r["id"] for r in records], style, "en-US"
+    )
+
+    assert citations == [
+        get_citation_string(dict(r), r["id"], style, "en-US") for r in records
+    ]
+    assert all(citation.startswith("[1]") for citation in citations)
@@ -3,6 +3,8 @@
 
 """Resources serializers tests."""
 
+from lxml import etree
+
 from invenio_rdm_records.resources.serializers import DCATSerializer
 
 
@@ -252,3 +254,18 @@ def test_dcat_serializer(running_app, full_record_to_dict):
     serializer = DCATSerializer()
     serialized_record = serializer.serialize_object(full_record_to_dict)
     assert serialized_record == expected_data
+
+
+def test_dcat_serializer_dump_etree(running_app, full_record_to_dict):
+    serializer = DCATSerializer()
+    parser = etree.XMLParser(remove_blank_text=True)
+
+    def normalize(xml):
+        return etree.tostring(etree.fromstring(xml, parser))
+
+    dumped_etree = serializer.dump_etree(full_record_to_dict)
+    serialized_record = serializer.serialize_object(full_record_to_dict)
+
+    assert normalize(etree.tostring(dumped_etree)) == normalize(
+        serialized_record.encode("utf-8")
+    )
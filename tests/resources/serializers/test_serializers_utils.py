@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Serializers helpers tests."""
+
+import unittest.mock
+
+import pytest
+
+from invenio_rdm_records.resources.serializers.errors import (
+    VocabularyItemNotFoundError,
+)
+from invenio_rdm_records.resources.serializers.utils import (
+    VocabularyPropsIndex,
+    get_vocabulary_props,
+    vocabulary_props_index,
+)
+
+
+def fake_read_all(identity, fields, type, extra_filter=None, **kwargs):
+    """Return the entries of a fake vocabulary."""
+    hits = [
+        {"id": "image", "props": {"datacite_general": "Image"}},
+        {"id": "dataset", "props": {"datacite_general": "Dataset"}},
+    ]
+    if extra_filter is not None:
+        ids = extra_filter.to_dict()["terms"]["id"]
+        hits = [h for h in hits if h["id"] in ids]
+    return unittest.mock.Mock(total=len(hits), hits=hits)
+
+
+def test_vocabulary_props_index(base_app, mocker):
+    vocabulary_service = mocker.patch(
+        "invenio_rdm_records.resources.serializers.utils.vocabulary_service",
+        new=mocker.Mock(),
+    )
+    read_all = vocabulary_service.read_all
+    read_all.side_effect = fake_read_all
+    index = VocabularyPropsIndex()
+    fields = ["props.datacite_general"]
+
+    with base_app.app_context():
+        props = index.get_many("resourcetypes", fields, ["image", "dataset"])
+        assert props == {
+            "image": {"datacite_general": "Image"},
+            "dataset": {"datacite_general": "Dataset"},
+        }
+        assert index.get_many("resourcetypes", fields, ["image"]) == {
+            "image": {"datacite_general": "Image"}
+        }
+        # the whole vocabulary was loaded once
+        assert read_all.call_count == 1
+
+        # unknown entries are searched for
+        assert index.get_many("resourcetypes", fields, ["unknown"]) == {}
+        assert read_all.call_count == 2
+
+        index.invalidate("resourcetypes")
+        index.get_many("resourcetypes", fields, ["image"])
+        assert read_all.call_count == 3
+
+
+def test_vocabulary_props_index_big_vocabulary(base_app, mocker, monkeypatch):
+    vocabulary_service = mocker.patch(
+        "invenio_rdm_records.resources.serializers.utils.vocabulary_service",
+        new=mocker.Mock(),
+    )
+    read_all = vocabulary_service.read_all
+    read_all.side_effect = fake_read_all
+    monkeypatch.setitem(base_app.config, "RDM_VOCABULARY_PROPS_INDEX_MAX_SIZE", 1)
+    vocabulary_props_index.invalidate()
+
+    with base_app.app_context():
+        props = get_vocabulary_props("resourcetypes", ["props.datacite"], "image")
+        assert props == {"datacite_general": "Image"}
+        # the vocabulary is too big to be indexed, entries are searched for
+        assert read_all.call_count == 2
+        with pytest.raises(VocabularyItemNotFoundError):
+            get_vocabulary_props("resourcetypes", ["props.datacite"], "unknown")
+    vocabulary_props_index.invalidate()
@@ -357,6 +357,41 @@ def test_publish_draft(
     _validate_access(response.json, minimal_record)
 
 
+def test_read_record_not_modified(
+    running_app, client_with_login, minimal_record, headers, search_clear
+):
+    """Test conditional reads of a record."""
+    client = client_with_login
+    minimal_record["access"]["record"] = "restricted"
+    recid = _create_and_publish(client, minimal_record, headers)
+
+    response = client.get(f"/records/{recid}", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    # Unmodified record
+    response = client.get(
+        f"/records/{recid}", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.data == b""
+
+    # Other revision
+    response = client.get(
+        f"/records/{recid}", headers={**headers, "If-None-Match": '"999"'}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+
+    # The read permission is still checked
+    logout_user(client)
+    response = client.get(
+        f"/records/{recid}", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 403
+
+
 def test_publish_draft_w_dates(
     running_app, client_with_login, minimal_record, headers, search_clear
 ):
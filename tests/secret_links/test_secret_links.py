@@ -8,7 +8,11 @@ from datetime import datetime, timedelta, timezone
 
 from invenio_db import db
 
-from invenio_rdm_records.secret_links.models import SecretLink
+from invenio_rdm_records.secret_links.models import SecretLink, _load_token
+from invenio_rdm_records.secret_links.serializers import (
+    SecretLinkSerializer,
+    TimedSecretLinkSerializer,
+)
 
 
 def test_secret_link_creation(app):
@@ -111,3 +115,45 @@ def test_secret_link_validate_token_expired(app):
         db.session.commit()
 
         assert not link.validate_token(link.token, expected_data={})
+
+
+def test_secret_link_load_token(base_app):
+    """Check load_token for the supported algorithms and token types."""
+    with base_app.app_context():
+        in_10_mins = datetime.now(timezone.utc) + timedelta(minutes=10)
+        _10_mins_ago = datetime.now(timezone.utc) - timedelta(minutes=10)
+        for algorithm in ("HS256", "HS512"):
+            for serializer in (
+                SecretLinkSerializer(algorithm_name=algorithm),
+                TimedSecretLinkSerializer(
+                    expires_at=in_10_mins, algorithm_name=algorithm
+                ),
+            ):
+                token = serializer.create_token("someid", {"hello": "world"})
+                data = SecretLink.load_token(token)
+                assert data == {"id": "someid", "data": {"hello": "world"}}
+                assert SecretLink.load_token(token, {"hello": "world"}) == data
+                assert SecretLink.load_token(token, {"hello": "you"}) is None
+                assert SecretLink.load_token(token[:-1]) is None
+
+        expired = TimedSecretLinkSerializer(expires_at=_10_mins_ago).create_token(
+            "someid", {"hello": "world"}
+        )
+        assert SecretLink.load_token(expired) is None
+        assert SecretLink.load_token(expired, force=True)["id"] == "someid"
+
+        unsupported = SecretLinkSerializer(algorithm_name="none").create_token("someid")
+        assert SecretLink.load_token(unsupported) is None
+        assert SecretLink.load_token("asdf") is None
+
+
+def test_secret_link_load_token_cached(base_app):
+    """Check that recently loaded tokens are not validated again."""
+    with base_app.app_context():
+        token = SecretLinkSerializer().create_token("someid")
+        _load_token.cache_clear()
+
+        data = SecretLink.load_token(token)
+        data["id"] = "changed"
+        assert SecretLink.load_token(token)["id"] == "someid"
+        assert _load_token.cache_info().hits == 1
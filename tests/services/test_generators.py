@@ -28,9 +28,11 @@ from invenio_rdm_records.records.api import RDMDraft
 from invenio_rdm_records.records.systemfields.draft_status import DraftStatus
 from invenio_rdm_records.requests.community_submission import CommunitySubmission
 from invenio_rdm_records.services.generators import (
+    AccessGrant,
     IfRestricted,
     RecordOwners,
     RequestReviewers,
+    generators_memo_stats,
 )
 
 
@@ -152,6 +154,36 @@ def test_record_owner(app, mocker):
     assert query_filter.to_dict() == expected_query_filter
 
 
+def test_generators_memoized_per_request(base_app, mocker):
+    generator = AccessGrant("view")
+    record = mocker.Mock(id="abcd", revision_id=1)
+    record.parent.id = "efgh"
+    record.parent.revision_id = 1
+    grants_needs = record.parent.access.grants.needs
+    grants_needs.return_value = [UserNeed(1)]
+
+    with base_app.test_request_context():
+        assert generator.needs(record=record) == [UserNeed(1)]
+        assert generator.needs(record=record) == [UserNeed(1)]
+        assert grants_needs.call_count == 1
+        assert generators_memo_stats() == {"hits": 1, "misses": 1}
+
+        # a new revision of the parent is evaluated again
+        record.parent.revision_id = 2
+        generator.needs(record=record)
+        assert grants_needs.call_count == 2
+
+        # a parent with changes not yet flushed is evaluated each time
+        record.parent.model = RDMParent.model_cls()
+        generator.needs(record=record)
+        generator.needs(record=record)
+        assert grants_needs.call_count == 4
+
+    # outside of requests, the needs are not memoized
+    generator.needs(record=record)
+    assert grants_needs.call_count == 5
+
+
 def test_request_reviewers(
     draft_for_open_review, open_review_community, service, users
 ):
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""IIIF derivatives cache tests."""
+
+import os
+
+from invenio_rdm_records.services.iiif import IIIFService
+from invenio_rdm_records.services.iiif import service as iiif_service
+from invenio_rdm_records.services.iiif.cache import LocalDerivativesCache
+
+
+def test_local_derivatives_cache(base_app, tmp_path):
+    cache = LocalDerivativesCache(base_path=str(tmp_path), max_size=25)
+    key = cache.make_key("md5:abcd", "full", "full", "0", "default", "png")
+    assert key != cache.make_key("md5:abcd", "full", "full", "0", "default", "jpg")
+
+    with base_app.app_context():
+        assert cache.get(key) is None
+        cache.set(key, b"0123456789")
+        assert cache.get(key) == b"0123456789"
+
+        # mark the first derivative as the least recently used one
+        cache.set("aa01", b"0123456789")
+        os.utime(cache._get_file_path(key), (0, 0))
+        cache.set("aa02", b"0123456789")
+
+        # the cache exceeded its max size, so the LRU derivative was evicted
+        assert cache.get(key) is None
+        assert cache.get("aa01") == b"0123456789"
+        assert cache.get("aa02") == b"0123456789"
+
+
+def test_open_image_caches_first_page(base_app, tmp_path, mocker):
+    mocker.patch.object(iiif_service, "import_pyvips", return_value=None)
+    wand_image = mocker.MagicMock()
+    mocker.patch.object(iiif_service, "import_wand_image", return_value=wand_image)
+    converted = wand_image.return_value.convert.return_value.__enter__.return_value
+    converted.save.side_effect = lambda file: file.write(b"first page")
+
+    service = IIIFService(config=None, records_service=None)
+    service.derivatives_cache = LocalDerivativesCache(base_path=str(tmp_path))
+    file_ = mocker.Mock(data={"mimetype": "application/pdf", "checksum": "md5:abcd"})
+
+    with base_app.app_context():
+        assert service._open_image(file_).read() == b"first page"
+        # the second time, the rasterized page is read from the cache
+        with service._open_image(file_) as fp:
+            assert fp.read() == b"first page"
+
+    wand_image.assert_called_once()
+    file_.get_stream.assert_called_once()
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""IIIF tiles generation tests."""
+
+from io import BytesIO
+
+import pytest
+
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records import RDMRecord
+from invenio_rdm_records.services.iiif.converter import ImageConverter
+from invenio_rdm_records.services.iiif.storage import LocalTilesStorage, tiles_storage
+from invenio_rdm_records.services.iiif.tasks import generate_record_tiles
+
+
+class FakeConverter(ImageConverter):
+    """Converter copying its input, and failing for empty ones."""
+
+    def convert(self, in_stream, out_stream):
+        """Copy the input stream."""
+        data = in_stream.read()
+        with out_stream:
+            out_stream.write(data)
+        return bool(data)
+
+
+@pytest.fixture()
+def tiles_record(
+    running_app, minimal_record, superuser_identity, set_app_config_fn_scoped, mocker
+):
+    """Create a published record with image files, with its tiles not generated."""
+    set_app_config_fn_scoped(
+        {"IIIF_TILES_GENERATION_ENABLED": True, "IIIF_TILES_BATCH_SIZE": 2}
+    )
+    # only initialize the tiles of the files when publishing
+    mocker.patch("invenio_rdm_records.records.processors.tiles.generate_record_tiles")
+
+    def _create(files):
+        service = current_rdm_records_service
+        minimal_record["files"] = {"enabled": True}
+        draft = service.create(superuser_identity, minimal_record)
+        service.draft_files.init_files(
+            superuser_identity, draft.id, data=[{"key": key} for key in files]
+        )
+        for key, data in files.items():
+            service.draft_files.set_file_content(
+                superuser_identity, draft.id, key, BytesIO(data)
+            )
+            service.draft_files.commit_file(superuser_identity, draft.id, key)
+        return service.publish(superuser_identity, draft.id)._record
+
+    return _create
+
+
+def test_save_many(tiles_record, tmp_path):
+    storage = LocalTilesStorage(base_path=str(tmp_path), converter=FakeConverter())
+    record = tiles_record({"a.png": b"a", "b.png": b"b", "empty.png": b""})
+
+    results = dict(
+        storage.save_many(
+            record,
+            [
+                ("a.png", "files"),
+                ("missing.png", "files"),
+                ("b.png", "files"),
+                ("empty.png", "files"),
+            ],
+            max_workers=2,
+        )
+    )
+    # files which can't be read only fail their own conversion
+    assert results == {
+        "a.png": True,
+        "missing.png": False,
+        "b.png": True,
+        "empty.png": False,
+    }
+    with storage.open(record, "b.png") as fp:
+        assert fp.read() == b"b"
+
+
+def test_generate_record_tiles(tiles_record, mocker):
+    record = tiles_record({"a.png": b"a", "b.png": b"b", "c.png": b"c"})
+    files = [("a.png", "files"), ("b.png", "files"), ("c.png", "files")]
+
+    def _status(key):
+        """Get the committed status of the tiles of a file."""
+        media_files = RDMRecord.pid.resolve(record.pid.pid_value).media_files
+        return media_files[f"{key}.ptif"].processor
+
+    batches = []
+
+    def save_many(_record, batch, max_workers):
+        batches.append({key: _status(key)["status"] for key, _ in batch})
+        if len(batches) == 2:
+            raise OSError("Conversion crashed.")
+        yield "a.png", True
+        yield "b.png", False
+
+    mocker.patch.object(tiles_storage, "save_many", side_effect=save_many)
+
+    with pytest.raises(OSError):
+        generate_record_tiles(record["id"], files)
+
+    # the files of each batch are committed as processing before converting them
+    assert batches == [
+        {"a.png": "processing", "b.png": "processing"},
+        {"c.png": "processing"},
+    ]
+    assert _status("a.png")["status"] == "finished"
+    assert _status("a.png")["props"]["progress"] == {"done": 1, "total": 3}
+    assert _status("b.png")["status"] == "failed"
+    assert _status("b.png")["props"]["progress"] == {"done": 2, "total": 3}
+    # the files left without a result are not left as processing
+    assert _status("c.png")["status"] == "failed"
+    assert "progress" not in _status("c.png")["props"]
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the links expanded from precompiled URL templates."""
+
+import pytest
+from invenio_base import invenio_url_for
+from werkzeug.routing import BuildError
+
+from invenio_rdm_records.services.links import url_for_template
+
+
+@pytest.mark.parametrize(
+    "endpoint,values",
+    [
+        ("records.read", {"pid_value": "abcd-1234"}),
+        ("records.read_draft", {"pid_value": "abcd-1234"}),
+        (
+            "record_files.read_content",
+            {"pid_value": "abcd-1234", "key": "a dir/ü ?#%+.txt"},
+        ),
+        ("invenio_app_rdm_records.record_detail", {"pid_value": "x", "preview": 1}),
+        (
+            "iiif.image_api",
+            {
+                "uuid": "record:abcd-1234:image 1.png",
+                "region": "full",
+                "size": "^200,",
+                "rotation": "0",
+                "quality": "default",
+                "image_format": "jpg",
+            },
+        ),
+        ("record_requests.search", {"record_pid": "abcd-1234", "q": "a&b c"}),
+    ],
+)
+def test_url_for_template(base_app, endpoint, values):
+    """Assert that the URLs from templates are the same as built by werkzeug."""
+    with base_app.test_request_context():
+        expected = invenio_url_for(endpoint, **values)
+        # once to compile the template, once to expand it
+        assert url_for_template(endpoint, **values) == expected
+        assert url_for_template(endpoint, **values) == expected
+        assert url_for_template(endpoint, anchor="a b", **values) == invenio_url_for(
+            endpoint, _anchor="a b", **values
+        )
+
+
+def test_url_for_template_fallback(base_app):
+    """Assert that URLs which cannot be built from a template are still built."""
+    with base_app.test_request_context():
+        values = {"pid_value": "abcd-1234", "type": ["a", "b"]}
+        assert url_for_template("records.read", **values) == invenio_url_for(
+            "records.read", **values
+        )
+        # drafts without a PID value
+        with pytest.raises(BuildError):
+            url_for_template("records.read", pid_value=None)
@@ -112,3 +112,23 @@ def test_rebuild_index(running_app, search_clear, minimal_oai_set):
     assert oai_hit["_source"] == {
         "query": {"query_string": {"query": "is_published:true"}}
     }
+
+
+def test_oai_projection(running_app, search_clear, minimal_record, anyuser_identity):
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records_service
+
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    source = record._record.dumps()
+
+    item = service.oai_result_item(anyuser_identity, source).to_dict()
+    projection = service.oai_projection(anyuser_identity, source)
+
+    # the projection only holds the fields and links used by the formats
+    assert set(projection) <= {*service.config.oai_fields, "links"}
+    assert set(projection["links"]) <= set(service.config.oai_links)
+    for field in service.config.oai_fields:
+        assert projection.get(field) == item.get(field)
+    for name, link in projection["links"].items():
+        assert link == item["links"][name]
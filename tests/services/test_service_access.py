@@ -5,6 +5,7 @@
 
 import pytest
 from invenio_records_resources.services.errors import PermissionDeniedError
+from marshmallow import ValidationError
 
 from invenio_rdm_records.proxies import current_rdm_records
 from invenio_rdm_records.services.errors import GrantExistsError
@@ -208,6 +209,62 @@ def test_create_multiple_grants_one_exists(running_app, minimal_record, users):
     }
 
 
+def test_create_grants_in_bulk(running_app, minimal_record, users, roles, mocker):
+    """Test creating grants for several subject types, with one notification task."""
+    broadcast = mocker.patch(
+        "invenio_rdm_records.services.access.uow.broadcast_notifications"
+    )
+    superuser_identity = running_app.superuser_identity
+    records_service = current_rdm_records.records_service
+    draft = records_service.create(superuser_identity, minimal_record)
+    record = records_service.publish(superuser_identity, draft.id)
+
+    access_service = records_service.access
+    grants_payload = {
+        "grants": [
+            {
+                "subject": {"type": "user", "id": str(user.id)},
+                "permission": "preview",
+                "notify": True,
+            }
+            for user in users[:2]
+        ]
+        + [{"subject": {"type": "role", "id": roles[0].id}, "permission": "view"}]
+    }
+    grants = access_service.bulk_create_grants(
+        superuser_identity, record.id, grants_payload
+    )
+
+    assert grants.to_dict()["hits"]["total"] == 3
+    broadcast.delay.assert_called_once()
+    assert len(broadcast.delay.call_args.args[0]) == 2
+
+    # unknown subjects are rejected, without creating any of the grants
+    with pytest.raises(ValidationError):
+        access_service.bulk_create_grants(
+            superuser_identity,
+            record.id,
+            {
+                "grants": [
+                    {"subject": {"type": "user", "id": "999999"}, "permission": "view"}
+                ]
+            },
+        )
+
+    # the same subject can't be given twice in a payload
+    with pytest.raises(GrantExistsError):
+        access_service.bulk_create_grants(
+            superuser_identity,
+            record.id,
+            {
+                "grants": [
+                    {"subject": {"type": "role", "id": roles[1].id}, "permission": p}
+                    for p in ("view", "preview")
+                ]
+            },
+        )
+
+
 def test_read_grant_by_subjectid_found(running_app, minimal_record, users):
     """Test read grant by user id."""
     # create record
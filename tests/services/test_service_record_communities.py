@@ -13,6 +13,7 @@ from invenio_rdm_records.proxies import (
     current_rdm_records_service,
     current_record_communities_service,
 )
+from invenio_rdm_records.services.tasks import bulk_add_to_community
 
 
 def test_bulk_add_non_authorized_permission(community, uploader, record_factory):
@@ -68,6 +69,67 @@ def test_bulk_add_already_in_community(community, uploader, record_factory):
     ]
 
 
+def test_bulk_add_in_chunks(
+    community, uploader, record_factory, set_app_config_fn_scoped
+):
+    """Test bulk add over several chunks, with an already included record."""
+    set_app_config_fn_scoped({"RDM_RECORD_COMMUNITIES_BULK_ADD_CHUNK_SIZE": 2})
+    included = record_factory.create_record(uploader=uploader, community=community)
+    recs = [
+        record_factory.create_record(uploader=uploader, community=None)
+        for _ in range(3)
+    ]
+
+    errors = current_record_communities_service.bulk_add(
+        system_identity,
+        str(community.id),
+        [recs[0]["id"], included["id"], recs[1]["id"], recs[2]["id"]],
+    )
+
+    assert [e["record_id"] for e in errors] == [included["id"]]
+    for rec in recs:
+        _rec = current_rdm_records_service.record_cls.pid.resolve(rec["id"])
+        assert community.id in _rec.parent.communities.ids
+        assert str(_rec.parent.communities.default.id) == community.id
+
+    # unknown records are reported without failing the other records
+    rec = record_factory.create_record(uploader=uploader, community=None)
+    errors = current_record_communities_service.bulk_add(
+        system_identity, str(community.id), ["does-not-exist", rec["id"]]
+    )
+    assert errors == [
+        {
+            "record_id": "does-not-exist",
+            "community_id": str(community.id),
+            "message": "The record does not exist.",
+        }
+    ]
+    _rec = current_rdm_records_service.record_cls.pid.resolve(rec["id"])
+    assert community.id in _rec.parent.communities.ids
+
+
+def test_bulk_add_to_community_task(
+    community, uploader, record_factory, set_app_config_fn_scoped, mocker
+):
+    """Test that the bulk add task commits the records chunk by chunk."""
+    set_app_config_fn_scoped({"RDM_RECORD_COMMUNITIES_BULK_ADD_CHUNK_SIZE": 2})
+    recs = [
+        record_factory.create_record(uploader=uploader, community=None)
+        for _ in range(3)
+    ]
+    bulk_add = mocker.spy(current_record_communities_service, "bulk_add")
+
+    bulk_add_to_community(str(community.id), [rec["id"] for rec in recs])
+
+    assert [c.args[2] for c in bulk_add.call_args_list] == [
+        [recs[0]["id"], recs[1]["id"]],
+        [recs[2]["id"]],
+    ]
+    for rec in recs:
+        _rec = current_rdm_records_service.record_cls.pid.resolve(rec["id"])
+        assert community.id in _rec.parent.communities.ids
+
+
 def test_add_community_component_called(
     community, uploader, community_owner, record_factory, set_app_config_fn_scoped
 ):
@@ -3,11 +3,23 @@
 
 """Service tasks tests."""
 
+from copy import deepcopy
+
 import pytest
+from invenio_access.permissions import system_identity
 
 from invenio_rdm_records.proxies import current_rdm_records
-from invenio_rdm_records.records.api import RDMDraft
-from invenio_rdm_records.services.tasks import update_expired_embargos
+from invenio_rdm_records.records.api import RDMDraft, RDMRecord
+from invenio_rdm_records.services.reindex import (
+    create_rebuild_index,
+    get_partitions,
+    swap_index,
+)
+from invenio_rdm_records.services.tasks import (
+    reindex_partition,
+    reindex_stats,
+    update_expired_embargos,
+)
 
 
 def test_embargo_lift_without_draft(embargoed_files_record, running_app, search_clear):
@@ -76,3 +88,70 @@ def test_embargo_lift_with_updated_draft(
     assert draft_lifted.access.embargo.active is False
     assert draft_lifted.access.protection.files == "restricted"
     assert draft_lifted.access.protection.record == "public"
+
+
+def test_reindex_stats_chunks_and_checkpoints(base_app, mocker):
+    events = [
+        mocker.Mock(parent_recid=parent, updated_timestamp=f"2026-01-0{i + 1}")
+        for i, parent in enumerate(["a", "b", "a", "c", "d"])
+    ]
+    mocker.patch(
+        "invenio_rdm_records.services.tasks.dsl.Search.scan", return_value=events
+    )
+    bookmark_api = mocker.patch("invenio_rdm_records.services.tasks.BookmarkAPI")
+    bookmark_api.return_value.get_bookmark.return_value = None
+    reindex_parents = mocker.patch(
+        "invenio_rdm_records.services.tasks._reindex_stats_parents"
+    )
+
+    with base_app.app_context():
+        result = reindex_stats(("stats-record-view",), chunk_size=2)
+
+    # parents are deduplicated within a chunk
+    reindexed = [c.args[0] for c in reindex_parents.call_args_list]
+    assert [sorted(parents) for parents in reindexed] == [
+        ["a", "b"],
+        ["a", "c"],
+        ["d"],
+    ]
+    assert result == "5 parents reindexed in 3 chunks (counted once per chunk)"
+
+    # the bookmark moves forward after each full chunk, and at the end of the run
+    bookmarks = [
+        c.args[0] for c in bookmark_api.return_value.set_bookmark.call_args_list
+    ]
+    assert bookmarks[:2] == ["2026-01-02", "2026-01-04"]
+    assert len(bookmarks) == 3
+
+    # the bookmark doesn't move past a chunk which failed to be reindexed
+    bookmark_api.return_value.set_bookmark.reset_mock()
+    reindex_parents.side_effect = [None, Exception("failed")]
+    with base_app.app_context():
+        with pytest.raises(Exception, match="failed"):
+            reindex_stats(("stats-record-view",), chunk_size=2)
+    bookmarks = [
+        c.args[0] for c in bookmark_api.return_value.set_bookmark.call_args_list
+    ]
+    assert bookmarks == ["2026-01-02"]
+
+
+def test_reindex_partitions(running_app, search_clear, minimal_record):
+    service = current_rdm_records.records_service
+    for _ in range(3):
+        draft = service.create(system_identity, deepcopy(minimal_record))
+        service.publish(system_identity, draft.id)
+
+    partitions = get_partitions("records", 2)
+    assert len(partitions) == 2
+    assert partitions[-1][1] is None
+
+    index = create_rebuild_index("records")
+    indexed = [reindex_partition("records", *p, index=index) for p in partitions]
+    assert indexed == [(2, 0), (1, 0)]
+
+    swap_index("records", index)
+    RDMRecord.index.refresh()
+    assert service.search(system_identity).total == 3
+    # swapping again is a no-op
+    swap_index("records", index)
+    assert service.search(system_identity).total == 3
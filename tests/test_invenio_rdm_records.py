@@ -5,6 +5,9 @@
 """Module tests."""
 
 from invenio_base import invenio_url_for
+from invenio_records_resources.proxies import current_service_registry
+
+from invenio_rdm_records.services import RDMRecordService
 
 
 def test_version():
@@ -32,3 +35,18 @@ def test_link_generation(running_app):
     assert "https://127.0.0.1:5000/api/records/12345-abcde" == invenio_url_for(
         "records.read", pid_value="12345-abcde"
     )
+
+
+def test_lazy_services(base_app):
+    """Test that services are built on first access, and registered lazily."""
+    ext = base_app.extensions["invenio-rdm-records"]
+    ext.init_services(base_app)
+    assert "records_service" not in ext.__dict__
+
+    with base_app.app_context():
+        service = current_service_registry.get("records")
+        assert isinstance(service, RDMRecordService)
+        assert ext.__dict__["records_service"] is ext.records_service
+        assert current_service_registry.get_service_id(ext.records_service) == (
+            "records"
+        )